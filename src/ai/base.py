@@ -1,3 +1,4 @@
+import re
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -5,6 +6,11 @@ from src.models.results import SummaryResult
 
 class AISummarizer(ABC):
 
+    MIN_SENTENCES = 3
+    MAX_SENTENCES = 7
+
+    SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
     @abstractmethod
     def summarize(self, text: str, language: str) -> SummaryResult:
         pass
@@ -17,19 +23,31 @@ class AISummarizer(ABC):
         lang_instruction = "на русском языке" if language == "ru" else "in English"
 
         return f"""Создай краткое резюме следующего текста {lang_instruction}.
-Резюме должно содержать от 3 до 7 предложений.
+Резюме должно содержать от {self.MIN_SENTENCES} до {self.MAX_SENTENCES} предложений.
 Резюме должно точно отражать основные темы и ключевые моменты документа.
 
 Текст:
 {text}
 
+Ответ должен содержать РОВНО от {self.MIN_SENTENCES} до {self.MAX_SENTENCES} предложений, каждое завершённое знаком . ! или ?
 Резюме:"""
 
-    def _count_sentences(self, text: str) -> int:
+    def _split_sentences(self, text: str) -> list[str]:
         if not text or not text.strip():
+            return []
+
+        sentences = self.SENTENCE_SPLIT_PATTERN.split(text.strip())
+        return [s for s in sentences if s.strip()]
+
+    def _count_sentences(self, text: str) -> int:
+        if not text:
+            return 0
+
+        stripped = text.strip()
+        if not stripped:
             return 0
 
-        import re
-        sentences = re.split(r'(?<=[.!?])\s+', text.strip())
-        sentences = [s for s in sentences if s.strip()]
-        return len(sentences)
+        return 1 + sum(1 for _ in self.SENTENCE_SPLIT_PATTERN.finditer(stripped))
+
+    def _trim_summary(self, text: str, max_sentences: int) -> str:
+        return " ".join(self._split_sentences(text)[:max_sentences])
@@ -1,21 +1,31 @@
-from typing import Optional
-
-import yake
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 from src.ai.language_detector import LanguageDetector
 from src.models.enums import ErrorScenario
 from src.models.results import KeywordsResult
 
+if TYPE_CHECKING:
+    import yake
+
 class KeywordExtractor:
 
     MIN_KEYWORDS = 5
     MAX_KEYWORDS = 10
 
     DEFAULT_MAX_NGRAM_SIZE = 2
+    FALLBACK_MAX_NGRAM_SIZE = 3
     DEFAULT_DEDUPLICATION_THRESHOLD = 0.9
     DEFAULT_DEDUPLICATION_ALGO = 'seqm'
     DEFAULT_WINDOW_SIZE = 1
 
+    MIN_TEXT_LENGTH = 10
+    SHORT_TEXT_EDGE_LENGTH = 128
+
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+    LETTER_PATTERN = re.compile(r'[^\W\d_]')
+
     def __init__(
         self,
         method: str = "yake",
@@ -39,7 +49,7 @@ class KeywordExtractor:
             count = self.MAX_KEYWORDS
         count = max(self.MIN_KEYWORDS, min(count, self.MAX_KEYWORDS))
 
-        if not text or len(text.strip()) < 10:
+        if self._is_too_short(text):
             return KeywordsResult(
                 keywords=[],
                 formatted="",
@@ -56,11 +66,6 @@ class KeywordExtractor:
         try:
             keywords = self._extract_with_yake(text, count, language)
 
-            if len(keywords) < self.MIN_KEYWORDS:
-                keywords = self._extract_with_yake(
-                    text, count, language, max_ngram_size=3
-                )
-
             keywords = keywords[:self.MAX_KEYWORDS]
 
             formatted = self.format_keywords(keywords)
@@ -84,6 +89,20 @@ class KeywordExtractor:
                 error_scenario=ErrorScenario.API_ERROR,
             )
 
+    def _is_too_short(self, text: str) -> bool:
+        if not text or len(text) < self.MIN_TEXT_LENGTH:
+            return True
+
+        edge = self.SHORT_TEXT_EDGE_LENGTH
+        if (
+            len(text) < 2 * edge + self.MIN_TEXT_LENGTH
+            or text[:edge].isspace()
+            or text[-edge:].isspace()
+        ):
+            return len(text.strip()) < self.MIN_TEXT_LENGTH
+
+        return False
+
     def _extract_with_yake(
         self,
         text: str,
@@ -96,13 +115,13 @@ class KeywordExtractor:
 
         yake_language = self._map_language_to_yake(language)
 
-        kw_extractor = yake.KeywordExtractor(
-            lan=yake_language,
-            n=max_ngram_size,
-            dedupLim=self.deduplication_threshold,
-            dedupFunc=self.DEFAULT_DEDUPLICATION_ALGO,
-            windowsSize=self.window_size,
-            top=count * 2,
+        kw_extractor = self._get_yake(
+            yake_language,
+            max(max_ngram_size, self.FALLBACK_MAX_NGRAM_SIZE),
+            self.deduplication_threshold,
+            self.DEFAULT_DEDUPLICATION_ALGO,
+            self.window_size,
+            count * 4,
         )
 
         keywords_with_scores = kw_extractor.extract_keywords(text)
@@ -111,7 +130,31 @@ class KeywordExtractor:
 
         keywords = self._clean_keywords(keywords, language)
 
-        return keywords[:count]
+        preferred = [kw for kw in keywords if len(kw.split()) <= max_ngram_size]
+        longer = [kw for kw in keywords if len(kw.split()) > max_ngram_size]
+
+        return (preferred + longer)[:count]
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _get_yake(
+        lan: str,
+        n: int,
+        dedup_lim: float,
+        dedup_func: str,
+        window: int,
+        top: int,
+    ) -> "yake.KeywordExtractor":
+        import yake
+
+        return yake.KeywordExtractor(
+            lan=lan,
+            n=n,
+            dedupLim=dedup_lim,
+            dedupFunc=dedup_func,
+            windowsSize=window,
+            top=top,
+        )
 
     def _map_language_to_yake(self, language: str) -> str:
         language_map = {
@@ -125,7 +168,7 @@ class KeywordExtractor:
         seen = set()
 
         for kw in keywords:
-            kw = ' '.join(kw.split())
+            kw = self.WHITESPACE_PATTERN.sub(' ', kw).strip()
 
             if len(kw) < 2:
                 continue
@@ -135,7 +178,7 @@ class KeywordExtractor:
                 continue
             seen.add(kw_lower)
 
-            if not any(c.isalpha() for c in kw):
+            if not self.LETTER_PATTERN.search(kw):
                 continue
 
             cleaned.append(kw)
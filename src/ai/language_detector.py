@@ -1,32 +1,92 @@
+import os
 import re
+import threading
+from collections import OrderedDict
 from typing import Optional
 
 class LanguageDetector:
 
     CYRILLIC_PATTERN = re.compile(r'[\u0400-\u04FF]')
 
-    LATIN_PATTERN = re.compile(r'[a-zA-Z]')
+    CYRILLIC_LEAD_BYTES_DELETE = bytes(b for b in range(256) if not 0xD0 <= b <= 0xD3)
 
-    RUSSIAN_MARKERS = {
+    LATIN_BYTES_DELETE = bytes(
+        b for b in range(256) if not (0x41 <= b <= 0x5A or 0x61 <= b <= 0x7A)
+    )
+
+    WORD_PATTERN = re.compile(r'\b\w+\b')
+
+    MARKER_SAMPLE_LIMIT = 50
+
+    RUSSIAN_MARKERS = frozenset({
         'и', 'в', 'на', 'с', 'по', 'для', 'что', 'это', 'как', 'не',
         'из', 'к', 'от', 'до', 'за', 'при', 'но', 'или', 'а', 'о',
         'он', 'она', 'они', 'мы', 'вы', 'я', 'ты', 'его', 'её', 'их',
-    }
+    })
 
-    ENGLISH_MARKERS = {
+    ENGLISH_MARKERS = frozenset({
         'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
         'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
         'could', 'should', 'may', 'might', 'must', 'can', 'shall',
         'of', 'to', 'in', 'for', 'on', 'with', 'at', 'by', 'from',
         'and', 'or', 'but', 'not', 'this', 'that', 'it', 'as', 'if',
+    })
+
+    MARKER_LANGUAGES = {
+        **dict.fromkeys(ENGLISH_MARKERS, "en"),
+        **dict.fromkeys(RUSSIAN_MARKERS, "ru"),
     }
 
+    CACHE_MIN_TEXT_LENGTH = 2000
+    CACHE_MAX_SIZE = 1024
+    CACHE_FINGERPRINT_LENGTH = 64
+
+    PROFILE_LANGUAGES = ("ru", "en")
+
+    _profile_factory = None
+    _profile_factory_loaded = False
+    _profile_factory_lock = threading.Lock()
+
+    _cache: "OrderedDict[tuple[int, str, str], str]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
     def detect(self, text: str) -> str:
+        if not text or len(text) <= self.CACHE_MIN_TEXT_LENGTH:
+            return self._detect_uncached(text)
+
+        key = self._cache_key(text)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        language = self._detect_uncached(text)
+
+        with self._cache_lock:
+            self._cache[key] = language
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_MAX_SIZE:
+                self._cache.popitem(last=False)
+
+        return language
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    def _cache_key(self, text: str) -> tuple[int, str, str]:
+        size = self.CACHE_FINGERPRINT_LENGTH
+        return (len(text), text[:size], text[-size:])
+
+    def _detect_uncached(self, text: str) -> str:
         if not text or not text.strip():
             return "en"
 
-        cyrillic_count = len(self.CYRILLIC_PATTERN.findall(text))
-        latin_count = len(self.LATIN_PATTERN.findall(text))
+        encoded = text.encode("utf-8", "surrogatepass")
+        cyrillic_count = len(encoded.translate(None, self.CYRILLIC_LEAD_BYTES_DELETE))
+        latin_count = len(encoded.translate(None, self.LATIN_BYTES_DELETE))
 
         total_letters = cyrillic_count + latin_count
         if total_letters == 0:
@@ -39,13 +99,72 @@ class LanguageDetector:
         elif cyrillic_ratio < 0.3:
             return "en"
 
+        language = self._detect_by_profiles(text)
+        if language is not None:
+            return language
+
         return self._detect_by_words(text)
 
-    def _detect_by_words(self, text: str) -> str:
-        words = set(re.findall(r'\b\w+\b', text.lower()))
+    @classmethod
+    def _get_profile_factory(cls):
+        if cls._profile_factory_loaded:
+            return cls._profile_factory
+
+        with cls._profile_factory_lock:
+            if not cls._profile_factory_loaded:
+                cls._profile_factory = cls._load_profile_factory()
+                cls._profile_factory_loaded = True
+
+        return cls._profile_factory
+
+    @classmethod
+    def _load_profile_factory(cls):
+        try:
+            from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
+        except ImportError:
+            return None
+
+        profiles = []
+        for language in cls.PROFILE_LANGUAGES:
+            with open(os.path.join(PROFILES_DIRECTORY, language), encoding="utf-8") as f:
+                profiles.append(f.read())
+
+        factory = DetectorFactory()
+        factory.load_json_profile(profiles)
+        factory.set_seed(0)
+        return factory
+
+    def _detect_by_profiles(self, text: str) -> Optional[str]:
+        factory = self._get_profile_factory()
+        if factory is None:
+            return None
+
+        try:
+            detector = factory.create()
+            detector.append(text)
+            language = detector.detect()
+        except Exception:
+            return None
+
+        return language if language in self.PROFILE_LANGUAGES else None
 
-        russian_matches = len(words & self.RUSSIAN_MARKERS)
-        english_matches = len(words & self.ENGLISH_MARKERS)
+    def _detect_by_words(self, text: str) -> str:
+        matches = {"ru": 0, "en": 0}
+        total_matches = 0
+        marker_languages = self.MARKER_LANGUAGES
+
+        for match in self.WORD_PATTERN.finditer(text):
+            language = marker_languages.get(match.group().lower())
+            if language is None:
+                continue
+
+            matches[language] += 1
+            total_matches += 1
+            if total_matches >= self.MARKER_SAMPLE_LIMIT:
+                break
+
+        russian_matches = matches["ru"]
+        english_matches = matches["en"]
 
         if russian_matches > english_matches:
             return "ru"
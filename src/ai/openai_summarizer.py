@@ -1,3 +1,6 @@
+import asyncio
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from src.ai.base import AISummarizer
@@ -6,11 +9,16 @@ from src.models.results import SummaryResult
 
 class OpenAISummarizer(AISummarizer):
 
-    MIN_SENTENCES = 3
-    MAX_SENTENCES = 7
-
     MIN_TEXT_FOR_SUMMARY = 100
 
+    DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+    ASYNC_TIMEOUT_SECONDS = 60.0
+    ASYNC_MAX_CONNECTIONS = 100
+    ASYNC_MAX_KEEPALIVE_CONNECTIONS = 20
+
+    SYSTEM_PROMPT = "Ты - помощник для создания кратких резюме документов."
+
     def __init__(
         self,
         api_key: str,
@@ -18,13 +26,16 @@ class OpenAISummarizer(AISummarizer):
         max_tokens: int = 1000,
         temperature: float = 0.3,
         base_url: Optional[str] = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
     ):
         self.api_key = api_key
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
         self.base_url = base_url
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
         self._client: Optional["openai.OpenAI"] = None
+        self._async_client: Optional["openai.AsyncOpenAI"] = None
 
     @property
     def client(self) -> "openai.OpenAI":
@@ -36,6 +47,32 @@ class OpenAISummarizer(AISummarizer):
                 self._client = openai.OpenAI(api_key=self.api_key)
         return self._client
 
+    @property
+    def async_client(self) -> "openai.AsyncOpenAI":
+        if self._async_client is None:
+            import httpx
+            import openai
+
+            http_client = httpx.AsyncClient(
+                http2=importlib.util.find_spec("h2") is not None,
+                timeout=self.ASYNC_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=self.ASYNC_MAX_CONNECTIONS,
+                    max_keepalive_connections=self.ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+            self._async_client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=http_client,
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
     def _get_ai_model(self) -> AIModel:
         if "gpt-4" in self.model:
             return AIModel.OPENAI_GPT4
@@ -43,55 +80,117 @@ class OpenAISummarizer(AISummarizer):
 
     def summarize(self, text: str, language: str) -> SummaryResult:
         if len(text) < self.MIN_TEXT_FOR_SUMMARY:
-            sentence_count = self._count_sentences(text)
-            return SummaryResult(
-                summary=text,
-                sentence_count=sentence_count,
-                language=language,
-                success=True,
-                ai_model_used=self._get_ai_model(),
-                tokens_used=0,
-            )
+            return self._short_text_result(text, language)
 
         try:
             prompt = self._build_prompt(text, language)
             summary, tokens_used = self._call_api_with_tokens(prompt)
             sentence_count = self._count_sentences(summary)
 
-            if sentence_count < self.MIN_SENTENCES or sentence_count > self.MAX_SENTENCES:
-                summary, tokens_used = self._adjust_summary(
-                    text, language, sentence_count, tokens_used
+            if sentence_count > self.MAX_SENTENCES:
+                summary = self._trim_summary(summary, self.MAX_SENTENCES)
+                sentence_count = self.MAX_SENTENCES
+            elif sentence_count < self.MIN_SENTENCES:
+                summary, tokens_used = self._adjust_summary(text, language, tokens_used)
+                sentence_count = self._count_sentences(summary)
+
+            return self._success_result(summary, sentence_count, language, tokens_used)
+
+        except Exception as e:
+            return self._error_result(e, language)
+
+    async def summarize_async(self, text: str, language: str) -> SummaryResult:
+        if len(text) < self.MIN_TEXT_FOR_SUMMARY:
+            return self._short_text_result(text, language)
+
+        try:
+            prompt = self._build_prompt(text, language)
+            summary, tokens_used = await self._call_api_with_tokens_async(prompt)
+            sentence_count = self._count_sentences(summary)
+
+            if sentence_count > self.MAX_SENTENCES:
+                summary = self._trim_summary(summary, self.MAX_SENTENCES)
+                sentence_count = self.MAX_SENTENCES
+            elif sentence_count < self.MIN_SENTENCES:
+                summary, new_tokens = await self._call_api_with_tokens_async(
+                    self._build_adjust_prompt(text, language)
                 )
+                tokens_used += new_tokens
                 sentence_count = self._count_sentences(summary)
 
-            return SummaryResult(
-                summary=summary,
-                sentence_count=sentence_count,
-                language=language,
-                success=True,
-                ai_model_used=self._get_ai_model(),
-                tokens_used=tokens_used,
-            )
+            return self._success_result(summary, sentence_count, language, tokens_used)
 
         except Exception as e:
-            error_scenario = self._classify_error(e)
-            return SummaryResult(
-                summary="",
-                sentence_count=0,
-                language=language,
-                success=False,
-                ai_model_used=self._get_ai_model(),
-                error_message=str(e),
-                error_scenario=error_scenario,
-            )
+            return self._error_result(e, language)
+
+    def _short_text_result(self, text: str, language: str) -> SummaryResult:
+        return SummaryResult(
+            summary=text,
+            sentence_count=self._count_sentences(text),
+            language=language,
+            success=True,
+            ai_model_used=self._get_ai_model(),
+            tokens_used=0,
+        )
+
+    def _success_result(
+        self,
+        summary: str,
+        sentence_count: int,
+        language: str,
+        tokens_used: int,
+    ) -> SummaryResult:
+        return SummaryResult(
+            summary=summary,
+            sentence_count=sentence_count,
+            language=language,
+            success=True,
+            ai_model_used=self._get_ai_model(),
+            tokens_used=tokens_used,
+        )
+
+    def _error_result(self, error: Exception, language: str) -> SummaryResult:
+        return SummaryResult(
+            summary="",
+            sentence_count=0,
+            language=language,
+            success=False,
+            ai_model_used=self._get_ai_model(),
+            error_message=str(error),
+            error_scenario=self._classify_error(error),
+        )
+
+    def summarize_many(self, texts: list[str], language: str) -> list[SummaryResult]:
+        if not texts:
+            return []
+
+        if len(texts) == 1:
+            return [self.summarize(texts[0], language)]
+
+        max_workers = min(self.max_concurrent_requests, len(texts))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda text: self.summarize(text, language), texts))
+
+    async def summarize_many_async(
+        self,
+        texts: list[str],
+        language: str,
+    ) -> list[SummaryResult]:
+        if not texts:
+            return []
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def summarize_one(text: str) -> SummaryResult:
+            async with semaphore:
+                return await self.summarize_async(text, language)
+
+        return list(await asyncio.gather(*(summarize_one(text) for text in texts)))
 
     def _call_api(self, prompt: str) -> str:
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {"role": "system", "content": "Ты - помощник для создания кратких резюме документов."},
-                {"role": "user", "content": prompt},
-            ],
+            messages=self._build_messages(prompt),
             max_tokens=self.max_tokens,
             temperature=self.temperature,
         )
@@ -100,10 +199,7 @@ class OpenAISummarizer(AISummarizer):
     def _call_api_with_tokens(self, prompt: str) -> tuple[str, int]:
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {"role": "system", "content": "Ты - помощник для создания кратких резюме документов."},
-                {"role": "user", "content": prompt},
-            ],
+            messages=self._build_messages(prompt),
             max_tokens=self.max_tokens,
             temperature=self.temperature,
         )
@@ -111,21 +207,32 @@ class OpenAISummarizer(AISummarizer):
         tokens = response.usage.total_tokens if response.usage else 0
         return content, tokens
 
-    def _adjust_summary(
-        self,
-        text: str,
-        language: str,
-        current_count: int,
-        tokens_used: int,
-    ) -> tuple[str, int]:
-        lang_instruction = "на русском языке" if language == "ru" else "in English"
+    async def _call_api_with_tokens_async(self, prompt: str) -> tuple[str, int]:
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(prompt),
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+        )
+        content = response.choices[0].message.content.strip()
+        tokens = response.usage.total_tokens if response.usage else 0
+        return content, tokens
 
-        if current_count < self.MIN_SENTENCES:
-            instruction = f"Создай резюме ровно из {self.MIN_SENTENCES} предложений"
-        else:
-            instruction = f"Создай резюме ровно из {self.MAX_SENTENCES} предложений"
+    def _build_messages(self, prompt: str) -> list[dict[str, str]]:
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
 
-        prompt = f"""{instruction} {lang_instruction}.
+    def _adjust_summary(self, text: str, language: str, tokens_used: int) -> tuple[str, int]:
+        prompt = self._build_adjust_prompt(text, language)
+        summary, new_tokens = self._call_api_with_tokens(prompt)
+        return summary, tokens_used + new_tokens
+
+    def _build_adjust_prompt(self, text: str, language: str) -> str:
+        lang_instruction = "на русском языке" if language == "ru" else "in English"
+
+        return f"""Создай резюме ровно из {self.MIN_SENTENCES} предложений {lang_instruction}.
 Резюме должно точно отражать основные темы и ключевые моменты документа.
 
 Текст:
@@ -133,9 +240,6 @@ class OpenAISummarizer(AISummarizer):
 
 Резюме:"""
 
-        summary, new_tokens = self._call_api_with_tokens(prompt)
-        return summary, tokens_used + new_tokens
-
     def _classify_error(self, error: Exception) -> ErrorScenario:
         error_str = str(error).lower()
 
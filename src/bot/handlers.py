@@ -1,18 +1,33 @@
-import re
 from datetime import datetime
 from typing import Any, Optional
-from urllib.parse import urlparse
 
 from src.models.enums import ErrorScenario, FileType
 from src.models.metadata import Metadata
 from src.models.results import ValidationResult
 from src.utils.validators import (
     MAX_FILE_SIZE_BYTES,
-    SUPPORTED_EXTENSIONS,
+    SUPPORTED_FORMATS_LABEL,
+    URL_PATTERN,
     validate_file,
     validate_url,
 )
 
+SUPPORTED_FORMATS_MESSAGE = f"Поддерживаемые форматы: {SUPPORTED_FORMATS_LABEL}"
+
+def classify_message(message: dict[str, Any]) -> tuple[str, Optional[str]]:
+    if message.get("document") is not None:
+        return "document", None
+
+    text = message.get("text")
+    if not text:
+        return "unknown", None
+
+    match = URL_PATTERN.search(text)
+    if match:
+        return "url", match.group(0)
+
+    return "text", text
+
 class TelegramBotHandler:
 
     def __init__(
@@ -29,7 +44,7 @@ class TelegramBotHandler:
         file_name = file_info.get("file_name", "")
         file_size = file_info.get("file_size", 0)
 
-        return validate_file(file_name, file_size)
+        return validate_file(file_name, file_size, self.max_file_size)
 
     def validate_url_input(self, url: str) -> ValidationResult:
         return validate_url(url)
@@ -39,6 +54,7 @@ class TelegramBotHandler:
         file_info: dict[str, Any],
         user_info: dict[str, Any],
         source_url: Optional[str] = None,
+        now: Optional[datetime] = None,
     ) -> Metadata:
         file_name = file_info.get("file_name", "")
         if not file_name:
@@ -65,7 +81,7 @@ class TelegramBotHandler:
             file_type=file_type,
             uploader_id=uploader_id,
             uploader_username=uploader_username,
-            timestamp=datetime.now(),
+            timestamp=now if now is not None else datetime.now(),
             source_url=source_url,
             telegram_file_id=telegram_file_id,
         )
@@ -74,33 +90,30 @@ class TelegramBotHandler:
         if not message_text:
             return None
 
-        url_pattern = re.compile(
-            r'https?://[^\s<>"{}|\\^`\[\]]+'
-        )
-
-        match = url_pattern.search(message_text)
+        match = URL_PATTERN.search(message_text)
         return match.group(0) if match else None
 
     def get_file_name_from_url(self, url: str) -> Optional[str]:
         if not url:
             return None
 
-        try:
-            parsed = urlparse(url)
-            path = parsed.path
-
-            if not path or path == "/":
+        end = len(url)
+        for delimiter in ("?", "#"):
+            index = url.find(delimiter, 0, end)
+            if index != -1:
+                end = index
+
+        path_start = 0
+        scheme_end = url.find("://", 0, end)
+        if scheme_end != -1:
+            path_start = url.find("/", scheme_end + 3, end)
+            if path_start == -1:
                 return None
 
-            file_name = path.rsplit("/", 1)[-1]
-
-            if "?" in file_name:
-                file_name = file_name.split("?")[0]
+        slash = url.rfind("/", path_start, end)
+        file_name = url[slash + 1:end]
 
-            return file_name if file_name else None
-
-        except Exception:
-            return None
+        return file_name if file_name else None
 
     def is_document_message(self, message: dict[str, Any]) -> bool:
         return "document" in message and message["document"] is not None
@@ -113,25 +126,21 @@ class TelegramBotHandler:
         url = self.extract_url_from_message(text)
         return url is not None
 
-    def get_message_type(self, message: dict[str, Any]) -> str:
-        if self.is_document_message(message):
-            return "document"
-
-        if self.is_url_message(message):
-            return "url"
-
-        if message.get("text"):
-            return "text"
+    def classify_message(self, message: dict[str, Any]) -> tuple[str, Optional[str]]:
+        return classify_message(message)
 
-        return "unknown"
+    def get_message_type(self, message: dict[str, Any]) -> str:
+        return classify_message(message)[0]
 
     def _get_file_type(self, file_name: str) -> Optional[FileType]:
-        if not file_name or "." not in file_name:
+        if not file_name:
+            return None
+
+        _, separator, extension = file_name.rpartition(".")
+        if not separator:
             return None
 
-        extension = file_name.rsplit(".", 1)[-1].lower()
-        return FileType.from_extension(extension)
+        return FileType.from_extension(extension.lower())
 
     def get_supported_formats_message(self) -> str:
-        formats = ", ".join(ext.upper() for ext in SUPPORTED_EXTENSIONS)
-        return f"Поддерживаемые форматы: {formats}"
+        return SUPPORTED_FORMATS_MESSAGE
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from src.models.enums import ErrorScenario
+from src.utils.validators import SUPPORTED_FORMATS_LABEL
 
 @dataclass
 class NotificationTemplates:
@@ -16,7 +17,7 @@ class NotificationTemplates:
 
     ERROR_UNSUPPORTED_FORMAT: str = (
         "❌ Формат файла не поддерживается.\n"
-        "Поддерживаемые форматы: PDF, DOCX, TXT, MD"
+        f"Поддерживаемые форматы: {SUPPORTED_FORMATS_LABEL}"
     )
 
     ERROR_FILE_TOO_LARGE: str = (
@@ -38,10 +39,12 @@ class NotificationTemplates:
 
     ERROR_URL: str = "❌ Не удалось загрузить файл по ссылке. Проверьте URL"
 
-    INSTRUCTIONS: str = "📄 Отправьте мне документ (PDF, DOCX, TXT, MD) или ссылку на файл"
+    INSTRUCTIONS: str = f"📄 Отправьте мне документ ({SUPPORTED_FORMATS_LABEL}) или ссылку на файл"
 
 DEFAULT_MAX_FILE_SIZE_MB = 20
 
+UNKNOWN_ERROR_MESSAGE = "❌ Произошла неизвестная ошибка. Попробуйте позже"
+
 class NotificationService:
 
     def __init__(
@@ -51,25 +54,10 @@ class NotificationService:
     ) -> None:
         self.templates = templates or NotificationTemplates()
         self.max_file_size_mb = max_file_size_mb
+        self._error_messages = self._build_error_messages()
 
-    def get_processing_started_message(self) -> str:
-        return self.templates.PROCESSING_STARTED
-
-    def get_processing_complete_message(
-        self,
-        summary: str,
-        keywords: str,
-    ) -> str:
-        return self.templates.PROCESSING_COMPLETE.format(
-            summary=summary,
-            keywords=keywords,
-        )
-
-    def get_instructions_message(self) -> str:
-        return self.templates.INSTRUCTIONS
-
-    def get_error_message(self, error_scenario: ErrorScenario) -> str:
-        error_messages = {
+    def _build_error_messages(self) -> dict[ErrorScenario, str]:
+        return {
             ErrorScenario.FILE_TOO_LARGE: self.templates.ERROR_FILE_TOO_LARGE.format(
                 max_size=self.max_file_size_mb
             ),
@@ -86,11 +74,25 @@ class NotificationService:
             ErrorScenario.URL_INVALID: self.templates.ERROR_URL,
         }
 
-        return error_messages.get(
-            error_scenario,
-            "❌ Произошла неизвестная ошибка. Попробуйте позже"
+    def get_processing_started_message(self) -> str:
+        return self.templates.PROCESSING_STARTED
+
+    def get_processing_complete_message(
+        self,
+        summary: str,
+        keywords: str,
+    ) -> str:
+        return self.templates.PROCESSING_COMPLETE.format(
+            summary=summary,
+            keywords=keywords,
         )
 
+    def get_instructions_message(self) -> str:
+        return self.templates.INSTRUCTIONS
+
+    def get_error_message(self, error_scenario: ErrorScenario) -> str:
+        return self._error_messages.get(error_scenario, UNKNOWN_ERROR_MESSAGE)
+
     def get_error_message_from_validation(
         self,
         error_scenario: Optional[ErrorScenario],
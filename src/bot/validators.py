@@ -1,5 +1,6 @@
 from typing import Any, Optional
 
+from src.bot.handlers import classify_message
 from src.models.enums import ErrorScenario
 from src.models.results import ValidationResult
 from src.utils.validators import (
@@ -32,31 +33,19 @@ class BotValidator:
         file_name = document.get("file_name", "")
         file_size = document.get("file_size", 0)
 
-        format_result = validate_file_format(file_name)
-        if not format_result.is_valid:
-            return format_result
-
-        size_result = validate_file_size(file_size, self.max_file_size)
-        if not size_result.is_valid:
-            return size_result
-
-        return ValidationResult(is_valid=True)
+        return validate_file(file_name, file_size, self.max_file_size)
 
     def validate_url_message(self, url: str) -> ValidationResult:
         return validate_url(url)
 
     def validate_message(self, message: dict[str, Any]) -> ValidationResult:
-        if "document" in message and message["document"]:
-            return self.validate_document(message["document"])
+        message_type, url = classify_message(message)
 
-        text = message.get("text", "")
-        if text:
-            import re
-            url_pattern = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
-            match = url_pattern.search(text)
+        if message_type == "document":
+            return self.validate_document(message["document"])
 
-            if match:
-                return self.validate_url_message(match.group(0))
+        if message_type == "url":
+            return self.validate_url_message(url)
 
         return ValidationResult(
             is_valid=False,
@@ -77,5 +66,5 @@ class BotValidator:
         file_name: str,
         file_size: int,
     ) -> Optional[ErrorScenario]:
-        result = validate_file(file_name, file_size)
+        result = validate_file(file_name, file_size, self.max_file_size)
         return result.error_scenario
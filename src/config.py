@@ -101,8 +101,11 @@ def load_config(env_path: Optional[str] = None) -> WorkflowConfig:
         log_file_path=_get_env('LOG_FILE_PATH', './logs/processing.log'),
         log_retention_days=_get_env_int('LOG_RETENTION_DAYS', 30),
 
+        temp_dir=_get_env('TEMP_DIR', ''),
+
         webhook_url=_get_env('WEBHOOK_URL', ''),
         webhook_timeout=_get_env_int('WEBHOOK_TIMEOUT', 30),
+        notification_batch_window=_get_env_float('NOTIFICATION_BATCH_WINDOW', 0.25),
 
         enable_ocr=_get_env_bool('ENABLE_OCR', True),
         enable_url_download=_get_env_bool('ENABLE_URL_DOWNLOAD', True),
@@ -1,4 +1,6 @@
 import asyncio
+import html
+import io
 import logging
 import os
 import sys
@@ -6,7 +8,7 @@ import tempfile
 from datetime import datetime
 from typing import Optional
 
-from telegram import Update
+from telegram import Bot, Update
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -21,7 +23,10 @@ from src.config import ConfigurationError, load_config
 from src.models.config import WorkflowConfig
 from src.models.enums import ErrorScenario, FileType
 from src.models.metadata import Metadata
+from src.models.results import ProcessingResult
 from src.processor import DocumentProcessor
+from src.utils.temp_files import temp_dir_for_size
+from src.utils.validators import SUPPORTED_FORMATS_LABEL
 from src.utils.logger import ProcessingLogger
 
 logging.basicConfig(
@@ -32,6 +37,14 @@ logger = logging.getLogger(__name__)
 
 class TelegramKnowledgeBot:
 
+    TELEGRAM_MESSAGE_LIMIT = 4096
+
+    OUTBOX_SEPARATOR = "\n\n"
+    OUTBOX_PARSE_MODE = "HTML"
+
+    CONCURRENT_UPDATES = 4
+    DOWNLOAD_READ_TIMEOUT = 30.0
+
     def __init__(self, config: WorkflowConfig) -> None:
         self.config = config
 
@@ -53,10 +66,44 @@ class TelegramKnowledgeBot:
 
         self.application: Optional[Application] = None
 
+        self._instructions_message = self.notification_service.get_instructions_message()
+        self._processing_started_message = (
+            self.notification_service.get_processing_started_message()
+        )
+        self._welcome_message = (
+            "👋 Привет! Я бот для обработки документов.\n\n"
+            f"{self._instructions_message}\n\n"
+            "Я извлеку текст, создам краткое описание и выделю ключевые слова."
+        )
+        self._help_message = (
+            "📖 <b>Как использовать бота:</b>\n\n"
+            f"1. Отправьте документ ({SUPPORTED_FORMATS_LABEL}) как вложение\n"
+            "2. Или отправьте ссылку на документ\n\n"
+            "Бот автоматически:\n"
+            "• Извлечёт текст из документа\n"
+            "• Создаст краткое описание (3-7 предложений)\n"
+            "• Выделит ключевые слова (5-10)\n"
+            "• Сохранит результаты в базу знаний\n\n"
+            f"<b>Ограничения:</b>\n"
+            f"• Максимальный размер файла: {config.max_file_size_mb}MB\n"
+            f"• Поддерживаемые форматы: {SUPPORTED_FORMATS_LABEL}"
+        )
+
+        self.temp_dir = self.processor.temp_dir
+
+        self._outbox: dict[int, asyncio.Queue] = {}
+        self._sender_task: Optional[asyncio.Task] = None
+        self._outbox_stopping: Optional[asyncio.Event] = None
+
     def setup_application(self) -> Application:
         self.application = (
             Application.builder()
             .token(self.config.telegram_bot_token)
+            .concurrent_updates(self.CONCURRENT_UPDATES)
+            .read_timeout(self.DOWNLOAD_READ_TIMEOUT)
+            .post_init(self._start_outbox)
+            .post_stop(self._stop_outbox)
+            .post_shutdown(self._shutdown)
             .build()
         )
 
@@ -86,15 +133,10 @@ class TelegramKnowledgeBot:
         if update.effective_chat is None:
             return
 
-        welcome_message = (
-            "👋 Привет! Я бот для обработки документов.\n\n"
-            f"{self.notification_service.get_instructions_message()}\n\n"
-            "Я извлеку текст, создам краткое описание и выделю ключевые слова."
-        )
-
-        await context.bot.send_message(
+        await self._send_message(
+            context,
             chat_id=update.effective_chat.id,
-            text=welcome_message,
+            text=self._welcome_message,
         )
 
     async def handle_help(
@@ -105,23 +147,10 @@ class TelegramKnowledgeBot:
         if update.effective_chat is None:
             return
 
-        help_message = (
-            "📖 <b>Как использовать бота:</b>\n\n"
-            "1. Отправьте документ (PDF, DOCX, TXT, MD) как вложение\n"
-            "2. Или отправьте ссылку на документ\n\n"
-            "Бот автоматически:\n"
-            "• Извлечёт текст из документа\n"
-            "• Создаст краткое описание (3-7 предложений)\n"
-            "• Выделит ключевые слова (5-10)\n"
-            "• Сохранит результаты в базу знаний\n\n"
-            f"<b>Ограничения:</b>\n"
-            f"• Максимальный размер файла: {self.config.max_file_size_mb}MB\n"
-            "• Поддерживаемые форматы: PDF, DOCX, TXT, MD"
-        )
-
-        await context.bot.send_message(
+        await self._send_message(
+            context,
             chat_id=update.effective_chat.id,
-            text=help_message,
+            text=self._help_message,
             parse_mode="HTML",
         )
 
@@ -137,9 +166,10 @@ class TelegramKnowledgeBot:
         document = update.message.document
 
         if document is None:
-            await context.bot.send_message(
+            await self._send_message(
+                context,
                 chat_id=chat_id,
-                text=self.notification_service.get_instructions_message(),
+                text=self._instructions_message,
             )
             return
 
@@ -156,15 +186,17 @@ class TelegramKnowledgeBot:
                 validation.error_scenario,
                 validation.error_message,
             )
-            await context.bot.send_message(
+            await self._send_message(
+                context,
                 chat_id=chat_id,
                 text=error_message,
             )
             return
 
-        await context.bot.send_message(
+        await self._send_message(
+            context,
             chat_id=chat_id,
-            text=self.notification_service.get_processing_started_message(),
+            text=self._processing_started_message,
         )
 
         user = update.message.from_user
@@ -179,37 +211,37 @@ class TelegramKnowledgeBot:
 
             file = await context.bot.get_file(document.file_id)
 
-            suffix = os.path.splitext(file_info["file_name"])[1]
-            with tempfile.NamedTemporaryFile(
-                delete=False,
-                suffix=suffix,
-            ) as tmp_file:
-                await file.download_to_drive(tmp_file.name)
-                file_path = tmp_file.name
+            suffix = f".{metadata.file_type.value}"
+            buffer = io.BytesIO()
+            await file.download_to_memory(buffer)
+            file_path = await asyncio.to_thread(
+                self._write_temp_file,
+                buffer.getbuffer(),
+                suffix,
+                self.temp_dir,
+            )
 
             try:
-                result = self.processor.process_document(
-                    file_path=file_path,
-                    metadata=metadata,
-                )
+                result = await self._process_document(file_path, metadata)
 
                 notification = self.processor.get_notification_message(result)
-                await context.bot.send_message(
+                await self._send_message(
+                    context,
                     chat_id=chat_id,
                     text=notification,
                     parse_mode="HTML",
                 )
 
             finally:
-                if os.path.exists(file_path):
-                    os.unlink(file_path)
+                await asyncio.to_thread(self._remove_file, file_path)
 
         except ValueError as e:
             self.processing_logger.log_error(
                 error_type="MetadataError",
                 message=str(e),
             )
-            await context.bot.send_message(
+            await self._send_message(
+                context,
                 chat_id=chat_id,
                 text=f"❌ Ошибка обработки: {str(e)}",
             )
@@ -218,7 +250,8 @@ class TelegramKnowledgeBot:
                 error_type="ProcessingError",
                 message=str(e),
             )
-            await context.bot.send_message(
+            await self._send_message(
+                context,
                 chat_id=chat_id,
                 text="❌ Произошла ошибка при обработке документа. Попробуйте позже.",
             )
@@ -237,14 +270,16 @@ class TelegramKnowledgeBot:
         url = self.handler.extract_url_from_message(text)
 
         if url is None:
-            await context.bot.send_message(
+            await self._send_message(
+                context,
                 chat_id=chat_id,
-                text=self.notification_service.get_instructions_message(),
+                text=self._instructions_message,
             )
             return
 
         if not self.config.enable_url_download:
-            await context.bot.send_message(
+            await self._send_message(
+                context,
                 chat_id=chat_id,
                 text="❌ Загрузка по URL отключена. Пожалуйста, отправьте файл напрямую.",
             )
@@ -256,18 +291,21 @@ class TelegramKnowledgeBot:
                 validation.error_scenario,
                 validation.error_message,
             )
-            await context.bot.send_message(
+            await self._send_message(
+                context,
                 chat_id=chat_id,
                 text=error_message,
             )
             return
 
-        await context.bot.send_message(
+        await self._send_message(
+            context,
             chat_id=chat_id,
-            text=self.notification_service.get_processing_started_message(),
+            text=self._processing_started_message,
         )
 
-        file_path, file_name, error = self.processor.download_from_url(
+        file_path, file_name, error = await asyncio.to_thread(
+            self.processor.download_from_url,
             url=url,
             timeout=self.config.webhook_timeout,
         )
@@ -276,14 +314,15 @@ class TelegramKnowledgeBot:
             error_message = self.notification_service.get_error_message(
                 error or ErrorScenario.URL_INVALID
             )
-            await context.bot.send_message(
+            await self._send_message(
+                context,
                 chat_id=chat_id,
                 text=error_message,
             )
             return
 
         try:
-            file_size = os.path.getsize(file_path)
+            file_size = await asyncio.to_thread(os.path.getsize, file_path)
 
             validation = self.processor.validate_file(file_name, file_size)
             if not validation.is_valid:
@@ -291,7 +330,8 @@ class TelegramKnowledgeBot:
                     validation.error_scenario,
                     validation.error_message,
                 )
-                await context.bot.send_message(
+                await self._send_message(
+                    context,
                     chat_id=chat_id,
                     text=error_message,
                 )
@@ -299,12 +339,12 @@ class TelegramKnowledgeBot:
 
             user = update.message.from_user
 
-            file_type = FileType.from_extension(
-                os.path.splitext(file_name)[1].lstrip(".")
-            )
+            _, separator, extension = file_name.rpartition(".")
+            file_type = FileType.from_extension(extension) if separator else None
 
             if file_type is None:
-                await context.bot.send_message(
+                await self._send_message(
+                    context,
                     chat_id=chat_id,
                     text=self.notification_service.get_error_message(
                         ErrorScenario.UNSUPPORTED_FORMAT
@@ -322,21 +362,145 @@ class TelegramKnowledgeBot:
                 source_url=url,
             )
 
-            result = self.processor.process_document(
-                file_path=file_path,
-                metadata=metadata,
-            )
+            result = await self._process_document(file_path, metadata)
 
             notification = self.processor.get_notification_message(result)
-            await context.bot.send_message(
+            await self._send_message(
+                context,
                 chat_id=chat_id,
                 text=notification,
                 parse_mode="HTML",
             )
 
         finally:
-            if os.path.exists(file_path):
-                os.unlink(file_path)
+            await asyncio.to_thread(self._remove_file, file_path)
+
+    async def _send_message(
+        self,
+        context: ContextTypes.DEFAULT_TYPE,
+        chat_id: int,
+        text: str,
+        parse_mode: Optional[str] = None,
+    ) -> None:
+        if self._sender_task is None:
+            await context.bot.send_message(
+                chat_id=chat_id,
+                text=text,
+                parse_mode=parse_mode,
+            )
+            return
+
+        if parse_mode is None:
+            text = html.escape(text, quote=False)
+            parse_mode = self.OUTBOX_PARSE_MODE
+
+        self._outbox.setdefault(chat_id, asyncio.Queue()).put_nowait((text, parse_mode))
+
+    async def _start_outbox(self, application: Application) -> None:
+        self._outbox_stopping = asyncio.Event()
+        self._sender_task = asyncio.create_task(
+            self._drain_outbox(application.bot, self._outbox_stopping)
+        )
+
+    async def _stop_outbox(self, application: Application) -> None:
+        if self._sender_task is None:
+            return
+
+        self._outbox_stopping.set()
+        await self._sender_task
+        self._sender_task = None
+        self._outbox_stopping = None
+
+        await self._flush_outbox(application.bot)
+
+    async def _shutdown(self, application: Application) -> None:
+        await self._stop_outbox(application)
+        await self.processor.aclose()
+
+    async def _drain_outbox(self, bot: Bot, stopping: asyncio.Event) -> None:
+        while not stopping.is_set():
+            try:
+                await asyncio.wait_for(
+                    stopping.wait(),
+                    timeout=self.config.notification_batch_window,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                await self._flush_outbox(bot)
+            except Exception as e:
+                logger.error(f"Failed to flush notification outbox: {e}")
+
+    async def _flush_outbox(self, bot: Bot) -> None:
+        for chat_id, queue in list(self._outbox.items()):
+            pending = []
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+
+            if not pending:
+                del self._outbox[chat_id]
+                continue
+
+            for text, parse_mode in self._merge_messages(pending):
+                try:
+                    await bot.send_message(
+                        chat_id=chat_id,
+                        text=text,
+                        parse_mode=parse_mode,
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to send message to chat {chat_id}: {e}")
+
+    def _merge_messages(
+        self,
+        messages: list[tuple[str, Optional[str]]],
+    ) -> list[tuple[str, Optional[str]]]:
+        merged: list[tuple[str, Optional[str]]] = []
+
+        for text, parse_mode in messages:
+            if merged:
+                last_text, last_parse_mode = merged[-1]
+                combined_length = len(last_text) + len(self.OUTBOX_SEPARATOR) + len(text)
+                if (
+                    last_parse_mode == parse_mode
+                    and combined_length <= self.TELEGRAM_MESSAGE_LIMIT
+                ):
+                    merged[-1] = (last_text + self.OUTBOX_SEPARATOR + text, parse_mode)
+                    continue
+
+            merged.append((text, parse_mode))
+
+        return merged
+
+    async def _process_document(
+        self,
+        file_path: str,
+        metadata: Metadata,
+    ) -> ProcessingResult:
+        return await self.processor.process_document_async(
+            file_path=file_path,
+            metadata=metadata,
+        )
+
+    @staticmethod
+    def _write_temp_file(
+        data: memoryview,
+        suffix: str,
+        temp_dir: Optional[str] = None,
+    ) -> str:
+        with tempfile.NamedTemporaryFile(
+            delete=False,
+            suffix=suffix,
+            dir=temp_dir_for_size(temp_dir, len(data)),
+        ) as tmp_file:
+            tmp_file.write(data)
+            return tmp_file.name
+
+    @staticmethod
+    def _remove_file(file_path: str) -> None:
+        if os.path.exists(file_path):
+            os.unlink(file_path)
 
     def run_polling(self) -> None:
         if self.application is None:
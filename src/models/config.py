@@ -1,8 +1,10 @@
-import json
 import random
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, asdict
+from functools import cached_property
 from typing import Optional, Dict, Any
 
+import orjson
+
 @dataclass
 class RetryConfig:
     max_retries: int = 3
@@ -11,11 +13,30 @@ class RetryConfig:
     exponential_base: float = 2.0
     jitter: bool = True
 
-    def get_delay(self, attempt: int) -> float:
-        delay = min(
+    DELAY_FIELDS = frozenset({"max_retries", "base_delay", "max_delay", "exponential_base"})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.DELAY_FIELDS:
+            self.__dict__.pop("_delays", None)
+
+    @cached_property
+    def _delays(self) -> tuple[float, ...]:
+        return tuple(
+            self._compute_delay(attempt) for attempt in range(self.max_retries + 1)
+        )
+
+    def _compute_delay(self, attempt: int) -> float:
+        return min(
             self.base_delay * (self.exponential_base ** attempt),
             self.max_delay
         )
+
+    def get_delay(self, attempt: int) -> float:
+        if 0 <= attempt < len(self._delays):
+            delay = self._delays[attempt]
+        else:
+            delay = self._compute_delay(attempt)
         if self.jitter:
             delay = delay * (0.5 + random.random())
         return delay
@@ -51,7 +72,7 @@ class NotificationMessage:
     ERROR_URL: str = "❌ Не удалось загрузить файл по ссылке. Проверьте URL"
     INSTRUCTIONS: str = "📄 Отправьте мне документ (PDF, DOCX, TXT, MD) или ссылку на файл"
 
-@dataclass
+@dataclass(frozen=True)
 class WorkflowConfig:
     telegram_bot_token: str
     telegram_webhook_secret: str
@@ -89,18 +110,29 @@ class WorkflowConfig:
     log_file_path: str = "logs/processing.log"
     log_retention_days: int = 30
 
+    temp_dir: str = ""
+
     webhook_url: str = ""
     webhook_timeout: int = 30
+    notification_batch_window: float = 0.25
 
     enable_ocr: bool = True
     enable_url_download: bool = True
     enable_language_detection: bool = True
 
-    def to_dict(self) -> Dict[str, Any]:
+    @cached_property
+    def _dict_cache(self) -> Dict[str, Any]:
         return asdict(self)
 
+    @cached_property
+    def _json_cache(self) -> str:
+        return orjson.dumps(self._dict_cache, option=orjson.OPT_INDENT_2).decode()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._dict_cache)
+
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2)
+        return self._json_cache
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'WorkflowConfig':
@@ -108,10 +140,5 @@ class WorkflowConfig:
 
     @classmethod
     def from_json(cls, json_str: str) -> 'WorkflowConfig':
-        data = json.loads(json_str)
+        data = orjson.loads(json_str)
         return cls.from_dict(data)
-
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, WorkflowConfig):
-            return False
-        return self.to_dict() == other.to_dict()
@@ -8,15 +8,17 @@ class FileType(Enum):
 
     @classmethod
     def from_extension(cls, extension: str) -> "FileType | None":
-        ext = extension.lower().lstrip(".")
-        for file_type in cls:
-            if file_type.value == ext:
-                return file_type
-        return None
+        return _EXTENSION_MAP.get(extension.lower().lstrip("."))
 
     @classmethod
     def supported_extensions(cls) -> list[str]:
-        return [ft.value for ft in cls]
+        return list(_EXTENSION_LIST)
+
+_EXTENSION_MAP = {file_type.value: file_type for file_type in FileType}
+
+_EXTENSION_LIST = tuple(_EXTENSION_MAP)
+
+SUPPORTED_EXTENSION_SET: frozenset[str] = frozenset(_EXTENSION_MAP)
 
 class ProcessingStatus(Enum):
     PENDING = "pending"
@@ -41,6 +43,7 @@ class ErrorScenario(Enum):
 class ExtractionMethod(Enum):
     PYPDF2 = "pypdf2"
     PDFPLUMBER = "pdfplumber"
+    PYPDFIUM2 = "pypdfium2"
     PYTHON_DOCX = "python_docx"
     PLAIN_READ = "plain_read"
     TESSERACT_OCR = "tesseract_ocr"
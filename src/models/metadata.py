@@ -4,7 +4,7 @@ from typing import Optional
 
 from .enums import FileType
 
-@dataclass
+@dataclass(slots=True)
 class Metadata:
     file_name: str
     file_size: int
@@ -33,11 +33,8 @@ class Metadata:
             raise ValueError("uploader_id must be a positive integer")
 
     def is_complete(self) -> bool:
-        return bool(
-            self.file_name and 
-            self.file_name.strip() and
-            self.file_size >= 0 and
-            isinstance(self.file_type, FileType) and
-            isinstance(self.uploader_id, int) and
-            self.uploader_id > 0
-        )
+        try:
+            self._validate()
+        except ValueError:
+            return False
+        return True
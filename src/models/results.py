@@ -9,13 +9,13 @@ from .enums import (
 )
 from .metadata import Metadata
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     is_valid: bool
     error_message: Optional[str] = None
     error_scenario: Optional[ErrorScenario] = None
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     text: str
     char_count: int
@@ -30,7 +30,7 @@ class ParseResult:
         if self.success and self.char_count == 0 and self.text:
             self.char_count = len(self.text)
 
-@dataclass
+@dataclass(slots=True)
 class SummaryResult:
     summary: str
     sentence_count: int
@@ -41,7 +41,7 @@ class SummaryResult:
     error_message: Optional[str] = None
     error_scenario: Optional[ErrorScenario] = None
 
-@dataclass
+@dataclass(slots=True)
 class KeywordsResult:
     keywords: list[str]
     formatted: str
@@ -55,7 +55,7 @@ class KeywordsResult:
         if self.success and self.count == 0 and self.keywords:
             self.count = len(self.keywords)
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     metadata: Metadata
     parse_result: ParseResult
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
 from .enums import ErrorScenario
 
-@dataclass
+@dataclass(slots=True)
 class GoogleSheetsRow:
     timestamp: str
     uploader_id: str
@@ -23,25 +24,33 @@ class GoogleSheetsRow:
     ocr_used: bool
     processing_time: float
 
+    _FIELD_ORDER = (
+        "timestamp",
+        "uploader_id",
+        "uploader_username",
+        "file_name",
+        "file_type",
+        "file_size",
+        "char_count",
+        "language",
+        "summary",
+        "keywords",
+        "status",
+        "error_message",
+        "ai_model_used",
+        "extraction_method",
+        "ocr_used",
+        "processing_time",
+    )
+
+    _FIELD_GETTER = attrgetter(*_FIELD_ORDER)
+
+    _OCR_USED_INDEX = _FIELD_ORDER.index("ocr_used")
+
     def to_list(self) -> List[Any]:
-        return [
-            self.timestamp,
-            self.uploader_id,
-            self.uploader_username,
-            self.file_name,
-            self.file_type,
-            self.file_size,
-            self.char_count,
-            self.language,
-            self.summary,
-            self.keywords,
-            self.status,
-            self.error_message,
-            self.ai_model_used,
-            self.extraction_method,
-            str(self.ocr_used),
-            self.processing_time,
-        ]
+        values = list(self._FIELD_GETTER(self))
+        values[self._OCR_USED_INDEX] = str(self.ocr_used)
+        return values
 
     def has_required_fields(self) -> bool:
         return bool(
@@ -52,13 +61,13 @@ class GoogleSheetsRow:
             self.keywords
         )
 
-@dataclass
+@dataclass(slots=True)
 class RowInfo:
     row_number: int
     timestamp: datetime
     success: bool
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     timestamp: datetime
     event_type: str
@@ -1,9 +1,18 @@
+import codecs
+import mmap
+import os
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Union
 
-from src.models import ParseResult
+from src.models import ErrorScenario, ExtractionMethod, ParseResult
+
+_MADV_SEQUENTIAL = getattr(mmap, "MADV_SEQUENTIAL", None)
 
 class DocumentParser(ABC):
 
+    MMAP_MIN_SIZE = 1024 * 1024
+
     @abstractmethod
     def parse(self, file_path: str) -> ParseResult:
         pass
@@ -14,3 +23,60 @@ class DocumentParser(ABC):
 
     def _normalize_extension(self, extension: str) -> str:
         return extension.lower().lstrip(".")
+
+    @contextmanager
+    def _open_buffer(self, file_path: str) -> Iterator[Union[bytes, mmap.mmap]]:
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < self.MMAP_MIN_SIZE:
+                yield f.read()
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if _MADV_SEQUENTIAL is not None:
+                    mapped.madvise(_MADV_SEQUENTIAL)
+                yield mapped
+
+    def _decode(self, data: Union[bytes, mmap.mmap], encoding: str) -> str:
+        return codecs.decode(data, encoding)
+
+    @staticmethod
+    def _normalize_newlines(text: str) -> str:
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    @classmethod
+    def parse_text(cls, text: str) -> ParseResult:
+        text = cls._normalize_newlines(text)
+        char_count = len(text)
+
+        if char_count == 0:
+            return ParseResult(
+                text="",
+                char_count=0,
+                success=False,
+                extraction_method=ExtractionMethod.PLAIN_READ,
+                error_message="Document is empty",
+                error_scenario=ErrorScenario.EMPTY_DOCUMENT,
+            )
+
+        return ParseResult(
+            text=text,
+            char_count=char_count,
+            success=True,
+            extraction_method=ExtractionMethod.PLAIN_READ,
+        )
+
+    def _decode_first(
+        self,
+        data: Union[bytes, mmap.mmap],
+        encodings: Iterable[str],
+    ) -> tuple[Optional[str], Optional[Exception]]:
+        last_error = None
+        for encoding in encodings:
+            try:
+                return self._decode(data, encoding), None
+            except (UnicodeDecodeError, LookupError) as e:
+                last_error = e
+
+        return None, last_error
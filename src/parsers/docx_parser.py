@@ -1,15 +1,18 @@
 from src.models import ParseResult, ExtractionMethod, ErrorScenario
 from src.parsers.base import DocumentParser
 
+try:
+    from docx import Document as _Document
+except ImportError:
+    _Document = None
+
 class DOCXParser(DocumentParser):
 
     def supports(self, file_extension: str) -> bool:
         return self._normalize_extension(file_extension) == "docx"
 
     def parse(self, file_path: str) -> ParseResult:
-        try:
-            from docx import Document
-        except ImportError:
+        if _Document is None:
             return ParseResult(
                 text="",
                 char_count=0,
@@ -20,15 +23,11 @@ class DOCXParser(DocumentParser):
             )
 
         try:
-            doc = Document(file_path)
+            doc = _Document(file_path)
 
-            paragraphs: list[str] = []
-            for para in doc.paragraphs:
-                text = para.text.strip()
-                if text:
-                    paragraphs.append(text)
-
-            full_text = "\n\n".join(paragraphs)
+            full_text = "\n\n".join(
+                text for para in doc.paragraphs if (text := para.text.strip())
+            )
             char_count = len(full_text)
 
             if char_count == 0:
@@ -8,34 +8,49 @@ from src.parsers.docx_parser import DOCXParser
 from src.parsers.txt_parser import TXTParser
 from src.parsers.md_parser import MDParser
 
+_PARSER_INSTANCES: tuple[DocumentParser, ...] = (
+    PDFParser(),
+    DOCXParser(),
+    TXTParser(),
+    MDParser(),
+)
+
+def _build_extension_map(parsers: tuple[DocumentParser, ...]) -> dict[str, DocumentParser]:
+    by_ext: dict[str, DocumentParser] = {}
+    for extension in FileType.supported_extensions():
+        for parser in parsers:
+            if parser.supports(extension):
+                by_ext[extension] = parser
+                break
+    return by_ext
+
+_PARSERS: dict[str, DocumentParser] = _build_extension_map(_PARSER_INSTANCES)
+
+_PARSERS_BY_TYPE: dict[FileType, DocumentParser] = {
+    file_type: _PARSERS[file_type.value]
+    for file_type in FileType
+    if file_type.value in _PARSERS
+}
+
 class ParserFactory:
 
     def __init__(self) -> None:
-        self._parsers: list[DocumentParser] = [
-            PDFParser(),
-            DOCXParser(),
-            TXTParser(),
-            MDParser(),
-        ]
+        self._parsers: list[DocumentParser] = list(_PARSER_INSTANCES)
+        self._by_ext: dict[str, DocumentParser] = _PARSERS
+        self._by_type: dict[FileType, DocumentParser] = _PARSERS_BY_TYPE
 
     def get_parser(self, file_path: str) -> Optional[DocumentParser]:
-        extension = self._get_extension(file_path)
-
-        for parser in self._parsers:
-            if parser.supports(extension):
-                return parser
-
-        return None
+        return self._by_ext.get(self._get_extension(file_path))
 
     def get_parser_by_type(self, file_type: FileType) -> Optional[DocumentParser]:
-        return self.get_parser(f"file.{file_type.value}")
+        return self._by_type.get(file_type)
 
     def is_supported(self, file_path: str) -> bool:
-        return self.get_parser(file_path) is not None
+        return self._get_extension(file_path) in self._by_ext
 
     def supported_extensions(self) -> list[str]:
         return FileType.supported_extensions()
 
     def _get_extension(self, file_path: str) -> str:
-        _, ext = os.path.splitext(file_path)
-        return ext.lower().lstrip(".")
+        head, separator, extension = os.path.basename(file_path).rpartition(".")
+        return extension.lower() if separator and head else ""
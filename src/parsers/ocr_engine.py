@@ -1,8 +1,10 @@
 import os
+import threading
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional, Union
 
 from src.models import ParseResult, ExtractionMethod, ErrorScenario
+from src.utils.process_pool import map_in_process_pool, process_pool_size
 
 @dataclass
 class OCRResult:
@@ -15,6 +17,8 @@ class OCREngine:
 
     DEFAULT_LANGUAGE = "rus+eng"
 
+    PDF_RENDER_DPI = 150
+
     def __init__(
         self,
         engine: str = "tesseract",
@@ -34,11 +38,11 @@ class OCREngine:
             except ImportError:
                 pass
 
-    def extract_text(self, image_path: str) -> OCRResult:
+    def extract_text(self, image: Union[str, os.PathLike, Any]) -> OCRResult:
         if self.engine == "tesseract":
-            return self._extract_with_tesseract(image_path)
+            return self._extract_with_tesseract(image)
         elif self.engine == "google_vision":
-            return self._extract_with_google_vision(image_path)
+            return self._extract_with_google_vision(image)
         else:
             return OCRResult(
                 text="",
@@ -46,9 +50,11 @@ class OCREngine:
                 error_message=f"Unsupported OCR engine: {self.engine}",
             )
 
-    def _extract_with_tesseract(self, image_path: str) -> OCRResult:
+    def _extract_with_tesseract(self, image: Union[str, os.PathLike, Any]) -> OCRResult:
+        if not isinstance(image, (str, os.PathLike)):
+            return _ocr_image(image, self.language)
+
         try:
-            import pytesseract
             from PIL import Image
         except ImportError as e:
             return OCRResult(
@@ -58,34 +64,7 @@ class OCREngine:
             )
 
         try:
-            image = Image.open(image_path)
-
-            data = pytesseract.image_to_data(
-                image,
-                lang=self.language,
-                output_type=pytesseract.Output.DICT,
-            )
-
-            confidences = [
-                conf for conf in data["conf"]
-                if isinstance(conf, (int, float)) and conf >= 0
-            ]
-            avg_confidence = (
-                sum(confidences) / len(confidences)
-                if confidences else None
-            )
-
-            text = pytesseract.image_to_string(
-                image,
-                lang=self.language,
-            )
-
-            return OCRResult(
-                text=text.strip(),
-                confidence=avg_confidence,
-                success=True,
-            )
-
+            image = Image.open(image)
         except Exception as e:
             return OCRResult(
                 text="",
@@ -93,13 +72,28 @@ class OCREngine:
                 error_message=f"Tesseract OCR failed: {e}",
             )
 
-    def _extract_with_google_vision(self, image_path: str) -> OCRResult:
+        return _ocr_image(image, self.language)
+
+    def _extract_with_google_vision(self, image: Union[str, os.PathLike, Any]) -> OCRResult:
         return OCRResult(
             text="",
             success=False,
             error_message="Google Vision OCR not implemented yet",
         )
 
+    def _recognize_pages(self, images: list[Any]) -> list[OCRResult]:
+        page_count = len(images)
+
+        if self.engine != "tesseract" or min(page_count, process_pool_size()) < 2:
+            return [self.extract_text(image) for image in images]
+
+        return map_in_process_pool(
+            _ocr_page,
+            images,
+            [self.language] * page_count,
+            [self.tesseract_path] * page_count,
+        )
+
     def process_pdf_pages(self, pdf_path: str) -> ParseResult:
         try:
             import pdf2image
@@ -115,7 +109,12 @@ class OCREngine:
             )
 
         try:
-            images = pdf2image.convert_from_path(pdf_path)
+            images = pdf2image.convert_from_path(
+                pdf_path,
+                dpi=self.PDF_RENDER_DPI,
+                grayscale=True,
+                thread_count=os.cpu_count() or 1,
+            )
 
             if not images:
                 return ParseResult(
@@ -131,19 +130,11 @@ class OCREngine:
             text_parts: list[str] = []
             confidences: list[float] = []
 
-            for i, image in enumerate(images):
-                temp_path = f"_temp_page_{i}.png"
-                try:
-                    image.save(temp_path, "PNG")
-                    result = self.extract_text(temp_path)
-
-                    if result.success and result.text:
-                        text_parts.append(result.text)
-                        if result.confidence is not None:
-                            confidences.append(result.confidence)
-                finally:
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
+            for result in self._recognize_pages(images):
+                if result.success and result.text:
+                    text_parts.append(result.text)
+                    if result.confidence is not None:
+                        confidences.append(result.confidence)
 
             full_text = "\n\n".join(text_parts)
             char_count = len(full_text)
@@ -208,3 +199,126 @@ class OCREngine:
                 error_scenario=ErrorScenario.OCR_FAILED,
                 used_ocr=True,
             )
+
+def _ocr_page(image: Any, language: str, tesseract_path: Optional[str]) -> OCRResult:
+    if tesseract_path:
+        try:
+            import pytesseract
+            pytesseract.pytesseract.tesseract_cmd = tesseract_path
+        except ImportError:
+            pass
+
+    return _ocr_image(image, language)
+
+_tesserocr_local = threading.local()
+
+def _get_tesserocr_api(language: str) -> Any:
+    try:
+        import tesserocr
+    except ImportError:
+        return None
+
+    apis = _tesserocr_local.__dict__.setdefault("apis", {})
+    api = apis.get(language)
+    if api is None:
+        try:
+            api = tesserocr.PyTessBaseAPI(lang=language)
+        except Exception:
+            return None
+        apis[language] = api
+    return api
+
+def _ocr_image(image: Any, language: str) -> OCRResult:
+    api = _get_tesserocr_api(language)
+    if api is not None:
+        return _ocr_with_tesserocr(api, image)
+
+    return _ocr_with_pytesseract(image, language)
+
+def _ocr_with_tesserocr(api: Any, image: Any) -> OCRResult:
+    try:
+        api.SetImage(image)
+        text = api.GetUTF8Text()
+        confidence = api.MeanTextConf()
+
+        return OCRResult(
+            text=text.strip(),
+            confidence=float(confidence) if confidence >= 0 else None,
+            success=True,
+        )
+
+    except Exception as e:
+        return OCRResult(
+            text="",
+            success=False,
+            error_message=f"Tesseract OCR failed: {e}",
+        )
+
+def _ocr_with_pytesseract(image: Any, language: str) -> OCRResult:
+    try:
+        import pytesseract
+    except ImportError as e:
+        return OCRResult(
+            text="",
+            success=False,
+            error_message=f"Required library not installed: {e}",
+        )
+
+    try:
+        data = pytesseract.image_to_data(
+            image,
+            lang=language,
+            output_type=pytesseract.Output.DICT,
+        )
+
+        confidences = [
+            conf for conf in data["conf"]
+            if isinstance(conf, (int, float)) and conf >= 0
+        ]
+        avg_confidence = (
+            sum(confidences) / len(confidences)
+            if confidences else None
+        )
+
+        text = _join_tesseract_words(data)
+
+        return OCRResult(
+            text=text.strip(),
+            confidence=avg_confidence,
+            success=True,
+        )
+
+    except Exception as e:
+        return OCRResult(
+            text="",
+            success=False,
+            error_message=f"Tesseract OCR failed: {e}",
+        )
+
+def _join_tesseract_words(data: dict[str, list[Any]]) -> str:
+    lines: list[str] = []
+    words: list[str] = []
+    line_key = None
+    paragraph_key = None
+
+    for word, block, paragraph, line in zip(
+        data["text"], data["block_num"], data["par_num"], data["line_num"]
+    ):
+        if not word or not word.strip():
+            continue
+
+        if (block, paragraph, line) != line_key:
+            if words:
+                lines.append(" ".join(words))
+                words = []
+            if paragraph_key is not None and (block, paragraph) != paragraph_key:
+                lines.append("")
+            line_key = (block, paragraph, line)
+            paragraph_key = (block, paragraph)
+
+        words.append(word)
+
+    if words:
+        lines.append(" ".join(words))
+
+    return "\n".join(lines)
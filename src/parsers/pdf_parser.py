@@ -1,16 +1,30 @@
-from typing import Optional
+import io
+from typing import Any, Iterable, Iterator, Optional
 
 from src.models import ParseResult, ExtractionMethod, ErrorScenario
 from src.parsers.base import DocumentParser
+from src.utils.process_pool import map_in_process_pool, process_pool_size
 
 class PDFParser(DocumentParser):
 
     OCR_THRESHOLD = 50
 
+    OCR_SAMPLE_SIZE = 1024
+
+    PAGE_SEPARATOR = "\n\n"
+
+    PARALLEL_MIN_PAGES = 16
+
+    TEXT_TOLERANCE = 3
+
     def supports(self, file_extension: str) -> bool:
         return self._normalize_extension(file_extension) == "pdf"
 
     def parse(self, file_path: str) -> ParseResult:
+        fast_result = self._parse_with_pdfium(file_path)
+        if fast_result is not None:
+            return fast_result
+
         try:
             import pdfplumber
         except ImportError:
@@ -24,16 +38,10 @@ class PDFParser(DocumentParser):
             )
 
         try:
-            text_parts: list[str] = []
-
             with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-
-            full_text = "\n\n".join(text_parts)
-            char_count = len(full_text)
+                full_text, char_count = self._join_pages(
+                    self._iter_page_texts(pdf, file_path)
+                )
 
             if char_count == 0:
                 return ParseResult(
@@ -74,5 +82,99 @@ class PDFParser(DocumentParser):
                 error_scenario=ErrorScenario.CORRUPTED_FILE,
             )
 
+    def _parse_with_pdfium(self, file_path: str) -> Optional[ParseResult]:
+        try:
+            import pypdfium2 as pdfium
+        except ImportError:
+            return None
+
+        try:
+            pdf = pdfium.PdfDocument(file_path)
+        except Exception:
+            return None
+
+        try:
+            full_text, char_count = self._join_pages(_extract_pdfium_texts(pdf))
+        except Exception:
+            return None
+        finally:
+            pdf.close()
+
+        if self.needs_ocr_by_count(char_count) or self.needs_ocr(full_text):
+            return None
+
+        return ParseResult(
+            text=full_text,
+            char_count=char_count,
+            success=True,
+            extraction_method=ExtractionMethod.PYPDFIUM2,
+        )
+
+    def _join_pages(self, page_texts: Iterable[Optional[str]]) -> tuple[str, int]:
+        buffer = io.StringIO()
+        char_count = 0
+
+        for page_text in page_texts:
+            if page_text:
+                if char_count:
+                    char_count += buffer.write(self.PAGE_SEPARATOR)
+                char_count += buffer.write(page_text)
+
+        return buffer.getvalue(), char_count
+
+    def _iter_page_texts(self, pdf: Any, file_path: str) -> Iterator[Optional[str]]:
+        page_count = len(pdf.pages)
+        workers = min(process_pool_size(), page_count // self.PARALLEL_MIN_PAGES)
+
+        if workers < 2:
+            yield from _extract_page_texts(pdf.pages)
+            return
+
+        step = -(-page_count // workers)
+        starts = range(0, page_count, step)
+        stops = [min(start + step, page_count) for start in starts]
+
+        for page_texts in map_in_process_pool(
+            _extract_page_range,
+            [file_path] * len(starts),
+            starts,
+            stops,
+        ):
+            yield from page_texts
+
+    def needs_ocr_by_count(self, char_count: int) -> bool:
+        return char_count < self.OCR_THRESHOLD
+
     def needs_ocr(self, text: str) -> bool:
+        head = text[:self.OCR_SAMPLE_SIZE]
+        if len(head.strip()) >= self.OCR_THRESHOLD:
+            return False
+
+        if len(text) <= self.OCR_SAMPLE_SIZE:
+            return True
+
         return len(text.strip()) < self.OCR_THRESHOLD
+
+def _extract_pdfium_texts(pdf: Any) -> Iterator[str]:
+    for page in pdf:
+        textpage = page.get_textpage()
+        try:
+            yield textpage.get_text_range().replace("\r\n", "\n")
+        finally:
+            textpage.close()
+            page.close()
+
+def _extract_page_texts(pages: Iterable[Any]) -> Iterator[Optional[str]]:
+    for page in pages:
+        page_text = page.extract_text_simple(
+            x_tolerance=PDFParser.TEXT_TOLERANCE,
+            y_tolerance=PDFParser.TEXT_TOLERANCE,
+        )
+        page.close()
+        yield page_text
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> list[Optional[str]]:
+    import pdfplumber
+
+    with pdfplumber.open(file_path, pages=range(start + 1, stop + 1)) as pdf:
+        return list(_extract_page_texts(pdf.pages))
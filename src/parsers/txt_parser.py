@@ -1,3 +1,7 @@
+import codecs
+import mmap
+from typing import Iterator, Union
+
 from src.models import ParseResult, ExtractionMethod, ErrorScenario
 from src.parsers.base import DocumentParser
 
@@ -5,100 +9,80 @@ class TXTParser(DocumentParser):
 
     FALLBACK_ENCODINGS = ["utf-8", "cp1251", "latin-1", "cp1252"]
 
+    DETECTION_SAMPLE_SIZE = 64 * 1024
+
+    BOM_ENCODINGS = (
+        (codecs.BOM_UTF8, "utf-8-sig"),
+        (codecs.BOM_UTF32_LE, "utf-32"),
+        (codecs.BOM_UTF32_BE, "utf-32"),
+        (codecs.BOM_UTF16_LE, "utf-16"),
+        (codecs.BOM_UTF16_BE, "utf-16"),
+    )
+
     def supports(self, file_extension: str) -> bool:
         return self._normalize_extension(file_extension) == "txt"
 
     def parse(self, file_path: str) -> ParseResult:
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                text = f.read()
-
-            char_count = len(text)
-            if char_count == 0:
-                return ParseResult(
-                    text="",
-                    char_count=0,
-                    success=False,
-                    extraction_method=ExtractionMethod.PLAIN_READ,
-                    error_message="Document is empty",
-                    error_scenario=ErrorScenario.EMPTY_DOCUMENT,
+            with self._open_buffer(file_path) as data:
+                text, last_error = self._decode_first(
+                    data, self._candidate_encodings(data)
                 )
+        except Exception as e:
+            return ParseResult(
+                text="",
+                char_count=0,
+                success=False,
+                extraction_method=ExtractionMethod.PLAIN_READ,
+                error_message=f"Failed to read TXT file: {e}",
+                error_scenario=ErrorScenario.CORRUPTED_FILE,
+            )
 
+        if text is None:
             return ParseResult(
-                text=text,
-                char_count=char_count,
-                success=True,
+                text="",
+                char_count=0,
+                success=False,
                 extraction_method=ExtractionMethod.PLAIN_READ,
+                error_message=f"Failed to decode file with any encoding: {last_error}",
+                error_scenario=ErrorScenario.CORRUPTED_FILE,
             )
-        except UnicodeDecodeError:
-            pass
 
-        encoding = self._detect_encoding(file_path)
+        return self.parse_text(text)
+
+    def _candidate_encodings(self, data: Union[bytes, mmap.mmap]) -> Iterator[str]:
+        yield "utf-8"
+
+        encoding = self._detect_encoding(data)
+        if encoding and encoding.lower() != "utf-8":
+            yield encoding
 
-        encodings_to_try = [encoding] if encoding and encoding.lower() != "utf-8" else []
-        encodings_to_try.extend(
+        yield from (
             e for e in self.FALLBACK_ENCODINGS if e != encoding and e != "utf-8"
         )
 
-        last_error = None
-        for enc in encodings_to_try:
-            try:
-                with open(file_path, "r", encoding=enc) as f:
-                    text = f.read()
-
-                char_count = len(text)
-
-                if char_count == 0:
-                    return ParseResult(
-                        text="",
-                        char_count=0,
-                        success=False,
-                        extraction_method=ExtractionMethod.PLAIN_READ,
-                        error_message="Document is empty",
-                        error_scenario=ErrorScenario.EMPTY_DOCUMENT,
-                    )
-
-                return ParseResult(
-                    text=text,
-                    char_count=char_count,
-                    success=True,
-                    extraction_method=ExtractionMethod.PLAIN_READ,
-                )
+    def _detect_encoding(self, data: Union[bytes, mmap.mmap]) -> str | None:
+        sample = data[:self.DETECTION_SAMPLE_SIZE]
 
-            except (UnicodeDecodeError, LookupError) as e:
-                last_error = e
-                continue
-            except Exception as e:
-                return ParseResult(
-                    text="",
-                    char_count=0,
-                    success=False,
-                    extraction_method=ExtractionMethod.PLAIN_READ,
-                    error_message=f"Failed to read TXT file: {e}",
-                    error_scenario=ErrorScenario.CORRUPTED_FILE,
-                )
+        for bom, encoding in self.BOM_ENCODINGS:
+            if sample.startswith(bom):
+                return encoding
 
-        return ParseResult(
-            text="",
-            char_count=0,
-            success=False,
-            extraction_method=ExtractionMethod.PLAIN_READ,
-            error_message=f"Failed to decode file with any encoding: {last_error}",
-            error_scenario=ErrorScenario.CORRUPTED_FILE,
-        )
+        try:
+            from charset_normalizer import from_bytes
+
+            match = from_bytes(sample).best()
+            if match is not None:
+                return match.encoding
+        except Exception:
+            pass
 
-    def _detect_encoding(self, file_path: str) -> str | None:
         try:
             import chardet
 
-            with open(file_path, "rb") as f:
-                raw_data = f.read()
-
-            result = chardet.detect(raw_data)
+            result = chardet.detect(sample)
             if result and result.get("encoding"):
                 return result["encoding"]
-        except ImportError:
-            pass
         except Exception:
             pass
 
@@ -1,11 +1,15 @@
+import asyncio
 import os
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from typing import Any, BinaryIO, Callable, Dict, Optional
 from urllib.parse import urlparse
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 
 from src.ai.keyword_extractor import KeywordExtractor
 from src.ai.language_detector import LanguageDetector
@@ -27,21 +31,32 @@ from src.models.results import (
     SummaryResult,
     ValidationResult,
 )
-from src.models.storage import GoogleSheetsRow
+from src.models.storage import GoogleSheetsRow, RowInfo
 from src.parsers.factory import ParserFactory
 from src.storage.google_sheets import GoogleSheetsStorage
 from src.utils.logger import ProcessingLogger
 from src.utils.retry_handler import RetryHandler
+from src.utils.temp_files import resolve_temp_dir, temp_dir_for_size
 from src.utils.validators import validate_file, validate_url
 
 class DocumentProcessor:
 
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+    HTTP_POOL_CONNECTIONS = 10
+    HTTP_POOL_MAXSIZE = 20
+
     def __init__(
         self,
         config: WorkflowConfig,
         logger: Optional[ProcessingLogger] = None,
     ) -> None:
         self.config = config
+        self.temp_dir = resolve_temp_dir(config.temp_dir)
+        self._http = self._create_http_session()
+        self._keyword_executor = ThreadPoolExecutor(
+            thread_name_prefix="keyword-extractor",
+        )
 
         self.parser_factory = ParserFactory()
         self.language_detector = LanguageDetector()
@@ -68,6 +83,25 @@ class DocumentProcessor:
             retry_config=retry_config,
         )
 
+    def _create_http_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.HTTP_POOL_MAXSIZE,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self) -> None:
+        self._http.close()
+        self._keyword_executor.shutdown(wait=False, cancel_futures=True)
+        self.sheets_storage.close()
+
+    async def aclose(self) -> None:
+        self.close()
+        await self.summarizer.aclose()
+
     def _create_summarizer(self) -> OpenAISummarizer:
         if self.config.ai_provider == "openrouter":
             return OpenAISummarizer(
@@ -93,12 +127,56 @@ class DocumentProcessor:
     ) -> ProcessingResult:
         start_time = time.time()
 
-        self.logger.log_upload(metadata)
+        parse_result, language = self._extract_stage(file_path, metadata, on_progress)
 
-        if on_progress:
-            on_progress(self.notification_service.get_processing_started_message())
+        if not parse_result.success:
+            return self._create_failed_result(
+                metadata=metadata,
+                parse_result=parse_result,
+                processing_time=time.time() - start_time,
+                error_scenario=parse_result.error_scenario,
+            )
 
-        parse_result = self._parse_document(file_path, metadata.file_type)
+        keywords_future = self._keyword_executor.submit(
+            self._extract_keywords, parse_result.text, language
+        )
+
+        summary_result = self._summarize_with_retry(parse_result.text, language)
+
+        if not summary_result.success:
+            keywords_future.cancel()
+            return self._create_failed_result(
+                metadata=metadata,
+                parse_result=parse_result,
+                summary_result=summary_result,
+                processing_time=time.time() - start_time,
+                error_scenario=summary_result.error_scenario,
+            )
+
+        result = self._complete_stage(
+            metadata,
+            parse_result,
+            summary_result,
+            keywords_future.result(),
+            start_time,
+        )
+
+        if result.status == ProcessingStatus.COMPLETED:
+            self._save_stage(result)
+
+        return result
+
+    async def process_document_async(
+        self,
+        file_path: str,
+        metadata: Metadata,
+        on_progress: Optional[Callable[[str], None]] = None,
+    ) -> ProcessingResult:
+        start_time = time.time()
+
+        parse_result, language = await asyncio.to_thread(
+            self._extract_stage, file_path, metadata, on_progress
+        )
 
         if not parse_result.success:
             return self._create_failed_result(
@@ -108,20 +186,19 @@ class DocumentProcessor:
                 error_scenario=parse_result.error_scenario,
             )
 
-        self.logger.log_extraction(
-            status="success",
-            char_count=parse_result.char_count,
-            extraction_method=parse_result.extraction_method.value,
-            used_ocr=parse_result.used_ocr,
-            file_name=metadata.file_name,
+        keywords_future = asyncio.get_running_loop().run_in_executor(
+            self._keyword_executor,
+            self._extract_keywords,
+            parse_result.text,
+            language,
         )
 
-        language = self.language_detector.detect(parse_result.text)
-        metadata.language = language
-
-        summary_result = self._summarize_with_retry(parse_result.text, language)
+        summary_result = await self._summarize_with_retry_async(
+            parse_result.text, language
+        )
 
         if not summary_result.success:
+            keywords_future.cancel()
             return self._create_failed_result(
                 metadata=metadata,
                 parse_result=parse_result,
@@ -130,6 +207,56 @@ class DocumentProcessor:
                 error_scenario=summary_result.error_scenario,
             )
 
+        result = self._complete_stage(
+            metadata,
+            parse_result,
+            summary_result,
+            await keywords_future,
+            start_time,
+        )
+
+        if result.status == ProcessingStatus.COMPLETED:
+            await self._save_stage_async(result)
+
+        return result
+
+    def _extract_stage(
+        self,
+        file_path: str,
+        metadata: Metadata,
+        on_progress: Optional[Callable[[str], None]],
+    ) -> tuple[ParseResult, Optional[str]]:
+        self.logger.log_upload(metadata)
+
+        if on_progress:
+            on_progress(self.notification_service.get_processing_started_message())
+
+        parse_result = self._parse_document(file_path, metadata.file_type)
+
+        if not parse_result.success:
+            return parse_result, None
+
+        self.logger.log_extraction(
+            status="success",
+            char_count=parse_result.char_count,
+            extraction_method=parse_result.extraction_method.value,
+            used_ocr=parse_result.used_ocr,
+            file_name=metadata.file_name,
+        )
+
+        language = self.language_detector.detect(parse_result.text)
+        metadata.language = language
+
+        return parse_result, language
+
+    def _complete_stage(
+        self,
+        metadata: Metadata,
+        parse_result: ParseResult,
+        summary_result: SummaryResult,
+        keywords_result: KeywordsResult,
+        start_time: float,
+    ) -> ProcessingResult:
         self.logger.log_api_call(
             service=self.config.ai_provider,
             status="success",
@@ -137,8 +264,6 @@ class DocumentProcessor:
             tokens_used=summary_result.tokens_used,
         )
 
-        keywords_result = self._extract_keywords(parse_result.text, language)
-
         if not keywords_result.success:
             return self._create_failed_result(
                 metadata=metadata,
@@ -153,7 +278,7 @@ class DocumentProcessor:
             extraction_method=keywords_result.extraction_method,
             keyword_count=keywords_result.count,
             status="success",
-            language=language,
+            language=metadata.language,
         )
 
         processing_time = time.time() - start_time
@@ -167,20 +292,36 @@ class DocumentProcessor:
             processing_time=processing_time,
         )
 
+        return result
+
+    def _save_stage(self, result: ProcessingResult) -> None:
         try:
             row_info = self.sheets_storage.save_result(result)
-            self.logger.log_sheets_write(
-                status="success",
-                row_number=row_info.row_number,
-            )
         except Exception as e:
-            self.logger.log_error(
-                error_type="GoogleSheetsError",
-                message=str(e),
-                error_scenario=ErrorScenario.SHEETS_WRITE_ERROR,
-            )
+            self._log_sheets_error(e)
+        else:
+            self._log_sheets_write(row_info)
 
-        return result
+    async def _save_stage_async(self, result: ProcessingResult) -> None:
+        try:
+            row_info = await self.sheets_storage.save_result_async(result)
+        except Exception as e:
+            self._log_sheets_error(e)
+        else:
+            self._log_sheets_write(row_info)
+
+    def _log_sheets_write(self, row_info: RowInfo) -> None:
+        self.logger.log_sheets_write(
+            status="success",
+            row_number=row_info.row_number,
+        )
+
+    def _log_sheets_error(self, error: Exception) -> None:
+        self.logger.log_error(
+            error_type="GoogleSheetsError",
+            message=str(error),
+            error_scenario=ErrorScenario.SHEETS_WRITE_ERROR,
+        )
 
     def _parse_document(
         self,
@@ -231,24 +372,43 @@ class DocumentProcessor:
                 retryable_errors=(Exception,),
             )
         except Exception as e:
-            self.logger.log_error(
-                error_type="SummarizationError",
-                message=str(e),
-                error_scenario=ErrorScenario.API_ERROR,
-            )
-            self.logger.log_api_call(
-                service=self.config.ai_provider,
-                status="error",
-            )
-            return SummaryResult(
-                summary="",
-                sentence_count=0,
-                language=language,
-                success=False,
-                ai_model_used=AIModel.OPENAI_GPT4,
-                error_message=str(e),
-                error_scenario=ErrorScenario.API_ERROR,
+            return self._summary_error_result(e, language)
+
+    async def _summarize_with_retry_async(
+        self,
+        text: str,
+        language: str,
+    ) -> SummaryResult:
+        try:
+            async def summarize_func() -> SummaryResult:
+                return await self.summarizer.summarize_async(text, language)
+
+            return await self.retry_handler.execute_with_retry_async(
+                summarize_func,
+                retryable_errors=(Exception,),
             )
+        except Exception as e:
+            return self._summary_error_result(e, language)
+
+    def _summary_error_result(self, error: Exception, language: str) -> SummaryResult:
+        self.logger.log_error(
+            error_type="SummarizationError",
+            message=str(error),
+            error_scenario=ErrorScenario.API_ERROR,
+        )
+        self.logger.log_api_call(
+            service=self.config.ai_provider,
+            status="error",
+        )
+        return SummaryResult(
+            summary="",
+            sentence_count=0,
+            language=language,
+            success=False,
+            ai_model_used=AIModel.OPENAI_GPT4,
+            error_message=str(error),
+            error_scenario=ErrorScenario.API_ERROR,
+        )
 
     def _extract_keywords(
         self,
@@ -345,34 +505,56 @@ class DocumentProcessor:
             return None, None, validation.error_scenario
 
         try:
-            response = requests.get(url, timeout=timeout, stream=True)
-            response.raise_for_status()
-
-            file_name = self._extract_filename_from_response(url, response)
-
-            if not file_name:
-                return None, None, ErrorScenario.URL_INVALID
-
-            if not self.parser_factory.is_supported(file_name):
-                return None, None, ErrorScenario.UNSUPPORTED_FORMAT
-
-            suffix = os.path.splitext(file_name)[1]
-            with tempfile.NamedTemporaryFile(
-                delete=False,
-                suffix=suffix,
-            ) as tmp_file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    tmp_file.write(chunk)
+            with self._http.get(url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+
+                file_name = self._extract_filename_from_response(url, response)
+
+                if not file_name:
+                    return None, None, ErrorScenario.URL_INVALID
+
+                _, separator, extension = file_name.rpartition(".")
+                file_type = FileType.from_extension(extension) if separator else None
+                if file_type is None or self.parser_factory.get_parser_by_type(file_type) is None:
+                    return None, None, ErrorScenario.UNSUPPORTED_FORMAT
+
+                suffix = f".{file_type.value}"
+                max_size = self.config.max_file_size_mb * 1024 * 1024
+                content_length = response.headers.get("Content-Length", "")
+                expected_size = int(content_length) if content_length.isdigit() else None
+                if expected_size is not None and expected_size > max_size:
+                    return None, None, ErrorScenario.FILE_TOO_LARGE
+
+                with tempfile.NamedTemporaryFile(
+                    delete=False,
+                    suffix=suffix,
+                    dir=temp_dir_for_size(self.temp_dir, expected_size),
+                ) as tmp_file:
+                    response.raw.decode_content = True
+                    try:
+                        error = self._copy_download(response.raw, tmp_file, max_size)
+                    except OSError as e:
+                        self.logger.log_error(
+                            error_type="URLDownloadError",
+                            message=f"Failed to store download: {e}",
+                            error_scenario=ErrorScenario.URL_INVALID,
+                            context={"url": url},
+                        )
+                        error = ErrorScenario.URL_INVALID
+
+                if error is not None:
+                    os.unlink(tmp_file.name)
+                    return None, None, error
                 return tmp_file.name, file_name, None
 
-        except requests.exceptions.Timeout:
+        except (requests.exceptions.Timeout, urllib3.exceptions.TimeoutError):
             self.logger.log_error(
                 error_type="URLDownloadError",
                 message=f"Timeout downloading from {url}",
                 error_scenario=ErrorScenario.URL_INVALID,
             )
             return None, None, ErrorScenario.URL_INVALID
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
             self.logger.log_error(
                 error_type="URLDownloadError",
                 message=str(e),
@@ -381,6 +563,20 @@ class DocumentProcessor:
             )
             return None, None, ErrorScenario.URL_INVALID
 
+    def _copy_download(
+        self,
+        source: BinaryIO,
+        target: BinaryIO,
+        max_size: int,
+    ) -> Optional[ErrorScenario]:
+        written = 0
+        while chunk := source.read(self.DOWNLOAD_CHUNK_SIZE):
+            written += len(chunk)
+            if written > max_size:
+                return ErrorScenario.FILE_TOO_LARGE
+            target.write(chunk)
+        return None
+
     def _extract_filename_from_response(
         self,
         url: str,
@@ -1,6 +1,7 @@
-from src.storage.google_sheets import GoogleSheetsStorage, GoogleSheetsStorageError
+from src.storage.google_sheets import GoogleSheetsStorage, GoogleSheetsStorageError, SheetsBatch
 
 __all__ = [
     "GoogleSheetsStorage",
     "GoogleSheetsStorageError",
+    "SheetsBatch",
 ]
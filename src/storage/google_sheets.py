@@ -1,9 +1,17 @@
+import asyncio
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
 
 import gspread
+import requests
+from gspread.utils import a1_to_rowcol
+from google.auth.exceptions import TransportError
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
 
 from src.models.config import RetryConfig
 from src.models.enums import ErrorScenario
@@ -26,6 +34,36 @@ class GoogleSheetsStorage:
         'https://www.googleapis.com/auth/drive',
     ]
 
+    HEADERS = (
+        "Timestamp",
+        "Uploader ID",
+        "Uploader Username",
+        "File Name",
+        "File Type",
+        "File Size (bytes)",
+        "Character Count",
+        "Language",
+        "Summary",
+        "Keywords",
+        "Status",
+        "Error Message",
+        "AI Model Used",
+        "Extraction Method",
+        "OCR Used",
+        "Processing Time (s)",
+    )
+    HEADER_RANGE = "A1:P1"
+
+    RETRYABLE_ERRORS = (
+        gspread.exceptions.APIError,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        TransportError,
+    )
+
+    HTTP_POOL_CONNECTIONS = 4
+    HTTP_POOL_MAXSIZE = 16
+
     def __init__(
         self,
         credentials_path: str,
@@ -40,21 +78,31 @@ class GoogleSheetsStorage:
         self.retry_handler = RetryHandler(self.retry_config)
 
         self._client: Optional[gspread.Client] = None
+        self._session: Optional[AuthorizedSession] = None
         self._spreadsheet: Optional[gspread.Spreadsheet] = None
         self._worksheet: Optional[gspread.Worksheet] = None
         self._authenticated = False
+        self._auth_lock = threading.RLock()
+
+        self._row_count: Optional[int] = None
+        self._row_count_lock = threading.Lock()
 
     @property
     def is_authenticated(self) -> bool:
         return self._authenticated and self._client is not None
 
     def authenticate(self) -> bool:
+        with self._auth_lock:
+            return self._authenticate()
+
+    def _authenticate(self) -> bool:
         try:
             credentials = Credentials.from_service_account_file(
                 self.credentials_path,
                 scopes=self.SCOPES,
             )
-            self._client = gspread.authorize(credentials)
+            self._session = self._create_session(credentials)
+            self._client = gspread.authorize(credentials, session=self._session)
             self._spreadsheet = self._client.open_by_key(self.spreadsheet_id)
 
             try:
@@ -67,6 +115,7 @@ class GoogleSheetsStorage:
                 )
                 self._setup_headers()
 
+            self._row_count = None
             self._authenticated = True
             logger.info(
                 f"Successfully authenticated with Google Sheets: {self.spreadsheet_id}"
@@ -86,106 +135,173 @@ class GoogleSheetsStorage:
                 ErrorScenario.SHEETS_AUTH_ERROR,
             ) from e
 
+    def _create_session(self, credentials: Credentials) -> AuthorizedSession:
+        if self._session is not None:
+            self._session.close()
+
+        session = AuthorizedSession(credentials)
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=self.HTTP_POOL_CONNECTIONS,
+                pool_maxsize=self.HTTP_POOL_MAXSIZE,
+            ),
+        )
+        return session
+
     def _setup_headers(self) -> None:
-        headers = [
-            "Timestamp",
-            "Uploader ID",
-            "Uploader Username",
-            "File Name",
-            "File Type",
-            "File Size (bytes)",
-            "Character Count",
-            "Language",
-            "Summary",
-            "Keywords",
-            "Status",
-            "Error Message",
-            "AI Model Used",
-            "Extraction Method",
-            "OCR Used",
-            "Processing Time (s)",
-        ]
         if self._worksheet:
-            self._worksheet.update('A1:P1', [headers])
+            self._worksheet.update(
+                values=[list(self.HEADERS)],
+                range_name=self.HEADER_RANGE,
+                value_input_option="RAW",
+                major_dimension="ROWS",
+            )
 
     def _ensure_authenticated(self) -> None:
-        if not self.is_authenticated:
-            self.authenticate()
+        if self.is_authenticated:
+            return
+
+        with self._auth_lock:
+            if not self.is_authenticated:
+                self._authenticate()
 
     def save_result(self, result: ProcessingResult) -> RowInfo:
-        self._ensure_authenticated()
+        return self._save_row(self._result_to_row(result))
 
+    async def save_result_async(self, result: ProcessingResult) -> RowInfo:
         row = self._result_to_row(result)
 
-        if not row.has_required_fields():
-            raise GoogleSheetsStorageError(
-                "Row missing required fields",
-                ErrorScenario.SHEETS_WRITE_ERROR,
-            )
+        if not self.is_authenticated:
+            await asyncio.to_thread(self._ensure_authenticated)
 
-        return self._retry_write(row)
+        return (await self._retry_write_async([row]))[0]
 
-    def _result_to_row(self, result: ProcessingResult) -> GoogleSheetsRow:
-        return GoogleSheetsRow(
-            timestamp=result.metadata.timestamp.isoformat(),
-            uploader_id=str(result.metadata.uploader_id),
-            uploader_username=result.metadata.uploader_username or "",
-            file_name=result.metadata.file_name,
-            file_type=result.metadata.file_type.value,
-            file_size=result.metadata.file_size,
-            char_count=result.parse_result.char_count,
-            language=result.summary_result.language,
-            summary=result.summary_result.summary,
-            keywords=result.keywords_result.formatted,
-            status=result.status.value,
-            error_message=result.summary_result.error_message or "",
-            ai_model_used=result.summary_result.ai_model_used.value,
-            extraction_method=result.parse_result.extraction_method.value,
-            ocr_used=result.parse_result.used_ocr,
-            processing_time=result.processing_time,
-        )
+    def save_results(self, results: Iterable[ProcessingResult]) -> list[RowInfo]:
+        self._ensure_authenticated()
 
-    def _retry_write(self, row: GoogleSheetsRow) -> RowInfo:
-        def write_operation() -> RowInfo:
-            if not self._worksheet:
-                raise GoogleSheetsStorageError(
-                    "Worksheet not initialized",
-                    ErrorScenario.SHEETS_WRITE_ERROR,
-                )
+        rows = [self._result_to_row(result) for result in results]
 
-            row_data = row.to_list()
-            self._worksheet.append_row(row_data)
+        if not rows:
+            return []
 
-            row_count = len(self._worksheet.get_all_values())
+        return self._retry_write(rows)
 
-            return RowInfo(
-                row_number=row_count,
-                timestamp=datetime.now(),
-                success=True,
-            )
+    @contextmanager
+    def batch(self) -> Iterator["SheetsBatch"]:
+        pending = SheetsBatch(self)
+        try:
+            yield pending
+        finally:
+            pending.flush()
+
+    def _check_required_fields(self, row: GoogleSheetsRow) -> None:
+        if not row.has_required_fields():
+            raise self._missing_fields_error()
+
+    @staticmethod
+    def _missing_fields_error() -> GoogleSheetsStorageError:
+        return GoogleSheetsStorageError(
+            "Row missing required fields",
+            ErrorScenario.SHEETS_WRITE_ERROR,
+        )
 
+    def _result_to_row(self, result: ProcessingResult) -> GoogleSheetsRow:
+        metadata = result.metadata
+        parse_result = result.parse_result
+        summary_result = result.summary_result
+        keywords = result.keywords_result.formatted
+
+        if not (
+            metadata.file_name
+            and summary_result.summary
+            and keywords
+            and (metadata.uploader_id is not None or metadata.uploader_username)
+        ):
+            raise self._missing_fields_error()
+
+        return GoogleSheetsRow(
+            metadata.timestamp.isoformat(),
+            str(metadata.uploader_id),
+            metadata.uploader_username or "",
+            metadata.file_name,
+            metadata.file_type.value,
+            metadata.file_size,
+            parse_result.char_count,
+            summary_result.language,
+            summary_result.summary,
+            keywords,
+            result.status.value,
+            summary_result.error_message or "",
+            summary_result.ai_model_used.value,
+            parse_result.extraction_method.value,
+            parse_result.used_ocr,
+            result.processing_time,
+        )
+
+    def _retry_write(self, rows: list[GoogleSheetsRow]) -> list[RowInfo]:
         try:
             return self.retry_handler.execute_with_retry(
-                write_operation,
-                retryable_errors=(gspread.exceptions.APIError, Exception),
+                lambda: self._write_rows(rows),
+                retryable_errors=self.RETRYABLE_ERRORS,
             )
         except Exception as e:
-            logger.error(f"Failed to write to Google Sheets after retries: {e}")
-            raise GoogleSheetsStorageError(
-                f"Failed to write to Google Sheets: {e}",
-                ErrorScenario.SHEETS_WRITE_ERROR,
-            ) from e
+            raise self._write_error(e) from e
 
-    def save_row(self, row: GoogleSheetsRow) -> RowInfo:
-        self._ensure_authenticated()
+    async def _retry_write_async(self, rows: list[GoogleSheetsRow]) -> list[RowInfo]:
+        try:
+            return await self.retry_handler.execute_with_retry_async(
+                lambda: asyncio.to_thread(self._write_rows, rows),
+                retryable_errors=self.RETRYABLE_ERRORS,
+            )
+        except Exception as e:
+            raise self._write_error(e) from e
 
-        if not row.has_required_fields():
+    def _write_rows(self, rows: list[GoogleSheetsRow]) -> list[RowInfo]:
+        if not self._worksheet:
             raise GoogleSheetsStorageError(
-                "Row missing required fields",
+                "Worksheet not initialized",
                 ErrorScenario.SHEETS_WRITE_ERROR,
             )
 
-        return self._retry_write(row)
+        response = self._worksheet.append_rows(
+            [row.to_list() for row in rows],
+            value_input_option="RAW",
+            insert_data_option="INSERT_ROWS",
+            table_range=self.HEADER_RANGE,
+        )
+        first_row = self._first_appended_row(response)
+        self._raise_row_count(first_row + len(rows) - 1)
+        timestamp = datetime.now()
+
+        return [
+            RowInfo(
+                row_number=first_row + offset,
+                timestamp=timestamp,
+                success=True,
+            )
+            for offset in range(len(rows))
+        ]
+
+    def _write_error(self, error: Exception) -> GoogleSheetsStorageError:
+        logger.error(f"Failed to write to Google Sheets after retries: {error}")
+        return GoogleSheetsStorageError(
+            f"Failed to write to Google Sheets: {error}",
+            ErrorScenario.SHEETS_WRITE_ERROR,
+        )
+
+    def _first_appended_row(self, response: dict[str, Any]) -> int:
+        updated_range = response["updates"]["updatedRange"]
+        first_cell = updated_range.rpartition("!")[2].partition(":")[0]
+        return a1_to_rowcol(first_cell)[0]
+
+    def save_row(self, row: GoogleSheetsRow) -> RowInfo:
+        self._check_required_fields(row)
+        return self._save_row(row)
+
+    def _save_row(self, row: GoogleSheetsRow) -> RowInfo:
+        self._ensure_authenticated()
+        return self._retry_write([row])[0]
 
     def get_row_count(self) -> int:
         self._ensure_authenticated()
@@ -193,10 +309,72 @@ class GoogleSheetsStorage:
         if not self._worksheet:
             return 0
 
-        return len(self._worksheet.get_all_values())
+        row_count = self._row_count
+        if row_count is None:
+            row_count = self._raise_row_count(len(self._worksheet.col_values(1)))
+
+        return row_count
+
+    def _raise_row_count(self, row_count: int) -> int:
+        with self._row_count_lock:
+            if self._row_count is None or row_count > self._row_count:
+                self._row_count = row_count
+            return self._row_count
+
+    def invalidate_row_count(self) -> None:
+        with self._row_count_lock:
+            self._row_count = None
 
     def close(self) -> None:
-        self._client = None
-        self._spreadsheet = None
-        self._worksheet = None
-        self._authenticated = False
+        with self._auth_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            self._client = None
+            self._spreadsheet = None
+            self._worksheet = None
+            self._row_count = None
+            self._authenticated = False
+
+class SheetsBatch:
+
+    __slots__ = ("_storage", "_rows", "row_infos")
+
+    def __init__(self, storage: GoogleSheetsStorage) -> None:
+        self._storage = storage
+        self._rows: list[GoogleSheetsRow] = []
+        self.row_infos: list[RowInfo] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add_result(self, result: ProcessingResult) -> None:
+        self._rows.append(self._storage._result_to_row(result))
+
+    def add_row(self, row: GoogleSheetsRow) -> None:
+        self._storage._check_required_fields(row)
+        self._rows.append(row)
+
+    def flush(self) -> list[RowInfo]:
+        rows, self._rows = self._rows, []
+
+        if not rows:
+            return []
+
+        self._storage._ensure_authenticated()
+        row_infos = self._storage._retry_write(rows)
+        self.row_infos.extend(row_infos)
+        return row_infos
+
+    async def flush_async(self) -> list[RowInfo]:
+        rows, self._rows = self._rows, []
+
+        if not rows:
+            return []
+
+        if not self._storage.is_authenticated:
+            await asyncio.to_thread(self._storage._ensure_authenticated)
+
+        row_infos = await self._storage._retry_write_async(rows)
+        self.row_infos.extend(row_infos)
+        return row_infos
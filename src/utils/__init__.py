@@ -1,6 +1,7 @@
 from src.utils.retry_handler import RetryHandler
 from src.utils.validators import validate_file_format, validate_file_size, validate_url
 from src.utils.logger import ProcessingLogger
+from src.utils.temp_files import resolve_temp_dir
 
 __all__ = [
     "RetryHandler",
@@ -8,4 +9,5 @@ __all__ = [
     "validate_file_size",
     "validate_url",
     "ProcessingLogger",
+    "resolve_temp_dir",
 ]
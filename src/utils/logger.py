@@ -1,10 +1,15 @@
-import json
-import logging
+import atexit
+import io
 import os
+import sys
+import threading
+import time
 import traceback
+import weakref
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+
+import orjson
 
 from src.models.enums import ErrorScenario
 from src.models.metadata import Metadata
@@ -19,29 +24,101 @@ class ProcessingLogger:
     EVENT_SHEETS_WRITE = "sheets_write"
     EVENT_ERROR = "error"
 
-    def __init__(self, log_file: str = "logs/processing.log"):
-        self.log_file = log_file
-        self._ensure_log_directory()
-        self._setup_logger()
-
-    def _ensure_log_directory(self) -> None:
-        log_dir = Path(self.log_file).parent
-        if log_dir and not log_dir.exists():
-            log_dir.mkdir(parents=True, exist_ok=True)
-
-    def _setup_logger(self) -> None:
-        self.logger = logging.getLogger("processing_logger")
-        self.logger.setLevel(logging.INFO)
-
-        self.logger.handlers.clear()
+    WRITE_BUFFER_SIZE = 64 * 1024
+    FLUSH_INTERVAL_SECONDS = 1.0
+    FLUSH_BATCH_SIZE = 1000
+    TAIL_CHUNK_SIZE = 64 * 1024
 
-        file_handler = logging.FileHandler(self.log_file, encoding="utf-8")
-        file_handler.setLevel(logging.INFO)
+    _instances: "weakref.WeakSet[ProcessingLogger]" = weakref.WeakSet()
+    _flusher: Optional[threading.Thread] = None
+    _flusher_lock = threading.Lock()
+    _flusher_stopping = threading.Event()
 
-        formatter = logging.Formatter("%(message)s")
-        file_handler.setFormatter(formatter)
-
-        self.logger.addHandler(file_handler)
+    def __init__(
+        self,
+        log_file: Optional[str] = "logs/processing.log",
+        batch_size: int = FLUSH_BATCH_SIZE,
+        stream: Optional[BinaryIO] = None,
+    ):
+        self.log_file = None if stream is not None else log_file
+        self.batch_size = max(1, batch_size)
+        self._lock = threading.Lock()
+        self._owns_file = stream is None
+        if stream is not None:
+            self._file = stream
+        else:
+            log_dir = os.path.dirname(self.log_file)
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
+            self._file = open(self.log_file, "ab", buffering=self.WRITE_BUFFER_SIZE)
+        self._last_flush = time.monotonic()
+        self._pending_entries = 0
+        ProcessingLogger._instances.add(self)
+        ProcessingLogger._start_flusher()
+
+    def __del__(self) -> None:
+        if getattr(self, "_file", None) is not None:
+            self.close()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.seek(0)
+            self._file.truncate()
+            self._last_flush = time.monotonic()
+            self._pending_entries = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            if self._owns_file:
+                self._file.close()
+            else:
+                self._file.flush()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        cls._flusher_stopping.set()
+        for instance in list(cls._instances):
+            instance.close()
+
+    @classmethod
+    def _start_flusher(cls) -> None:
+        with cls._flusher_lock:
+            if cls._flusher is not None or cls._flusher_stopping.is_set():
+                return
+            cls._flusher = threading.Thread(
+                target=cls._run_flusher,
+                name="processing-log-flusher",
+                daemon=True,
+            )
+            cls._flusher.start()
+
+    @classmethod
+    def _run_flusher(cls) -> None:
+        while not cls._flusher_stopping.wait(cls.FLUSH_INTERVAL_SECONDS):
+            for instance in list(cls._instances):
+                instance._flush_if_idle()
+
+    def _flush_if_idle(self) -> None:
+        with self._lock:
+            if (
+                self._pending_entries
+                and time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_SECONDS
+            ):
+                self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._file.closed:
+            self._file.flush()
+        self._last_flush = time.monotonic()
+        self._pending_entries = 0
 
     def _create_log_entry(
         self,
@@ -59,8 +136,22 @@ class ProcessingLogger:
         )
 
     def _write_log(self, entry: LogEntry) -> None:
-        json_str = json.dumps(entry.to_dict(), ensure_ascii=False)
-        self.logger.info(json_str)
+        data = orjson.dumps(
+            entry,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        )
+
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(data)
+            self._pending_entries += 1
+            if (
+                entry.event_type == self.EVENT_ERROR
+                or self._pending_entries >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_SECONDS
+            ):
+                self._flush_locked()
 
     def log_upload(self, metadata: Metadata) -> LogEntry:
         details = {
@@ -188,10 +279,8 @@ class ProcessingLogger:
             "message": message,
         }
 
-        if trace is None:
+        if trace is None and sys.exc_info()[2] is not None:
             trace = traceback.format_exc()
-            if trace.strip() == "NoneType: None":
-                trace = None
 
         if trace:
             details["stack_trace"] = trace
@@ -209,36 +298,68 @@ class ProcessingLogger:
         return entry
 
     def get_log_entries(self, limit: Optional[int] = None) -> list[LogEntry]:
-        entries = []
+        self.flush()
 
-        if not os.path.exists(self.log_file):
-            return entries
-
-        with open(self.log_file, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-                entry = LogEntry(
-                    timestamp=datetime.fromisoformat(data["timestamp"]),
-                    event_type=data["event_type"],
-                    details=data["details"],
-                    error=data.get("error"),
-                    error_scenario=(
-                        ErrorScenario(data["error_scenario"])
-                        if data.get("error_scenario")
-                        else None
-                    ),
-                )
-                entries.append(entry)
-            except (json.JSONDecodeError, KeyError, ValueError):
-                continue
+        reader = self._open_reader()
+        if reader is None:
+            return []
 
-        if limit:
-            entries = entries[-limit:]
+        with reader:
+            if not limit:
+                return [entry for entry in map(self._parse_line, reader) if entry is not None]
+
+            entries = []
+            for line in self._iter_lines_reversed(reader):
+                entry = self._parse_line(line)
+                if entry is None:
+                    continue
+                entries.append(entry)
+                if len(entries) == limit:
+                    break
 
+        entries.reverse()
         return entries
+
+    def _open_reader(self) -> Optional[BinaryIO]:
+        if not self._owns_file:
+            getvalue = getattr(self._file, "getvalue", None)
+            return io.BytesIO(getvalue()) if getvalue is not None else None
+
+        if not os.path.exists(self.log_file):
+            return None
+        return open(self.log_file, "rb")
+
+    def _iter_lines_reversed(self, reader: BinaryIO) -> Iterator[bytes]:
+        position = reader.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            size = min(self.TAIL_CHUNK_SIZE, position)
+            position -= size
+            reader.seek(position)
+            lines = (reader.read(size) + remainder).split(b"\n")
+            remainder = lines[0]
+            yield from reversed(lines[1:])
+        yield remainder
+
+    @staticmethod
+    def _parse_line(line: bytes) -> Optional[LogEntry]:
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            data = orjson.loads(line)
+            return LogEntry(
+                timestamp=datetime.fromisoformat(data["timestamp"]),
+                event_type=data["event_type"],
+                details=data["details"],
+                error=data.get("error"),
+                error_scenario=(
+                    ErrorScenario(data["error_scenario"])
+                    if data.get("error_scenario")
+                    else None
+                ),
+            )
+        except (orjson.JSONDecodeError, KeyError, ValueError):
+            return None
+
+atexit.register(ProcessingLogger.shutdown)
@@ -0,0 +1,66 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, Optional
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+def process_pool_size() -> int:
+    return os.cpu_count() or 1
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _pool
+
+    pool = _pool
+    if pool is not None:
+        return pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=process_pool_size(),
+                mp_context=multiprocessing.get_context(_start_method()),
+                initializer=_init_worker,
+            )
+        return _pool
+
+def map_in_process_pool(func: Callable[..., Any], *iterables: Iterable[Any]) -> list[Any]:
+    arguments = [list(iterable) for iterable in iterables]
+    pool = get_process_pool()
+    try:
+        return list(pool.map(func, *arguments))
+    except BrokenProcessPool:
+        _discard_process_pool(pool)
+    return list(get_process_pool().map(func, *arguments))
+
+def shutdown_process_pool() -> None:
+    global _pool
+
+    with _pool_lock:
+        pool, _pool = _pool, None
+
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _start_method() -> str:
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return "forkserver"
+    return "spawn"
+
+def _init_worker() -> None:
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+atexit.register(shutdown_process_pool)
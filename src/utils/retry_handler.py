@@ -1,4 +1,7 @@
+import random
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Callable, Optional, TypeVar
 
 from src.models.config import RetryConfig
@@ -16,6 +19,8 @@ class RetryHandler:
         ErrorScenario.SHEETS_WRITE_ERROR,
     }
 
+    RETRYABLE_STATUS_CODES = frozenset({408, 429})
+
     def __init__(self, config: Optional[RetryConfig] = None):
         self.config = config or RetryConfig()
         self._attempt_count = 0
@@ -36,6 +41,7 @@ class RetryHandler:
     ) -> T:
         last_exception: Optional[Exception] = None
         self._attempt_count = 0
+        delay = 0.0
 
         for attempt in range(self.config.max_retries + 1):
             self._attempt_count = attempt + 1
@@ -43,8 +49,8 @@ class RetryHandler:
                 return func()
             except retryable_errors as e:
                 last_exception = e
-                if attempt < self.config.max_retries:
-                    delay = self.config.get_delay(attempt)
+                if attempt < self.config.max_retries and self._should_retry(e):
+                    delay = self._next_delay(attempt, delay, e)
                     self._last_delay = delay
                     time.sleep(delay)
                     continue
@@ -63,6 +69,7 @@ class RetryHandler:
 
         last_exception: Optional[Exception] = None
         self._attempt_count = 0
+        delay = 0.0
 
         for attempt in range(self.config.max_retries + 1):
             self._attempt_count = attempt + 1
@@ -70,8 +77,8 @@ class RetryHandler:
                 return await func()
             except retryable_errors as e:
                 last_exception = e
-                if attempt < self.config.max_retries:
-                    delay = self.config.get_delay(attempt)
+                if attempt < self.config.max_retries and self._should_retry(e):
+                    delay = self._next_delay(attempt, delay, e)
                     self._last_delay = delay
                     await asyncio.sleep(delay)
                     continue
@@ -81,6 +88,60 @@ class RetryHandler:
             raise last_exception
         raise RuntimeError("Unexpected state in retry handler")
 
+    def _next_delay(self, attempt: int, previous: float, error: Exception) -> float:
+        if self.config.jitter:
+            delay = self._decorrelated_jitter(previous)
+        else:
+            delay = self.config.get_delay(attempt)
+
+        retry_after = self._retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.config.max_delay))
+        return delay
+
+    def _decorrelated_jitter(self, previous: float) -> float:
+        base = self.config.base_delay
+        cap = self.config.max_delay
+        return min(cap, random.uniform(base, max(base, previous) * 3))
+
+    @classmethod
+    def _should_retry(cls, error: Exception) -> bool:
+        status = cls._status_code(error)
+        if status is None or not 400 <= status < 500:
+            return True
+        return status in cls.RETRYABLE_STATUS_CODES
+
+    @staticmethod
+    def _status_code(error: Exception) -> Optional[int]:
+        status = getattr(error, "status_code", None)
+        if isinstance(status, int):
+            return status
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        return status if isinstance(status, int) else None
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if not headers:
+            return None
+
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
     @staticmethod
     def is_retryable(error_scenario: ErrorScenario) -> bool:
         return error_scenario in RetryHandler.RETRYABLE_SCENARIOS
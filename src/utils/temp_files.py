@@ -0,0 +1,36 @@
+import os
+import shutil
+import sys
+from typing import Optional
+
+SHARED_MEMORY_TEMP_DIR = "/dev/shm/tg_bot"
+
+def resolve_temp_dir(configured_dir: str = "") -> Optional[str]:
+    if configured_dir:
+        os.makedirs(configured_dir, exist_ok=True)
+        return configured_dir
+
+    if not sys.platform.startswith("linux"):
+        return None
+
+    shm_root = os.path.dirname(SHARED_MEMORY_TEMP_DIR)
+    if not os.path.isdir(shm_root) or not os.access(shm_root, os.W_OK):
+        return None
+
+    try:
+        os.makedirs(SHARED_MEMORY_TEMP_DIR, exist_ok=True)
+    except OSError:
+        return None
+
+    return SHARED_MEMORY_TEMP_DIR
+
+def temp_dir_for_size(temp_dir: Optional[str], size: Optional[int]) -> Optional[str]:
+    if temp_dir is None or size is None:
+        return None
+
+    try:
+        free_bytes = shutil.disk_usage(temp_dir).free
+    except OSError:
+        return None
+
+    return temp_dir if size < free_bytes else None
@@ -1,121 +1,202 @@
 import re
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlparse
 
-from src.models.enums import ErrorScenario, FileType
+from src.models.enums import SUPPORTED_EXTENSION_SET, ErrorScenario, FileType
 from src.models.results import ValidationResult
 
+try:
+    import re2 as _url_regex_engine
+except ImportError:
+    _url_regex_engine = re
+
 MAX_FILE_SIZE_BYTES = 20 * 1024 * 1024
 
 SUPPORTED_EXTENSIONS = FileType.supported_extensions()
 
-def validate_file_format(file_name: str) -> ValidationResult:
-    if not file_name:
-        return ValidationResult(
-            is_valid=False,
-            error_message="Имя файла не указано",
-            error_scenario=ErrorScenario.UNSUPPORTED_FORMAT,
-        )
+SUPPORTED_FORMATS_LABEL = ", ".join(ext.upper() for ext in SUPPORTED_EXTENSIONS)
 
-    extension = _extract_extension(file_name)
+_SIZE_NEGATIVE = -1
+_SIZE_OK = 0
+_SIZE_TOO_LARGE = 1
 
-    if not extension:
-        return ValidationResult(
-            is_valid=False,
-            error_message=f"Формат файла не поддерживается. Поддерживаемые форматы: {', '.join(SUPPORTED_EXTENSIONS).upper()}",
-            error_scenario=ErrorScenario.UNSUPPORTED_FORMAT,
-        )
+_URL_SCHEMES = frozenset({"http", "https"})
 
-    file_type = FileType.from_extension(extension)
+_VALID_RESULT = ValidationResult(is_valid=True)
 
-    if file_type is None:
-        return ValidationResult(
-            is_valid=False,
-            error_message=f"Формат файла не поддерживается. Поддерживаемые форматы: {', '.join(SUPPORTED_EXTENSIONS).upper()}",
-            error_scenario=ErrorScenario.UNSUPPORTED_FORMAT,
-        )
+_MISSING_FILE_NAME_RESULT = ValidationResult(
+    is_valid=False,
+    error_message="Имя файла не указано",
+    error_scenario=ErrorScenario.UNSUPPORTED_FORMAT,
+)
 
-    return ValidationResult(is_valid=True)
+_UNSUPPORTED_FORMAT_RESULT = ValidationResult(
+    is_valid=False,
+    error_message=f"Формат файла не поддерживается. Поддерживаемые форматы: {SUPPORTED_FORMATS_LABEL}",
+    error_scenario=ErrorScenario.UNSUPPORTED_FORMAT,
+)
 
-def validate_file_size(file_size: int, max_size_bytes: int = MAX_FILE_SIZE_BYTES) -> ValidationResult:
-    if file_size < 0:
-        return ValidationResult(
-            is_valid=False,
-            error_message="Размер файла не может быть отрицательным",
-            error_scenario=ErrorScenario.FILE_TOO_LARGE,
-        )
+_NEGATIVE_SIZE_RESULT = ValidationResult(
+    is_valid=False,
+    error_message="Размер файла не может быть отрицательным",
+    error_scenario=ErrorScenario.FILE_TOO_LARGE,
+)
 
-    if file_size > max_size_bytes:
-        max_size_mb = max_size_bytes / (1024 * 1024)
-        return ValidationResult(
-            is_valid=False,
-            error_message=f"Файл слишком большой. Максимальный размер: {max_size_mb:.0f}MB",
-            error_scenario=ErrorScenario.FILE_TOO_LARGE,
-        )
+_MISSING_URL_RESULT = ValidationResult(
+    is_valid=False,
+    error_message="URL не указан",
+    error_scenario=ErrorScenario.URL_INVALID,
+)
+
+_URL_SCHEME_RESULT = ValidationResult(
+    is_valid=False,
+    error_message="URL должен начинаться с http:// или https://",
+    error_scenario=ErrorScenario.URL_INVALID,
+)
+
+_URL_NO_DOMAIN_RESULT = ValidationResult(
+    is_valid=False,
+    error_message="URL не содержит доменного имени",
+    error_scenario=ErrorScenario.URL_INVALID,
+)
+
+_URL_BAD_DOMAIN_RESULT = ValidationResult(
+    is_valid=False,
+    error_message="Некорректное доменное имя в URL",
+    error_scenario=ErrorScenario.URL_INVALID,
+)
+
+_URL_MALFORMED_RESULT = ValidationResult(
+    is_valid=False,
+    error_message="Некорректный формат URL",
+    error_scenario=ErrorScenario.URL_INVALID,
+)
+
+URL_PATTERN = _url_regex_engine.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+_NETLOC_TERMINATOR_PATTERN = re.compile(r"[/?#]")
+
+_URL_SLOW_PATH_CHARS = frozenset("[]\t\r\n")
+
+_DOMAIN_PATTERN = re.compile(
+    r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$",
+    re.ASCII,
+)
+
+def validate_file_format(file_name: str) -> ValidationResult:
+    if not file_name:
+        return _MISSING_FILE_NAME_RESULT
+
+    return _validate_extension(_extract_extension(file_name))
 
-    return ValidationResult(is_valid=True)
+def validate_file_size(file_size: int, max_size_bytes: int = MAX_FILE_SIZE_BYTES) -> ValidationResult:
+    return _validate_size_class(_classify_size(file_size, max_size_bytes), max_size_bytes)
 
 def validate_url(url: str) -> ValidationResult:
     if not url:
-        return ValidationResult(
-            is_valid=False,
-            error_message="URL не указан",
-            error_scenario=ErrorScenario.URL_INVALID,
-        )
+        return _MISSING_URL_RESULT
+
+    return _validate_stripped_url(url.strip())
 
-    url = url.strip()
+@lru_cache(maxsize=1024)
+def _validate_stripped_url(url: str) -> ValidationResult:
+    if url[:4].lower() != "http":
+        return _URL_SCHEME_RESULT
 
+    scheme, separator, rest = url.partition("://")
+    if not separator or _URL_SLOW_PATH_CHARS.intersection(url):
+        return _validate_parsed_url(url)
+
+    if scheme.lower() not in _URL_SCHEMES:
+        return _URL_SCHEME_RESULT
+
+    return _validate_netloc(_NETLOC_TERMINATOR_PATTERN.split(rest, 1)[0])
+
+def _validate_parsed_url(url: str) -> ValidationResult:
     try:
         parsed = urlparse(url)
+    except ValueError:
+        return _URL_MALFORMED_RESULT
 
-        if parsed.scheme not in ("http", "https"):
-            return ValidationResult(
-                is_valid=False,
-                error_message="URL должен начинаться с http:// или https://",
-                error_scenario=ErrorScenario.URL_INVALID,
-            )
-
-        if not parsed.netloc:
-            return ValidationResult(
-                is_valid=False,
-                error_message="URL не содержит доменного имени",
-                error_scenario=ErrorScenario.URL_INVALID,
-            )
-
-        if not _is_valid_domain(parsed.netloc):
-            return ValidationResult(
-                is_valid=False,
-                error_message="Некорректное доменное имя в URL",
-                error_scenario=ErrorScenario.URL_INVALID,
-            )
-
-        return ValidationResult(is_valid=True)
-
-    except Exception:
-        return ValidationResult(
-            is_valid=False,
-            error_message="Некорректный формат URL",
-            error_scenario=ErrorScenario.URL_INVALID,
-        )
+    if parsed.scheme not in _URL_SCHEMES:
+        return _URL_SCHEME_RESULT
+
+    return _validate_netloc(parsed.netloc)
+
+def _validate_netloc(netloc: str) -> ValidationResult:
+    if not netloc:
+        return _URL_NO_DOMAIN_RESULT
+
+    if not _is_valid_domain(netloc):
+        return _URL_BAD_DOMAIN_RESULT
+
+    return _VALID_RESULT
+
+def validate_file(
+    file_name: str,
+    file_size: int,
+    max_size_bytes: int = MAX_FILE_SIZE_BYTES,
+) -> ValidationResult:
+    if not file_name:
+        return validate_file_format(file_name)
+
+    return _validate_extension_and_size(
+        _extract_extension(file_name),
+        _classify_size(file_size, max_size_bytes),
+        max_size_bytes,
+    )
 
-def validate_file(file_name: str, file_size: int) -> ValidationResult:
-    format_result = validate_file_format(file_name)
+@lru_cache(maxsize=512)
+def _validate_extension_and_size(
+    extension: Optional[str],
+    size_class: int,
+    max_size_bytes: int,
+) -> ValidationResult:
+    format_result = _validate_extension(extension)
     if not format_result.is_valid:
         return format_result
 
-    size_result = validate_file_size(file_size)
-    if not size_result.is_valid:
-        return size_result
+    return _validate_size_class(size_class, max_size_bytes)
 
-    return ValidationResult(is_valid=True)
+def _validate_extension(extension: Optional[str]) -> ValidationResult:
+    if extension not in SUPPORTED_EXTENSION_SET:
+        return _UNSUPPORTED_FORMAT_RESULT
+
+    return _VALID_RESULT
+
+def _classify_size(file_size: int, max_size_bytes: int) -> int:
+    if file_size < 0:
+        return _SIZE_NEGATIVE
+    if file_size > max_size_bytes:
+        return _SIZE_TOO_LARGE
+    return _SIZE_OK
+
+@lru_cache(maxsize=64)
+def _validate_size_class(size_class: int, max_size_bytes: int) -> ValidationResult:
+    if size_class == _SIZE_NEGATIVE:
+        return _NEGATIVE_SIZE_RESULT
+
+    if size_class == _SIZE_TOO_LARGE:
+        max_size_mb = max_size_bytes / (1024 * 1024)
+        return ValidationResult(
+            is_valid=False,
+            error_message=f"Файл слишком большой. Максимальный размер: {max_size_mb:.0f}MB",
+            error_scenario=ErrorScenario.FILE_TOO_LARGE,
+        )
+
+    return _VALID_RESULT
 
 def _extract_extension(file_name: str) -> Optional[str]:
-    if not file_name or "." not in file_name:
+    if not file_name:
         return None
 
-    extension = file_name.rsplit(".", 1)[-1].lower()
+    index = file_name.rfind(".")
 
-    return extension if extension else None
+    if index == -1 or index == len(file_name) - 1:
+        return None
+
+    return file_name[index + 1:].lower()
 
 def _is_valid_domain(domain: str) -> bool:
     if ":" in domain:
@@ -127,8 +208,4 @@ def _is_valid_domain(domain: str) -> bool:
     if domain == "localhost":
         return True
 
-    domain_pattern = re.compile(
-        r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$"
-    )
-
-    return bool(domain_pattern.match(domain))
+    return bool(_DOMAIN_PATTERN.match(domain))
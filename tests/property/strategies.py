@@ -0,0 +1,33 @@
+from hypothesis import strategies as st
+
+VISIBLE_CHARACTERS = st.characters(blacklist_categories=('Cs', 'Cc', 'Zs', 'Zl', 'Zp'))
+
+LEADING_WHITESPACE_CHARACTERS = st.characters(whitelist_categories=('Zs',), whitelist_characters='\t\n')
+
+DEFAULT_ALPHABET = st.characters(codec='utf-8')
+
+MAX_LEADING_WHITESPACE = 3
+
+@st.composite
+def non_blank_text(
+    draw,
+    max_size: int,
+    alphabet=DEFAULT_ALPHABET,
+    head=VISIBLE_CHARACTERS,
+    min_size: int = 1,
+    leading_whitespace: bool = True,
+):
+    prefix = ""
+    if leading_whitespace:
+        prefix = draw(st.text(
+            alphabet=LEADING_WHITESPACE_CHARACTERS,
+            max_size=min(MAX_LEADING_WHITESPACE, max_size - 1),
+        ))
+
+    rest_max = max_size - 1 - len(prefix)
+    rest = draw(st.text(
+        alphabet=alphabet,
+        min_size=min(max(min_size - 1 - len(prefix), 0), rest_max),
+        max_size=rest_max,
+    ))
+    return prefix + draw(head) + rest
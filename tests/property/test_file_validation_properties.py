@@ -1,7 +1,3 @@
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-
 from hypothesis import given, strategies as st, settings, assume
 
 from src.utils.validators import (
@@ -11,14 +7,19 @@ from src.utils.validators import (
     SUPPORTED_EXTENSIONS,
 )
 from src.models.enums import ErrorScenario
+from tests.property.strategies import non_blank_text
+
+_ALPHA = st.characters(whitelist_categories=('L', 'N'), whitelist_characters='-_')
+
+_BASE_NAME = st.text(
+    alphabet=_ALPHA,
+    min_size=1,
+    max_size=50
+)
 
 @st.composite
 def supported_file_name_strategy(draw):
-    base_name = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='-_'),
-        min_size=1,
-        max_size=50
-    ).filter(lambda x: x.strip() and not x.endswith('.')))
+    base_name = draw(_BASE_NAME)
 
     extension = draw(st.sampled_from(SUPPORTED_EXTENSIONS))
 
@@ -33,22 +34,21 @@ UNSUPPORTED_EXTENSIONS = [
 
 @st.composite
 def unsupported_file_name_strategy(draw):
-    base_name = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='-_'),
-        min_size=1,
-        max_size=50
-    ).filter(lambda x: x.strip() and not x.endswith('.')))
+    base_name = draw(_BASE_NAME)
 
     extension = draw(st.sampled_from(UNSUPPORTED_EXTENSIONS))
 
     return f"{base_name}.{extension}"
 
+_SUPPORTED_FILE_NAME_STRATEGY = supported_file_name_strategy()
+
+_UNSUPPORTED_FILE_NAME_STRATEGY = unsupported_file_name_strategy()
+
 valid_file_size_strategy = st.integers(min_value=0, max_value=MAX_FILE_SIZE_BYTES)
 
 invalid_file_size_strategy = st.integers(min_value=MAX_FILE_SIZE_BYTES + 1, max_value=100 * 1024 * 1024)
 
-@settings(max_examples=100)
-@given(file_name=supported_file_name_strategy())
+@given(file_name=_SUPPORTED_FILE_NAME_STRATEGY)
 def test_supported_file_formats_acceptance(file_name: str):
     result = validate_file_format(file_name)
 
@@ -59,8 +59,7 @@ def test_supported_file_formats_acceptance(file_name: str):
     assert result.error_message is None
     assert result.error_scenario is None
 
-@settings(max_examples=100)
-@given(file_name=supported_file_name_strategy())
+@given(file_name=_SUPPORTED_FILE_NAME_STRATEGY)
 def test_supported_formats_case_insensitive(file_name: str):
     result_upper = validate_file_format(file_name.upper())
     assert result_upper.is_valid, f"Uppercase extension should be accepted: {file_name.upper()}"
@@ -68,8 +67,7 @@ def test_supported_formats_case_insensitive(file_name: str):
     result_lower = validate_file_format(file_name.lower())
     assert result_lower.is_valid, f"Lowercase extension should be accepted: {file_name.lower()}"
 
-@settings(max_examples=100)
-@given(file_name=unsupported_file_name_strategy())
+@given(file_name=_UNSUPPORTED_FILE_NAME_STRATEGY)
 def test_unsupported_file_format_rejection(file_name: str):
     result = validate_file_format(file_name)
 
@@ -85,8 +83,11 @@ def test_unsupported_file_format_rejection(file_name: str):
             f"Error message should list supported format '{ext}': {result.error_message}"
         )
 
-@settings(max_examples=100)
-@given(base_name=st.text(min_size=1, max_size=50).filter(lambda x: x.strip() and '.' not in x))
+@given(base_name=non_blank_text(
+    50,
+    st.characters(blacklist_categories=('Cs',), blacklist_characters='.'),
+    head=st.characters(blacklist_categories=('Cs', 'Cc', 'Zs', 'Zl', 'Zp'), blacklist_characters='.'),
+))
 def test_file_without_extension_rejected(base_name: str):
     result = validate_file_format(base_name)
 
@@ -95,37 +96,40 @@ def test_file_without_extension_rejected(base_name: str):
     )
     assert result.error_scenario == ErrorScenario.UNSUPPORTED_FORMAT
 
-@settings(max_examples=100)
-@given(file_size=valid_file_size_strategy)
-def test_valid_file_size_acceptance(file_size: int):
-    result = validate_file_size(file_size)
+@settings(max_examples=20)
+@given(file_sizes=st.lists(valid_file_size_strategy, min_size=64, max_size=512))
+def test_valid_file_size_acceptance(file_sizes: list[int]):
+    for file_size in file_sizes:
+        result = validate_file_size(file_size)
 
-    assert result.is_valid, (
-        f"File with valid size should be accepted: {file_size} bytes, "
-        f"error: {result.error_message}"
-    )
-    assert result.error_message is None
-    assert result.error_scenario is None
+        assert result.is_valid, (
+            f"File with valid size should be accepted: {file_size} bytes, "
+            f"error: {result.error_message}"
+        )
+        assert result.error_message is None
+        assert result.error_scenario is None
 
-@settings(max_examples=100)
-@given(file_size=invalid_file_size_strategy)
-def test_oversized_file_rejection(file_size: int):
-    result = validate_file_size(file_size)
+@settings(max_examples=20)
+@given(file_sizes=st.lists(invalid_file_size_strategy, min_size=64, max_size=512))
+def test_oversized_file_rejection(file_sizes: list[int]):
+    for file_size in file_sizes:
+        result = validate_file_size(file_size)
 
-    assert not result.is_valid, (
-        f"File exceeding size limit should be rejected: {file_size} bytes"
-    )
-    assert result.error_scenario == ErrorScenario.FILE_TOO_LARGE
-    assert result.error_message is not None
-    assert "20" in result.error_message, (
-        f"Error message should mention 20MB limit: {result.error_message}"
-    )
+        assert not result.is_valid, (
+            f"File exceeding size limit should be rejected: {file_size} bytes"
+        )
+        assert result.error_scenario == ErrorScenario.FILE_TOO_LARGE
+        assert result.error_message is not None
+        assert "20" in result.error_message, (
+            f"Error message should mention 20MB limit: {result.error_message}"
+        )
 
-@settings(max_examples=100)
-@given(file_size=st.integers(min_value=-1000, max_value=-1))
-def test_negative_file_size_rejection(file_size: int):
-    result = validate_file_size(file_size)
+@settings(max_examples=20)
+@given(file_sizes=st.lists(st.integers(min_value=-1000, max_value=-1), min_size=64, max_size=512))
+def test_negative_file_size_rejection(file_sizes: list[int]):
+    for file_size in file_sizes:
+        result = validate_file_size(file_size)
 
-    assert not result.is_valid, (
-        f"Negative file size should be rejected: {file_size}"
-    )
+        assert not result.is_valid, (
+            f"Negative file size should be rejected: {file_size}"
+        )
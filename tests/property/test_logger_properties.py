@@ -1,41 +1,55 @@
-import sys
-import os
-import tempfile
-import json
+import io
+import re
+import time
 from datetime import datetime
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-
+import orjson
+import pytest
 from hypothesis import given, strategies as st, settings, assume
 
 from src.utils.logger import ProcessingLogger
 from src.models.enums import FileType, ErrorScenario
 from src.models.metadata import Metadata
 from src.models.storage import LogEntry
+from tests.property.strategies import non_blank_text
+
+_ALPHA = st.characters(whitelist_categories=('L', 'N'), whitelist_characters='-_')
+
+_ALPHA_U = st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_')
+
+_EXTENSION = st.sampled_from(('pdf', 'docx', 'txt', 'md'))
+
+_BASE_NAME = st.text(
+    alphabet=_ALPHA,
+    min_size=1,
+    max_size=50
+)
+
+_FILE_SIZE = st.integers(min_value=1, max_value=20 * 1024 * 1024)
+
+_USER_ID = st.integers(min_value=1, max_value=10**12)
+
+_USERNAME = st.text(
+    alphabet=_ALPHA_U,
+    min_size=5,
+    max_size=32
+)
 
 @st.composite
 def valid_metadata_strategy(draw):
-    file_name = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='-_'),
-        min_size=1,
-        max_size=50
-    ).filter(lambda x: x.strip() and not x.endswith('.')))
+    file_name = draw(_BASE_NAME)
 
-    extension = draw(st.sampled_from(['pdf', 'docx', 'txt', 'md']))
+    extension = draw(_EXTENSION)
     full_file_name = f"{file_name}.{extension}"
 
-    file_size = draw(st.integers(min_value=1, max_value=20 * 1024 * 1024))
+    file_size = draw(_FILE_SIZE)
     file_type = FileType.from_extension(extension)
-    uploader_id = draw(st.integers(min_value=1, max_value=10**12))
+    uploader_id = draw(_USER_ID)
 
     has_username = draw(st.booleans())
     username = None
     if has_username:
-        username = draw(st.text(
-            alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_'),
-            min_size=5,
-            max_size=32
-        ).filter(lambda x: x.strip()))
+        username = draw(_USERNAME)
 
     return Metadata(
         file_name=full_file_name,
@@ -54,7 +68,7 @@ def extraction_status_strategy(draw):
         "tesseract_ocr", "google_vision_ocr", None
     ]))
     used_ocr = draw(st.booleans())
-    file_name = draw(st.text(min_size=1, max_size=50).filter(lambda x: x.strip()) | st.none())
+    file_name = draw(non_blank_text(50) | st.none())
 
     return {
         "status": status,
@@ -101,11 +115,11 @@ def sheets_write_strategy(draw):
     status = draw(st.sampled_from(["success", "error"]))
     row_number = draw(st.integers(min_value=1, max_value=100000) | st.none())
     spreadsheet_id = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='-_'),
+        alphabet=_ALPHA,
         min_size=10,
         max_size=50
-    ).filter(lambda x: x.strip()) | st.none())
-    sheet_name = draw(st.text(min_size=1, max_size=30).filter(lambda x: x.strip()) | st.none())
+    ) | st.none())
+    sheet_name = draw(non_blank_text(30) | st.none())
 
     return {
         "status": status,
@@ -119,7 +133,7 @@ def error_strategy(draw):
     error_type = draw(st.sampled_from([
         "ValidationError", "ParseError", "APIError", "StorageError", "NetworkError"
     ]))
-    message = draw(st.text(min_size=1, max_size=200).filter(lambda x: x.strip()))
+    message = draw(non_blank_text(200))
     trace = draw(st.text(min_size=0, max_size=500) | st.none())
     error_scenario = draw(st.sampled_from(list(ErrorScenario)) | st.none())
 
@@ -130,269 +144,241 @@ def error_strategy(draw):
         "error_scenario": error_scenario,
     }
 
-def create_temp_logger():
-    temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False)
-    temp_file.close()
-    return ProcessingLogger(log_file=temp_file.name), temp_file.name
+_METADATA_STRATEGY = valid_metadata_strategy()
 
-def cleanup_temp_file(file_path):
-    try:
-        os.unlink(file_path)
-    except OSError:
-        pass
+_EXTRACTION_STRATEGY = extraction_status_strategy()
 
-def validate_iso_timestamp(timestamp_str: str) -> bool:
-    try:
-        datetime.fromisoformat(timestamp_str)
-        return True
-    except (ValueError, TypeError):
-        return False
-
-@settings(max_examples=100)
-@given(metadata=valid_metadata_strategy())
-def test_log_upload_has_iso_timestamp_and_required_details(metadata: Metadata):
-    logger, temp_file = create_temp_logger()
-
-    try:
-        entry = logger.log_upload(metadata)
-
-        assert entry.timestamp is not None, "timestamp should not be None"
-        assert isinstance(entry.timestamp, datetime), "timestamp should be datetime"
+_API_CALL_STRATEGY = api_call_strategy()
 
-        assert entry.event_type == ProcessingLogger.EVENT_UPLOAD, (
-            f"event_type should be {ProcessingLogger.EVENT_UPLOAD}, got {entry.event_type}"
-        )
+_KEYWORDS_STRATEGY = keyword_extraction_strategy()
 
-        assert "file_name" in entry.details, "file_name should be in details"
-        assert "file_size" in entry.details, "file_size should be in details"
-        assert "file_type" in entry.details, "file_type should be in details"
-        assert "uploader_id" in entry.details, "uploader_id should be in details"
+_SHEETS_WRITE_STRATEGY = sheets_write_strategy()
 
-        assert entry.details["file_name"] == metadata.file_name
-        assert entry.details["file_size"] == metadata.file_size
-        assert entry.details["file_type"] == metadata.file_type.value
-        assert entry.details["uploader_id"] == metadata.uploader_id
+_ERROR_STRATEGY = error_strategy()
 
-        entry_dict = entry.to_dict()
-        assert validate_iso_timestamp(entry_dict["timestamp"]), (
-            f"timestamp should be ISO format, got {entry_dict['timestamp']}"
-        )
-    finally:
-        cleanup_temp_file(temp_file)
+@pytest.fixture(scope="module")
+def log_stream():
+    return io.BytesIO()
 
-@settings(max_examples=100)
-@given(params=extraction_status_strategy())
-def test_log_extraction_has_iso_timestamp_and_required_details(params: dict):
-    logger, temp_file = create_temp_logger()
+@pytest.fixture(scope="module")
+def shared_logger(log_stream):
+    logger = ProcessingLogger(stream=log_stream)
+    yield logger
+    logger.close()
 
-    try:
-        entry = logger.log_extraction(
-            status=params["status"],
-            char_count=params["char_count"],
-            extraction_method=params["extraction_method"],
-            used_ocr=params["used_ocr"],
-            file_name=params["file_name"],
-        )
-
-        assert entry.timestamp is not None, "timestamp should not be None"
-        assert isinstance(entry.timestamp, datetime), "timestamp should be datetime"
-
-        assert entry.event_type == ProcessingLogger.EVENT_EXTRACTION
-
-        assert "status" in entry.details, "status should be in details"
-        assert "char_count" in entry.details, "char_count should be in details"
-        assert entry.details["status"] == params["status"]
-        assert entry.details["char_count"] == params["char_count"]
-
-        entry_dict = entry.to_dict()
-        assert validate_iso_timestamp(entry_dict["timestamp"])
-    finally:
-        cleanup_temp_file(temp_file)
-
-@settings(max_examples=100)
-@given(params=api_call_strategy())
-def test_log_api_call_has_iso_timestamp_and_required_details(params: dict):
-    logger, temp_file = create_temp_logger()
-
-    try:
-        entry = logger.log_api_call(
-            service=params["service"],
-            status=params["status"],
-            model=params["model"],
-            tokens_used=params["tokens_used"],
-            response_time=params["response_time"],
-        )
-
-        assert entry.timestamp is not None, "timestamp should not be None"
-        assert isinstance(entry.timestamp, datetime), "timestamp should be datetime"
-
-        assert entry.event_type == ProcessingLogger.EVENT_API_CALL
-
-        assert "service" in entry.details, "service should be in details"
-        assert "status" in entry.details, "status should be in details"
-        assert entry.details["service"] == params["service"]
-        assert entry.details["status"] == params["status"]
-
-        entry_dict = entry.to_dict()
-        assert validate_iso_timestamp(entry_dict["timestamp"])
-    finally:
-        cleanup_temp_file(temp_file)
-
-@settings(max_examples=100)
-@given(params=keyword_extraction_strategy())
-def test_log_keywords_has_iso_timestamp_and_required_details(params: dict):
-    logger, temp_file = create_temp_logger()
-
-    try:
-        entry = logger.log_keywords(
-            extraction_method=params["extraction_method"],
-            keyword_count=params["keyword_count"],
-            status=params["status"],
-            language=params["language"],
-        )
-
-        assert entry.timestamp is not None, "timestamp should not be None"
-        assert isinstance(entry.timestamp, datetime), "timestamp should be datetime"
-
-        assert entry.event_type == ProcessingLogger.EVENT_KEYWORDS
-
-        assert "extraction_method" in entry.details, "extraction_method should be in details"
-        assert "keyword_count" in entry.details, "keyword_count should be in details"
-        assert entry.details["extraction_method"] == params["extraction_method"]
-        assert entry.details["keyword_count"] == params["keyword_count"]
-
-        entry_dict = entry.to_dict()
-        assert validate_iso_timestamp(entry_dict["timestamp"])
-    finally:
-        cleanup_temp_file(temp_file)
+_ISO_TIMESTAMP_PATTERN = re.compile(
+    r'\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])'
+    r'T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{1,6})?'
+    r'(?:[+-](?:[01]\d|2[0-3]):[0-5]\d|Z)?\Z'
+)
 
-@settings(max_examples=100)
-@given(params=sheets_write_strategy())
-def test_log_sheets_write_has_iso_timestamp_and_required_details(params: dict):
-    logger, temp_file = create_temp_logger()
+def validate_iso_timestamp(timestamp_str: str, strict: bool = False) -> bool:
+    if not strict:
+        return _ISO_TIMESTAMP_PATTERN.match(timestamp_str) is not None
 
     try:
-        entry = logger.log_sheets_write(
-            status=params["status"],
-            row_number=params["row_number"],
-            spreadsheet_id=params["spreadsheet_id"],
-            sheet_name=params["sheet_name"],
-        )
+        datetime.fromisoformat(timestamp_str)
+        return True
+    except (ValueError, TypeError):
+        return False
 
-        assert entry.timestamp is not None, "timestamp should not be None"
-        assert isinstance(entry.timestamp, datetime), "timestamp should be datetime"
+def _upload_details(params: dict) -> dict:
+    metadata = params["metadata"]
+    return {
+        "file_name": metadata.file_name,
+        "file_size": metadata.file_size,
+        "file_type": metadata.file_type.value,
+        "uploader_id": metadata.uploader_id,
+    }
 
-        assert entry.event_type == ProcessingLogger.EVENT_SHEETS_WRITE
+def _sheets_write_details(params: dict) -> dict:
+    details = {"status": params["status"]}
+    if params["row_number"] is not None:
+        details["row_number"] = params["row_number"]
+    return details
+
+def _selected_details(*keys: str):
+    return lambda params: {key: params[key] for key in keys}
+
+_LOG_EVENT_CASES = {
+    "upload": (
+        ProcessingLogger.log_upload,
+        _METADATA_STRATEGY.map(lambda metadata: {"metadata": metadata}),
+        ProcessingLogger.EVENT_UPLOAD,
+        _upload_details,
+    ),
+    "extraction": (
+        ProcessingLogger.log_extraction,
+        _EXTRACTION_STRATEGY,
+        ProcessingLogger.EVENT_EXTRACTION,
+        _selected_details("status", "char_count"),
+    ),
+    "api_call": (
+        ProcessingLogger.log_api_call,
+        _API_CALL_STRATEGY,
+        ProcessingLogger.EVENT_API_CALL,
+        _selected_details("service", "status"),
+    ),
+    "keywords": (
+        ProcessingLogger.log_keywords,
+        _KEYWORDS_STRATEGY,
+        ProcessingLogger.EVENT_KEYWORDS,
+        _selected_details("extraction_method", "keyword_count"),
+    ),
+    "sheets_write": (
+        ProcessingLogger.log_sheets_write,
+        _SHEETS_WRITE_STRATEGY,
+        ProcessingLogger.EVENT_SHEETS_WRITE,
+        _sheets_write_details,
+    ),
+    "error": (
+        ProcessingLogger.log_error,
+        _ERROR_STRATEGY,
+        ProcessingLogger.EVENT_ERROR,
+        _selected_details("error_type", "message"),
+    ),
+}
+
+@pytest.mark.parametrize("kind", list(_LOG_EVENT_CASES))
+@given(data=st.data())
+def test_log_event_has_iso_timestamp_and_required_details(
+    shared_logger: ProcessingLogger,
+    kind: str,
+    data: st.DataObject,
+):
+    log_method, params_strategy, event_type, expected_details = _LOG_EVENT_CASES[kind]
+    params = data.draw(params_strategy)
 
-        assert "status" in entry.details, "status should be in details"
-        assert entry.details["status"] == params["status"]
+    shared_logger.clear()
 
-        if params["row_number"] is not None:
-            assert "row_number" in entry.details
-            assert entry.details["row_number"] == params["row_number"]
+    entry = log_method(shared_logger, **params)
 
-        entry_dict = entry.to_dict()
-        assert validate_iso_timestamp(entry_dict["timestamp"])
-    finally:
-        cleanup_temp_file(temp_file)
+    assert entry.timestamp is not None, "timestamp should not be None"
+    assert isinstance(entry.timestamp, datetime), "timestamp should be datetime"
 
-@settings(max_examples=100)
-@given(params=error_strategy())
-def test_log_error_has_iso_timestamp_and_required_details(params: dict):
-    logger, temp_file = create_temp_logger()
+    assert entry.event_type == event_type, (
+        f"event_type should be {event_type}, got {entry.event_type}"
+    )
 
-    try:
-        entry = logger.log_error(
-            error_type=params["error_type"],
-            message=params["message"],
-            trace=params["trace"],
-            error_scenario=params["error_scenario"],
+    for key, value in expected_details(params).items():
+        assert key in entry.details, f"{key} should be in details"
+        assert entry.details[key] == value, (
+            f"details[{key!r}] should be {value!r}, got {entry.details[key]!r}"
         )
 
-        assert entry.timestamp is not None, "timestamp should not be None"
-        assert isinstance(entry.timestamp, datetime), "timestamp should be datetime"
-
-        assert entry.event_type == ProcessingLogger.EVENT_ERROR
-
-        assert "error_type" in entry.details, "error_type should be in details"
-        assert "message" in entry.details, "message should be in details"
-        assert entry.details["error_type"] == params["error_type"]
-        assert entry.details["message"] == params["message"]
-
+    if kind == "error":
         assert entry.error == params["message"]
 
         if params["error_scenario"] is not None:
             assert entry.error_scenario == params["error_scenario"]
 
-        entry_dict = entry.to_dict()
-        assert validate_iso_timestamp(entry_dict["timestamp"])
-    finally:
-        cleanup_temp_file(temp_file)
+    entry_dict = entry.to_dict()
+    assert validate_iso_timestamp(entry_dict["timestamp"]), (
+        f"timestamp should be ISO format, got {entry_dict['timestamp']}"
+    )
 
-@settings(max_examples=100)
-@given(metadata=valid_metadata_strategy())
-def test_log_entries_are_written_to_file_in_json_format(metadata: Metadata):
-    logger, temp_file = create_temp_logger()
+@given(metadata=_METADATA_STRATEGY)
+def test_log_entries_are_written_to_file_in_json_format(
+    shared_logger: ProcessingLogger,
+    log_stream: io.BytesIO,
+    metadata: Metadata,
+):
+    shared_logger.clear()
 
-    try:
-        logger.log_upload(metadata)
+    shared_logger.log_upload(metadata)
+    shared_logger.flush()
 
-        with open(temp_file, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
+    content = log_stream.getvalue().strip()
 
-        assert content, "Log file should not be empty"
+    assert content, "Log file should not be empty"
 
-        log_data = json.loads(content)
+    log_data = orjson.loads(content)
 
-        assert "timestamp" in log_data, "JSON should have timestamp"
-        assert "event_type" in log_data, "JSON should have event_type"
-        assert "details" in log_data, "JSON should have details"
+    assert "timestamp" in log_data, "JSON should have timestamp"
+    assert "event_type" in log_data, "JSON should have event_type"
+    assert "details" in log_data, "JSON should have details"
 
-        assert validate_iso_timestamp(log_data["timestamp"]), (
-            f"timestamp should be ISO format, got {log_data['timestamp']}"
-        )
+    assert validate_iso_timestamp(log_data["timestamp"], strict=True), (
+        f"timestamp should be ISO format, got {log_data['timestamp']}"
+    )
 
-        assert log_data["details"]["file_name"] == metadata.file_name
-        assert log_data["details"]["file_size"] == metadata.file_size
-    finally:
-        cleanup_temp_file(temp_file)
+    assert log_data["details"]["file_name"] == metadata.file_name
+    assert log_data["details"]["file_size"] == metadata.file_size
 
 @settings(max_examples=50)
 @given(
-    metadata=valid_metadata_strategy(),
-    extraction_params=extraction_status_strategy(),
-    api_params=api_call_strategy(),
+    metadata=_METADATA_STRATEGY,
+    extraction_params=_EXTRACTION_STRATEGY,
+    api_params=_API_CALL_STRATEGY,
 )
 def test_multiple_log_entries_all_have_timestamps(
+    shared_logger: ProcessingLogger,
     metadata: Metadata,
     extraction_params: dict,
     api_params: dict,
 ):
-    logger, temp_file = create_temp_logger()
+    shared_logger.clear()
 
-    try:
-        entry1 = logger.log_upload(metadata)
-        entry2 = logger.log_extraction(
-            status=extraction_params["status"],
-            char_count=extraction_params["char_count"],
-        )
-        entry3 = logger.log_api_call(
-            service=api_params["service"],
-            status=api_params["status"],
-        )
+    entry1 = shared_logger.log_upload(metadata)
+    entry2 = shared_logger.log_extraction(
+        status=extraction_params["status"],
+        char_count=extraction_params["char_count"],
+    )
+    entry3 = shared_logger.log_api_call(
+        service=api_params["service"],
+        status=api_params["status"],
+    )
+
+    for entry in [entry1, entry2, entry3]:
+        assert entry.timestamp is not None
+        assert isinstance(entry.timestamp, datetime)
+
+        entry_dict = entry.to_dict()
+        assert validate_iso_timestamp(entry_dict["timestamp"])
 
-        for entry in [entry1, entry2, entry3]:
-            assert entry.timestamp is not None
-            assert isinstance(entry.timestamp, datetime)
+    entries = shared_logger.get_log_entries()
+    assert len(entries) == 3, f"Should have 3 entries, got {len(entries)}"
 
-            entry_dict = entry.to_dict()
-            assert validate_iso_timestamp(entry_dict["timestamp"])
+    for entry in entries:
+        assert entry.timestamp is not None
+        assert isinstance(entry.timestamp, datetime)
 
-        entries = logger.get_log_entries()
-        assert len(entries) == 3, f"Should have 3 entries, got {len(entries)}"
+def test_idle_logger_flushes_buffered_entries_in_background(tmp_path):
+    log_file = tmp_path / "processing.log"
+    logger = ProcessingLogger(log_file=str(log_file))
+    try:
+        logger.log_api_call(service="openai", status="success")
+        deadline = time.monotonic() + 5 * ProcessingLogger.FLUSH_INTERVAL_SECONDS
+        while not log_file.read_bytes() and time.monotonic() < deadline:
+            time.sleep(0.05)
 
-        for entry in entries:
-            assert entry.timestamp is not None
-            assert isinstance(entry.timestamp, datetime)
+        assert log_file.read_bytes(), "Idle logger should flush its buffer without another write"
     finally:
-        cleanup_temp_file(temp_file)
+        logger.close()
+
+@settings(max_examples=20)
+@given(
+    padding=st.integers(min_value=1, max_value=4096),
+    extra=st.integers(min_value=0, max_value=50),
+)
+def test_log_tail_is_intact_across_read_chunk_boundaries(padding: int, extra: int):
+    stream = io.BytesIO()
+    logger = ProcessingLogger(stream=stream)
+    model = "m" * padding
+    total = 0
+    while len(stream.getvalue()) < 3 * ProcessingLogger.TAIL_CHUNK_SIZE:
+        logger.log_api_call(service="openai", status="success", model=model, tokens_used=total)
+        total += 1
+    logger.flush()
+
+    content = stream.getvalue()
+    boundary = len(content) - ProcessingLogger.TAIL_CHUNK_SIZE
+    assume(content[boundary - 1:boundary] != b"\n")
+    limit = content[boundary:].count(b"\n") + extra
+
+    tail = logger.get_log_entries(limit=limit)
+
+    assert [entry.details["tokens_used"] for entry in tail] == list(range(max(0, total - limit), total))
+    assert all(entry.details["model"] == model for entry in tail), (
+        "The entry spanning the read chunk boundary should be parsed intact"
+    )
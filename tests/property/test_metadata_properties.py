@@ -1,34 +1,55 @@
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, assume
 
 from src.bot.handlers import TelegramBotHandler
 from src.models.enums import FileType
 from src.utils.validators import SUPPORTED_EXTENSIONS
 
+_HANDLER = TelegramBotHandler(
+    token="test_token",
+    webhook_url="https://example.com/webhook",
+)
+
+_ALPHA = st.characters(whitelist_categories=('L', 'N'), whitelist_characters='-_')
+
+_ALPHA_U = st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_')
+
+_EXTENSION = st.sampled_from(tuple(SUPPORTED_EXTENSIONS))
+
+_BASE_NAME = st.text(
+    alphabet=_ALPHA,
+    min_size=1,
+    max_size=50
+)
+
+_FILE_SIZE = st.integers(min_value=1, max_value=20 * 1024 * 1024)
+
+_FILE_ID = st.text(
+    alphabet=st.characters(whitelist_categories=('L', 'N')),
+    min_size=10,
+    max_size=100
+)
+
+_USER_ID = st.integers(min_value=1, max_value=10**12)
+
+_USERNAME = st.text(
+    alphabet=_ALPHA_U,
+    min_size=5,
+    max_size=32
+)
+
 @st.composite
 def valid_file_name_strategy(draw):
-    base_name = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='-_'),
-        min_size=1,
-        max_size=50
-    ).filter(lambda x: x.strip() and not x.endswith('.')))
+    base_name = draw(_BASE_NAME)
 
-    extension = draw(st.sampled_from(SUPPORTED_EXTENSIONS))
+    extension = draw(_EXTENSION)
 
     return f"{base_name}.{extension}"
 
 @st.composite
 def valid_file_info_strategy(draw):
-    file_name = draw(valid_file_name_strategy())
-    file_size = draw(st.integers(min_value=1, max_value=20 * 1024 * 1024))
-    file_id = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('L', 'N')),
-        min_size=10,
-        max_size=100
-    ).filter(lambda x: x.strip()))
+    file_name = draw(_FILE_NAME_STRATEGY)
+    file_size = draw(_FILE_SIZE)
+    file_id = draw(_FILE_ID)
 
     return {
         "file_name": file_name,
@@ -38,37 +59,33 @@ def valid_file_info_strategy(draw):
 
 @st.composite
 def valid_user_info_strategy(draw):
-    user_id = draw(st.integers(min_value=1, max_value=10**12))
+    user_id = draw(_USER_ID)
 
     has_username = draw(st.booleans())
     username = None
     if has_username:
-        username = draw(st.text(
-            alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_'),
-            min_size=5,
-            max_size=32
-        ).filter(lambda x: x.strip()))
+        username = draw(_USERNAME)
 
     return {
         "id": user_id,
         "username": username,
     }
 
-@settings(max_examples=100)
+_FILE_NAME_STRATEGY = valid_file_name_strategy()
+
+_FILE_INFO_STRATEGY = valid_file_info_strategy()
+
+_USER_INFO_STRATEGY = valid_user_info_strategy()
+
 @given(
-    file_info=valid_file_info_strategy(),
-    user_info=valid_user_info_strategy(),
+    file_info=_FILE_INFO_STRATEGY,
+    user_info=_USER_INFO_STRATEGY,
 )
 def test_metadata_extraction_completeness(
     file_info: dict,
     user_info: dict,
 ):
-    handler = TelegramBotHandler(
-        token="test_token",
-        webhook_url="https://example.com/webhook",
-    )
-
-    metadata = handler.extract_metadata(file_info, user_info)
+    metadata = _HANDLER.extract_metadata(file_info, user_info)
 
     assert metadata.file_name, "file_name should not be empty"
     assert metadata.file_name.strip(), "file_name should not be whitespace only"
@@ -88,21 +105,15 @@ def test_metadata_extraction_completeness(
         f"uploader_id={metadata.uploader_id}"
     )
 
-@settings(max_examples=100)
 @given(
-    file_info=valid_file_info_strategy(),
-    user_info=valid_user_info_strategy(),
+    file_info=_FILE_INFO_STRATEGY,
+    user_info=_USER_INFO_STRATEGY,
 )
 def test_metadata_preserves_original_values(
     file_info: dict,
     user_info: dict,
 ):
-    handler = TelegramBotHandler(
-        token="test_token",
-        webhook_url="https://example.com/webhook",
-    )
-
-    metadata = handler.extract_metadata(file_info, user_info)
+    metadata = _HANDLER.extract_metadata(file_info, user_info)
 
     assert metadata.file_name == file_info["file_name"], (
         f"file_name should be preserved: expected {file_info['file_name']}, "
@@ -125,21 +136,15 @@ def test_metadata_preserves_original_values(
             f"got {metadata.uploader_username}"
         )
 
-@settings(max_examples=100)
 @given(
-    file_info=valid_file_info_strategy(),
-    user_info=valid_user_info_strategy(),
+    file_info=_FILE_INFO_STRATEGY,
+    user_info=_USER_INFO_STRATEGY,
 )
 def test_metadata_file_type_matches_extension(
     file_info: dict,
     user_info: dict,
 ):
-    handler = TelegramBotHandler(
-        token="test_token",
-        webhook_url="https://example.com/webhook",
-    )
-
-    metadata = handler.extract_metadata(file_info, user_info)
+    metadata = _HANDLER.extract_metadata(file_info, user_info)
 
     file_name = file_info["file_name"]
     extension = file_name.rsplit(".", 1)[-1].lower()
@@ -149,20 +154,14 @@ def test_metadata_file_type_matches_extension(
         f"got {metadata.file_type.value}"
     )
 
-@settings(max_examples=100)
 @given(
-    file_info=valid_file_info_strategy(),
-    user_info=valid_user_info_strategy(),
+    file_info=_FILE_INFO_STRATEGY,
+    user_info=_USER_INFO_STRATEGY,
 )
 def test_metadata_has_timestamp(
     file_info: dict,
     user_info: dict,
 ):
-    handler = TelegramBotHandler(
-        token="test_token",
-        webhook_url="https://example.com/webhook",
-    )
-
-    metadata = handler.extract_metadata(file_info, user_info)
+    metadata = _HANDLER.extract_metadata(file_info, user_info)
 
     assert metadata.timestamp is not None, "timestamp should not be None"
@@ -0,0 +1,138 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from hypothesis import given, strategies as st
+
+from src.main import TelegramKnowledgeBot
+from src.models.config import WorkflowConfig
+
+_CONFIG = WorkflowConfig(
+    telegram_bot_token="token",
+    telegram_webhook_secret="secret",
+    google_sheet_id="sheet",
+    google_credentials_path="credentials.json",
+    notification_batch_window=0.01,
+)
+
+_MESSAGE_STRATEGY = st.tuples(
+    st.text(min_size=1, max_size=3000),
+    st.sampled_from((None, "HTML")),
+)
+
+def _make_bot() -> TelegramKnowledgeBot:
+    bot = TelegramKnowledgeBot.__new__(TelegramKnowledgeBot)
+    bot.config = _CONFIG
+    bot._outbox = {}
+    bot._sender_task = None
+    bot._outbox_stopping = None
+    return bot
+
+_BOT = _make_bot()
+
+@given(messages=st.lists(_MESSAGE_STRATEGY, max_size=20))
+def test_merge_messages_preserves_text_order_and_limit(messages):
+    merged = _BOT._merge_messages(messages)
+    separator = TelegramKnowledgeBot.OUTBOX_SEPARATOR
+
+    assert separator.join(text for text, _ in merged) == separator.join(
+        text for text, _ in messages
+    ), "Merging should only join consecutive messages with the separator"
+    assert len(merged) <= len(messages)
+    for text, _ in merged:
+        assert len(text) <= TelegramKnowledgeBot.TELEGRAM_MESSAGE_LIMIT, (
+            f"Merged message exceeds the Telegram limit: {len(text)}"
+        )
+
+def test_merge_messages_keeps_parse_modes_apart():
+    merged = _BOT._merge_messages([("a", None), ("b", "HTML"), ("c", "HTML")])
+
+    assert merged == [("a", None), ("b\n\nc", "HTML")]
+
+def test_flush_outbox_sends_merged_messages_per_chat():
+    bot = _make_bot()
+    telegram_bot = SimpleNamespace(send_message=AsyncMock())
+
+    async def run():
+        for chat_id, text in ((1, "first"), (1, "second"), (2, "other")):
+            bot._outbox.setdefault(chat_id, asyncio.Queue()).put_nowait((text, None))
+        await bot._flush_outbox(telegram_bot)
+        await bot._flush_outbox(telegram_bot)
+
+    asyncio.run(run())
+
+    sent = [call.kwargs for call in telegram_bot.send_message.await_args_list]
+    assert sent == [
+        {"chat_id": 1, "text": "first\n\nsecond", "parse_mode": None},
+        {"chat_id": 2, "text": "other", "parse_mode": None},
+    ]
+    assert bot._outbox == {}, "Drained chats should be removed on the next flush"
+
+def test_drain_outbox_survives_flush_errors():
+    bot = _make_bot()
+    flush = AsyncMock(side_effect=[RuntimeError("boom"), None, None, None, None, None])
+
+    async def run():
+        stopping = asyncio.Event()
+        with patch.object(bot, "_flush_outbox", flush):
+            task = asyncio.create_task(bot._drain_outbox(object(), stopping))
+            while flush.await_count < 3:
+                await asyncio.sleep(_CONFIG.notification_batch_window)
+            stopping.set()
+            await task
+
+    asyncio.run(run())
+
+    assert flush.await_count >= 3, "Drain loop should keep flushing after an error"
+
+def test_stop_outbox_delivers_queued_and_in_flight_messages():
+    bot = _make_bot()
+    send_started = None
+    release_send = None
+    delivered = []
+
+    async def send_message(chat_id, text, parse_mode):
+        if not delivered and not send_started.is_set():
+            send_started.set()
+            await release_send.wait()
+        delivered.append((chat_id, text))
+
+    async def run():
+        nonlocal send_started, release_send
+        send_started = asyncio.Event()
+        release_send = asyncio.Event()
+        application = SimpleNamespace(bot=SimpleNamespace(send_message=send_message))
+
+        await bot._start_outbox(application)
+        await bot._send_message(None, 1, "in flight")
+        await send_started.wait()
+        await bot._send_message(None, 2, "queued")
+
+        stop = asyncio.create_task(bot._stop_outbox(application))
+        await asyncio.sleep(0)
+        release_send.set()
+        await stop
+
+    asyncio.run(run())
+
+    assert delivered == [(1, "in flight"), (2, "queued")]
+    assert bot._sender_task is None
+
+def test_started_and_result_notices_for_a_chat_are_sent_together():
+    bot = _make_bot()
+    send_message = AsyncMock()
+
+    async def run():
+        application = SimpleNamespace(bot=SimpleNamespace(send_message=send_message))
+        await bot._start_outbox(application)
+        await bot._send_message(None, 1, "⏳ Processing <document>...")
+        await bot._send_message(None, 1, "<b>Done</b>", parse_mode="HTML")
+        await bot._stop_outbox(application)
+
+    asyncio.run(run())
+
+    send_message.assert_awaited_once_with(
+        chat_id=1,
+        text="⏳ Processing &lt;document&gt;...\n\n<b>Done</b>",
+        parse_mode="HTML",
+    )
@@ -1,208 +1,159 @@
-import sys
 import os
 import tempfile
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from pathlib import Path
 
+import pytest
 from hypothesis import given, strategies as st, settings, assume
 
 from src.parsers.txt_parser import TXTParser
 from src.parsers.md_parser import MDParser
 from src.parsers.factory import ParserFactory
 from src.models import ExtractionMethod
+from tests.property.strategies import non_blank_text
 
-text_content_strategy = st.text(
-    alphabet=st.characters(
-        blacklist_categories=('Cs',),
-        blacklist_characters='\x00\r',
-    ),
+_FACTORY = ParserFactory()
+
+_RAMDISK_DIR = "/dev/shm"
+
+_TEXT_ALPHABET = st.characters(blacklist_categories=('Cs',), blacklist_characters='\x00\r')
+
+_WORD_CHARACTERS = st.characters(whitelist_categories=('L', 'N'))
+
+_INLINE_ALPHABET = st.characters(whitelist_categories=('L', 'N', 'Zs'))
+
+_PUNCTUATED_WORD_CHARACTERS = st.characters(whitelist_categories=('L', 'N', 'P'))
+
+_PARAGRAPH_ALPHABET = st.characters(whitelist_categories=('L', 'N', 'Zs', 'P'), blacklist_characters='\x00')
+
+text_content_strategy = non_blank_text(10000, _TEXT_ALPHABET)
+
+_INLINE_TEXT_STRATEGY = non_blank_text(50, _INLINE_ALPHABET, head=_WORD_CHARACTERS, leading_whitespace=False)
+
+_PARAGRAPH_TEXT_STRATEGY = non_blank_text(
+    200, _PARAGRAPH_ALPHABET, head=_PUNCTUATED_WORD_CHARACTERS, leading_whitespace=False
+)
+
+_HEADING_STRATEGY = st.builds(
+    lambda level, text: f"{'#' * level} {text}",
+    st.integers(min_value=1, max_value=6),
+    _INLINE_TEXT_STRATEGY,
+)
+
+_PARAGRAPHS_STRATEGY = st.lists(_PARAGRAPH_TEXT_STRATEGY, min_size=1, max_size=5)
+
+_LIST_ITEMS_STRATEGY = st.lists(
+    _INLINE_TEXT_STRATEGY.map(lambda item: f"- {item}"),
     min_size=1,
-    max_size=10000
-).filter(lambda x: x.strip())
+    max_size=5,
+)
 
 @st.composite
 def markdown_content_strategy(draw):
     elements = []
 
     if draw(st.booleans()):
-        level = draw(st.integers(min_value=1, max_value=6))
-        heading_text = draw(st.text(
-            alphabet=st.characters(whitelist_categories=('L', 'N', 'Zs')),
-            min_size=1,
-            max_size=50
-        ).filter(lambda x: x.strip()))
-        elements.append(f"{'#' * level} {heading_text}")
-
-    num_paragraphs = draw(st.integers(min_value=1, max_value=5))
-    for _ in range(num_paragraphs):
-        para = draw(st.text(
-            alphabet=st.characters(
-                whitelist_categories=('L', 'N', 'Zs', 'P'),
-                blacklist_characters='\x00'
-            ),
-            min_size=1,
-            max_size=200
-        ).filter(lambda x: x.strip()))
-        elements.append(para)
+        elements.append(draw(_HEADING_STRATEGY))
+
+    elements.extend(draw(_PARAGRAPHS_STRATEGY))
 
     if draw(st.booleans()):
-        num_items = draw(st.integers(min_value=1, max_value=5))
-        for i in range(num_items):
-            item = draw(st.text(
-                alphabet=st.characters(whitelist_categories=('L', 'N', 'Zs')),
-                min_size=1,
-                max_size=50
-            ).filter(lambda x: x.strip()))
-            elements.append(f"- {item}")
+        elements.extend(draw(_LIST_ITEMS_STRATEGY))
 
     return "\n\n".join(elements)
 
-@settings(max_examples=100)
-@given(content=text_content_strategy)
-def test_txt_round_trip(content: str):
-    parser = TXTParser()
-
-    with tempfile.NamedTemporaryFile(
-        mode='w', 
-        suffix='.txt', 
-        encoding='utf-8',
-        delete=False
-    ) as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        result = parser.parse(temp_path)
-
-        assert result.success, f"Parsing should succeed: {result.error_message}"
-        assert result.text == content, (
-            f"Round-trip should preserve content.\n"
-            f"Original length: {len(content)}\n"
-            f"Parsed length: {len(result.text)}"
-        )
-        assert result.char_count == len(content), (
-            f"Character count should match: expected {len(content)}, got {result.char_count}"
-        )
-        assert result.extraction_method == ExtractionMethod.PLAIN_READ
-    finally:
-        os.unlink(temp_path)
-
-@settings(max_examples=100)
-@given(content=markdown_content_strategy())
-def test_md_round_trip(content: str):
-    parser = MDParser()
-
-    with tempfile.NamedTemporaryFile(
-        mode='w', 
-        suffix='.md', 
-        encoding='utf-8',
-        delete=False
-    ) as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        result = parser.parse(temp_path)
-
-        assert result.success, f"Parsing should succeed: {result.error_message}"
-        assert result.text == content, (
-            f"Round-trip should preserve markdown structure.\n"
-            f"Original: {content[:100]}...\n"
-            f"Parsed: {result.text[:100]}..."
-        )
-        assert result.char_count == len(content), (
-            f"Character count should match: expected {len(content)}, got {result.char_count}"
-        )
-
-        if content.startswith('#'):
-            assert result.text.startswith('#'), "Heading structure should be preserved"
-        if '- ' in content:
-            assert '- ' in result.text, "List structure should be preserved"
-    finally:
-        os.unlink(temp_path)
-
-@settings(max_examples=100)
-@given(content=text_content_strategy)
-def test_parse_result_completeness_txt(content: str):
-    parser = TXTParser()
-
-    with tempfile.NamedTemporaryFile(
-        mode='w', 
-        suffix='.txt', 
-        encoding='utf-8',
-        delete=False
-    ) as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        result = parser.parse(temp_path)
-
-        assert result.success, f"Parsing should succeed: {result.error_message}"
-        assert result.text is not None, "Text should not be None"
-        assert len(result.text) > 0, "Text should not be empty"
-        assert result.char_count == len(result.text), (
-            f"char_count should equal len(text): {result.char_count} != {len(result.text)}"
-        )
-        assert result.extraction_method is not None, "extraction_method should be set"
-    finally:
-        os.unlink(temp_path)
-
-@settings(max_examples=100)
-@given(content=markdown_content_strategy())
-def test_parse_result_completeness_md(content: str):
-    parser = MDParser()
-
-    with tempfile.NamedTemporaryFile(
-        mode='w', 
-        suffix='.md', 
-        encoding='utf-8',
-        delete=False
-    ) as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        result = parser.parse(temp_path)
-
-        assert result.success, f"Parsing should succeed: {result.error_message}"
-        assert result.text is not None, "Text should not be None"
-        assert len(result.text) > 0, "Text should not be empty"
-        assert result.char_count == len(result.text), (
-            f"char_count should equal len(text): {result.char_count} != {len(result.text)}"
-        )
-        assert result.extraction_method is not None, "extraction_method should be set"
-    finally:
-        os.unlink(temp_path)
-
-@settings(max_examples=50)
+@pytest.fixture(scope="module")
+def document_dir():
+    base_dir = _RAMDISK_DIR if os.access(_RAMDISK_DIR, os.W_OK) else None
+    with tempfile.TemporaryDirectory(prefix="documents-", dir=base_dir) as path:
+        yield Path(path)
+
+_PARSER_CASES = {
+    "txt": (TXTParser, text_content_strategy),
+    "md": (MDParser, markdown_content_strategy()),
+}
+
+@pytest.fixture(scope="module")
+def round_trip_files(document_dir):
+    files = {}
+    for extension in _PARSER_CASES:
+        path = str(document_dir / f"round_trip.{extension}")
+        files[extension] = (os.open(path, os.O_RDWR | os.O_CREAT, 0o600), path)
+    yield files
+    for fd, _ in files.values():
+        os.close(fd)
+
+@pytest.mark.parametrize("extension", list(_PARSER_CASES))
+@settings(max_examples=30)
+@given(data=st.data())
+def test_round_trip(round_trip_files, extension: str, data):
+    parser_cls, content_strategy = _PARSER_CASES[extension]
+    content = data.draw(content_strategy)
+    fd, path = round_trip_files[extension]
+    os.ftruncate(fd, 0)
+    os.pwrite(fd, content.encode("utf-8"), 0)
+
+    result = parser_cls().parse(path)
+
+    assert result.success, f"Parsing should succeed: {result.error_message}"
+    assert result.text == content, (
+        f"Round-trip should preserve content.\n"
+        f"Original: {content[:100]}...\n"
+        f"Parsed: {result.text[:100]}..."
+    )
+    assert result.char_count == len(content), (
+        f"Character count should match: expected {len(content)}, got {result.char_count}"
+    )
+    assert result.extraction_method == ExtractionMethod.PLAIN_READ
+
+@pytest.mark.parametrize("extension", list(_PARSER_CASES))
+@given(data=st.data())
+def test_parse_result_completeness(extension: str, data):
+    parser_cls, content_strategy = _PARSER_CASES[extension]
+    result = parser_cls.parse_text(data.draw(content_strategy))
+
+    assert result.success, f"Parsing should succeed: {result.error_message}"
+    assert result.text is not None, "Text should not be None"
+    assert len(result.text) > 0, "Text should not be empty"
+    assert result.char_count == len(result.text), (
+        f"char_count should equal len(text): {result.char_count} != {len(result.text)}"
+    )
+    assert result.extraction_method is not None, "extraction_method should be set"
+
 @given(
     content=text_content_strategy,
     extension=st.sampled_from(['txt', 'md'])
 )
 def test_parse_result_completeness_via_factory(content: str, extension: str):
-    factory = ParserFactory()
-
-    with tempfile.NamedTemporaryFile(
-        mode='w', 
-        suffix=f'.{extension}', 
-        encoding='utf-8',
-        delete=False
-    ) as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        parser = factory.get_parser(temp_path)
-        assert parser is not None, f"Factory should return parser for .{extension}"
-
-        result = parser.parse(temp_path)
-
-        assert result.success, f"Parsing should succeed: {result.error_message}"
-        assert result.text is not None, "Text should not be None"
-        assert len(result.text) > 0, "Text should not be empty"
-        assert result.char_count == len(result.text), (
-            f"char_count should equal len(text): {result.char_count} != {len(result.text)}"
-        )
-        assert result.extraction_method is not None, "extraction_method should be set"
-    finally:
-        os.unlink(temp_path)
+    parser = _FACTORY.get_parser(f"document.{extension}")
+    assert parser is not None, f"Factory should return parser for .{extension}"
+
+    result = parser.parse_text(content)
+
+    assert result.success, f"Parsing should succeed: {result.error_message}"
+    assert result.text is not None, "Text should not be None"
+    assert len(result.text) > 0, "Text should not be empty"
+    assert result.char_count == len(result.text), (
+        f"char_count should equal len(text): {result.char_count} != {len(result.text)}"
+    )
+    assert result.extraction_method is not None, "extraction_method should be set"
+
+@settings(max_examples=5)
+@given(
+    content=text_content_strategy,
+    extension=st.sampled_from(['txt', 'md'])
+)
+def test_factory_parser_reads_documents_from_disk(round_trip_files, content: str, extension: str):
+    fd, path = round_trip_files[extension]
+    os.ftruncate(fd, 0)
+    os.pwrite(fd, content.encode("utf-8"), 0)
+
+    parser = _FACTORY.get_parser(path)
+    assert parser is not None, f"Factory should return parser for {path}"
+
+    result = parser.parse(path)
+
+    assert result.success, f"Parsing should succeed: {result.error_message}"
+    assert result.text == content, "Parsing from disk should preserve content"
+    assert result.char_count == len(result.text), (
+        f"char_count should equal len(text): {result.char_count} != {len(result.text)}"
+    )
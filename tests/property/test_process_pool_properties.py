@@ -0,0 +1,25 @@
+import os
+
+from src.utils.process_pool import get_process_pool, map_in_process_pool
+
+def _crash_worker() -> None:
+    os._exit(1)
+
+def _crash_once(marker: str, value: int) -> int:
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return -value
+
+def test_map_in_process_pool_recovers_after_worker_dies():
+    broken = get_process_pool()
+    broken.submit(_crash_worker).exception()
+
+    assert map_in_process_pool(abs, [-1, -2, 3]) == [1, 2, 3]
+    assert get_process_pool() is not broken, "A broken pool should be replaced"
+
+def test_map_in_process_pool_retries_when_worker_dies_mid_map(tmp_path):
+    marker = str(tmp_path / "crashed")
+
+    assert map_in_process_pool(_crash_once, [marker] * 3, [1, 2, 3]) == [-1, -2, -3]
+    assert os.path.exists(marker)
@@ -0,0 +1,125 @@
+import asyncio
+import errno
+import io
+import tempfile
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.models.config import WorkflowConfig
+from src.models.enums import ErrorScenario, FileType, ProcessingStatus
+from src.models.metadata import Metadata
+from src.models.storage import RowInfo
+from src.processor import DocumentProcessor
+from src.utils.logger import ProcessingLogger
+
+_DOCUMENT_TEXT = (
+    "The knowledge bot extracts text from uploaded documents. "
+    "It detects the language of every document before summarizing it. "
+    "Summaries are produced by a language model and trimmed to a fixed length. "
+    "Keywords are extracted locally with a statistical extractor. "
+    "Results are stored in a spreadsheet for later search.\n"
+) * 4
+
+_SUMMARY = (
+    "The bot processes uploaded documents. "
+    "It summarizes them with a language model. "
+    "Keywords and summaries are stored in a spreadsheet."
+)
+
+_ROW_INFO = RowInfo(row_number=2, timestamp=datetime(2024, 1, 1), success=True)
+
+@pytest.fixture
+def processor(tmp_path):
+    config = WorkflowConfig(
+        telegram_bot_token="token",
+        telegram_webhook_secret="secret",
+        google_sheet_id="sheet",
+        google_credentials_path=str(tmp_path / "credentials.json"),
+        temp_dir=str(tmp_path / "tmp"),
+        max_file_size_mb=1,
+    )
+    processor = DocumentProcessor(config, logger=ProcessingLogger(stream=io.BytesIO()))
+    yield processor
+    processor.close()
+
+def _metadata(document) -> Metadata:
+    return Metadata(
+        file_name=document.name,
+        file_size=document.stat().st_size,
+        file_type=FileType.TXT,
+        uploader_id=1,
+    )
+
+def test_async_pipeline_matches_sync_pipeline_for_txt(processor, tmp_path):
+    document = tmp_path / "document.txt"
+    document.write_text(_DOCUMENT_TEXT, encoding="utf-8")
+    summarizer = processor.summarizer
+    storage = processor.sheets_storage
+
+    with patch.object(summarizer, "_call_api_with_tokens", return_value=(_SUMMARY, 42)), \
+            patch.object(summarizer, "_call_api_with_tokens_async", AsyncMock(return_value=(_SUMMARY, 42))), \
+            patch.object(storage, "save_result", return_value=_ROW_INFO) as save_result, \
+            patch.object(storage, "save_result_async", AsyncMock(return_value=_ROW_INFO)) as save_result_async:
+        sync_result = processor.process_document(str(document), _metadata(document))
+        async_result = asyncio.run(
+            processor.process_document_async(str(document), _metadata(document))
+        )
+
+    assert sync_result.status == ProcessingStatus.COMPLETED, sync_result.error_message
+    assert async_result.status == sync_result.status
+    assert async_result.metadata.language == sync_result.metadata.language == "en"
+    assert async_result.parse_result == sync_result.parse_result
+    assert async_result.summary_result == sync_result.summary_result
+    assert async_result.keywords_result == sync_result.keywords_result
+    save_result.assert_called_once_with(sync_result)
+    save_result_async.assert_awaited_once_with(async_result)
+
+_MAX_DOWNLOAD_SIZE = 1024 * 1024
+
+def _response(raw, content_length=None):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.headers = {} if content_length is None else {"Content-Length": str(content_length)}
+    response.raw = raw
+    return response
+
+@pytest.fixture
+def disk_temp_dir(tmp_path, monkeypatch):
+    disk_dir = tmp_path / "disk"
+    disk_dir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(disk_dir))
+    return disk_dir
+
+def test_download_without_content_length_is_stored_on_disk(processor, disk_temp_dir):
+    body = b"plain text document"
+
+    with patch.object(processor._http, "get", return_value=_response(io.BytesIO(body))):
+        file_path, file_name, error = processor.download_from_url("https://example.com/report.txt")
+
+    assert error is None
+    assert file_name == "report.txt"
+    assert file_path.startswith(str(disk_temp_dir)), f"Unknown sizes should go to disk: {file_path}"
+    with open(file_path, "rb") as downloaded:
+        assert downloaded.read() == body
+
+@pytest.mark.parametrize("content_length", [None, _MAX_DOWNLOAD_SIZE + 1])
+def test_oversized_download_is_rejected_and_removed(processor, disk_temp_dir, content_length):
+    raw = io.BytesIO(b"x" * (_MAX_DOWNLOAD_SIZE + 1))
+
+    with patch.object(processor._http, "get", return_value=_response(raw, content_length)):
+        result = processor.download_from_url("https://example.com/report.txt")
+
+    assert result == (None, None, ErrorScenario.FILE_TOO_LARGE)
+    assert not any(disk_temp_dir.iterdir()), "Partial downloads should be removed"
+
+def test_download_write_failure_is_reported_and_removed(processor, disk_temp_dir):
+    raw = MagicMock()
+    raw.read.side_effect = OSError(errno.ENOSPC, "No space left on device")
+
+    with patch.object(processor._http, "get", return_value=_response(raw)):
+        result = processor.download_from_url("https://example.com/report.txt")
+
+    assert result == (None, None, ErrorScenario.URL_INVALID)
+    assert not any(disk_temp_dir.iterdir()), "Partial downloads should be removed"
@@ -1,51 +1,34 @@
-from hypothesis import given, strategies as st, settings
+import asyncio
+import time
+from unittest.mock import patch
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from hypothesis import given, strategies as st
 
 from src.models.storage import GoogleSheetsRow
+from src.storage.google_sheets import GoogleSheetsStorage, SheetsBatch
+from tests.property.strategies import non_blank_text
 
-@st.composite
-def google_sheets_row_strategy(draw):
-    timestamp = draw(st.datetimes().map(lambda dt: dt.isoformat()))
-    uploader_id = draw(st.text(min_size=1, max_size=20).filter(lambda x: x.strip()))
-    uploader_username = draw(st.text(min_size=0, max_size=50))
-    file_name = draw(st.text(min_size=1, max_size=255).filter(lambda x: x.strip()))
-    file_type = draw(st.sampled_from(["pdf", "docx", "txt", "md"]))
-    file_size = draw(st.integers(min_value=0, max_value=20 * 1024 * 1024))
-    char_count = draw(st.integers(min_value=0, max_value=1000000))
-    language = draw(st.sampled_from(["ru", "en", ""]))
-    summary = draw(st.text(min_size=1, max_size=2000).filter(lambda x: x.strip()))
-    keywords = draw(st.text(min_size=1, max_size=500).filter(lambda x: x.strip()))
-    status = draw(st.sampled_from(["completed", "failed"]))
-    error_message = draw(st.text(min_size=0, max_size=500))
-    ai_model_used = draw(st.sampled_from(["openai_gpt4", "openai_gpt35", "yandex_gpt", "claude_3", ""]))
-    extraction_method = draw(st.sampled_from(["pdfplumber", "python_docx", "plain_read", "tesseract_ocr", ""]))
-    ocr_used = draw(st.booleans())
-    processing_time = draw(st.floats(min_value=0.0, max_value=300.0, allow_nan=False, allow_infinity=False))
-
-    return GoogleSheetsRow(
-        timestamp=timestamp,
-        uploader_id=uploader_id,
-        uploader_username=uploader_username,
-        file_name=file_name,
-        file_type=file_type,
-        file_size=file_size,
-        char_count=char_count,
-        language=language,
-        summary=summary,
-        keywords=keywords,
-        status=status,
-        error_message=error_message,
-        ai_model_used=ai_model_used,
-        extraction_method=extraction_method,
-        ocr_used=ocr_used,
-        processing_time=processing_time,
-    )
+_GOOGLE_SHEETS_ROW_STRATEGY = st.builds(
+    GoogleSheetsRow,
+    timestamp=st.datetimes().map(lambda dt: dt.isoformat()),
+    uploader_id=non_blank_text(20),
+    uploader_username=st.text(min_size=0, max_size=50),
+    file_name=non_blank_text(255),
+    file_type=st.sampled_from(["pdf", "docx", "txt", "md"]),
+    file_size=st.integers(min_value=0, max_value=20 * 1024 * 1024),
+    char_count=st.integers(min_value=0, max_value=1000000),
+    language=st.sampled_from(["ru", "en", ""]),
+    summary=non_blank_text(2000),
+    keywords=non_blank_text(500),
+    status=st.sampled_from(["completed", "failed"]),
+    error_message=st.text(min_size=0, max_size=500),
+    ai_model_used=st.sampled_from(["openai_gpt4", "openai_gpt35", "yandex_gpt", "claude_3", ""]),
+    extraction_method=st.sampled_from(["pdfplumber", "python_docx", "plain_read", "tesseract_ocr", ""]),
+    ocr_used=st.booleans(),
+    processing_time=st.floats(min_value=0.0, max_value=300.0, allow_nan=False, allow_infinity=False),
+)
 
-@settings(max_examples=100)
-@given(row=google_sheets_row_strategy())
+@given(row=_GOOGLE_SHEETS_ROW_STRATEGY)
 def test_google_sheets_row_completeness(row: GoogleSheetsRow):
     assert row.has_required_fields(), (
         f"Row missing required fields: "
@@ -57,28 +40,12 @@ def test_google_sheets_row_completeness(row: GoogleSheetsRow):
         f"keywords={bool(row.keywords)}"
     )
 
-@settings(max_examples=100)
-@given(row=google_sheets_row_strategy())
-def test_google_sheets_row_to_list_contains_all_fields(row: GoogleSheetsRow):
+@given(row=_GOOGLE_SHEETS_ROW_STRATEGY)
+def test_google_sheets_row_to_list_preserves_all_values(row: GoogleSheetsRow):
     row_list = row.to_list()
 
     assert len(row_list) == 16, f"Expected 16 columns, got {len(row_list)}"
 
-    assert row_list[0] == row.timestamp, "timestamp mismatch"
-
-    assert row_list[1] == row.uploader_id, "uploader_id mismatch"
-
-    assert row_list[3] == row.file_name, "file_name mismatch"
-
-    assert row_list[8] == row.summary, "summary mismatch"
-
-    assert row_list[9] == row.keywords, "keywords mismatch"
-
-@settings(max_examples=100)
-@given(row=google_sheets_row_strategy())
-def test_google_sheets_row_to_list_preserves_all_values(row: GoogleSheetsRow):
-    row_list = row.to_list()
-
     assert row_list[0] == row.timestamp
     assert row_list[1] == row.uploader_id
     assert row_list[2] == row.uploader_username
@@ -95,3 +62,106 @@ def test_google_sheets_row_to_list_preserves_all_values(row: GoogleSheetsRow):
     assert row_list[13] == row.extraction_method
     assert row_list[14] == str(row.ocr_used)
     assert row_list[15] == row.processing_time
+
+class _FakeWorksheet:
+
+    def __init__(self, first_row: int) -> None:
+        self.first_row = first_row
+        self.appended: list[list[list]] = []
+
+    def append_rows(self, values, **kwargs):
+        start = self.first_row + sum(len(batch) for batch in self.appended)
+        self.appended.append(values)
+        return {"updates": {"updatedRange": f"Documents!A{start}:P{start + len(values) - 1}"}}
+
+def _storage_with_worksheet(worksheet: _FakeWorksheet) -> GoogleSheetsStorage:
+    storage = GoogleSheetsStorage(credentials_path="credentials.json", spreadsheet_id="sheet")
+    storage._client = object()
+    storage._authenticated = True
+    storage._worksheet = worksheet
+    return storage
+
+@given(
+    rows=st.lists(_GOOGLE_SHEETS_ROW_STRATEGY, min_size=1, max_size=5),
+    first_row=st.integers(min_value=2, max_value=100000),
+)
+def test_batch_appends_rows_once_and_returns_their_row_numbers(rows, first_row: int):
+    worksheet = _FakeWorksheet(first_row)
+    storage = _storage_with_worksheet(worksheet)
+
+    with storage.batch() as batch:
+        for row in rows:
+            batch.add_row(row)
+        assert worksheet.appended == [], "Batched rows should not be written before flush"
+
+    assert worksheet.appended == [[row.to_list() for row in rows]], (
+        "Batch should be written with a single append"
+    )
+    assert [info.row_number for info in batch.row_infos] == list(
+        range(first_row, first_row + len(rows))
+    )
+    assert all(info.success for info in batch.row_infos)
+
+@given(
+    batched=_GOOGLE_SHEETS_ROW_STRATEGY,
+    direct=_GOOGLE_SHEETS_ROW_STRATEGY,
+)
+def test_save_row_during_another_batch_is_written_immediately(batched, direct):
+    worksheet = _FakeWorksheet(2)
+    storage = _storage_with_worksheet(worksheet)
+
+    with storage.batch() as batch:
+        batch.add_row(batched)
+        row_info = storage.save_row(direct)
+
+        assert row_info.row_number == 2, "Direct save should get its real row number"
+        assert worksheet.appended == [[direct.to_list()]]
+
+    assert batch.row_infos[0].row_number == 3
+    assert worksheet.appended == [[direct.to_list()], [batched.to_list()]]
+
+@given(rows=st.lists(_GOOGLE_SHEETS_ROW_STRATEGY, min_size=2, max_size=4))
+def test_concurrent_async_writes_authenticate_once(rows):
+    worksheet = _FakeWorksheet(2)
+    storage = GoogleSheetsStorage(credentials_path="credentials.json", spreadsheet_id="sheet")
+    calls = 0
+
+    def authenticate():
+        nonlocal calls
+        calls += 1
+        time.sleep(0.01)
+        storage._worksheet = worksheet
+        storage._client = object()
+        storage._authenticated = True
+        return True
+
+    async def write_all():
+        batches = []
+        for row in rows:
+            batch = SheetsBatch(storage)
+            batch.add_row(row)
+            batches.append(batch)
+        await asyncio.gather(*(batch.flush_async() for batch in batches))
+
+    with patch.object(storage, "_authenticate", side_effect=authenticate):
+        asyncio.run(write_all())
+
+    assert calls == 1, f"Concurrent writers should authenticate once, got {calls}"
+    assert len(worksheet.appended) == len(rows)
+
+@given(
+    rows=st.lists(_GOOGLE_SHEETS_ROW_STRATEGY, min_size=2, max_size=5),
+    first_rows=st.lists(st.integers(min_value=2, max_value=100000), min_size=2, max_size=5),
+)
+def test_row_count_never_moves_backwards(rows, first_rows):
+    storage = _storage_with_worksheet(_FakeWorksheet(2))
+    written_up_to = []
+
+    for row, first_row in zip(rows, first_rows):
+        storage._worksheet = _FakeWorksheet(first_row)
+        storage._write_rows([row])
+        written_up_to.append(first_row)
+
+    assert storage.get_row_count() == max(written_up_to), (
+        "Appends finishing out of order should not lower the cached row count"
+    )
@@ -1,9 +1,12 @@
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import asyncio
+import functools
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
 
-from hypothesis import given, strategies as st, settings, assume
-from unittest.mock import Mock, patch
+from hypothesis import Phase, given, strategies as st, settings
+from unittest.mock import patch
 
 from src.ai.openai_summarizer import OpenAISummarizer
 from src.ai.language_detector import LanguageDetector
@@ -11,79 +14,80 @@ from src.utils.retry_handler import RetryHandler
 from src.models.config import RetryConfig
 from src.models.enums import ErrorScenario
 
+_NO_SHRINK_PHASES = (Phase.explicit, Phase.reuse, Phase.generate)
+
+_SUMMARIZER = OpenAISummarizer(api_key="test-key")
+_CONCURRENT_SUMMARIZER = OpenAISummarizer(api_key="test-key", max_concurrent_requests=3)
+_DETECTOR = LanguageDetector()
+
+_ERROR_SCENARIOS = tuple(ErrorScenario)
+_RETRYABLE_SCENARIOS = frozenset({
+    ErrorScenario.API_RATE_LIMIT,
+    ErrorScenario.API_TIMEOUT,
+    ErrorScenario.API_ERROR,
+    ErrorScenario.SHEETS_AUTH_ERROR,
+    ErrorScenario.SHEETS_WRITE_ERROR,
+})
+
+@functools.lru_cache(maxsize=2048)
+def _detect_cached(text: str) -> str:
+    return _DETECTOR.detect(text)
+
+_RUSSIAN_WORDS = (
+    'документ', 'система', 'данные', 'информация', 'процесс',
+    'результат', 'анализ', 'метод', 'функция', 'объект',
+    'пользователь', 'файл', 'текст', 'программа', 'модуль',
+    'описывает', 'содержит', 'включает', 'определяет', 'использует',
+    'основные', 'важные', 'ключевые', 'главные', 'новые',
+    'работает', 'выполняет', 'обрабатывает', 'создаёт', 'проверяет',
+)
+
+_ENGLISH_WORDS = (
+    'document', 'system', 'data', 'information', 'process',
+    'result', 'analysis', 'method', 'function', 'object',
+    'user', 'file', 'text', 'program', 'module',
+    'describes', 'contains', 'includes', 'defines', 'uses',
+    'main', 'important', 'key', 'primary', 'new',
+    'works', 'executes', 'processes', 'creates', 'validates',
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will',
+)
+
+_SUMMARY_BASE_WORDS = ('This', 'is', 'a', 'test', 'sentence', 'about', 'the', 'document')
+_SUMMARY_EXTRA_WORDS = ('important', 'key', 'main', 'primary', 'significant')
+
+def _sentence_strategy(words):
+    return st.lists(st.sampled_from(words), min_size=5, max_size=15).map(
+        lambda sentence_words: ' '.join(sentence_words).capitalize() + '.'
+    )
+
+_RUSSIAN_SENTENCE_STRATEGY = _sentence_strategy(_RUSSIAN_WORDS)
+_ENGLISH_SENTENCE_STRATEGY = _sentence_strategy(_ENGLISH_WORDS)
+_SUMMARY_SENTENCE_STRATEGY = st.lists(st.sampled_from(_SUMMARY_EXTRA_WORDS), max_size=5).map(
+    lambda extra_words: ' '.join(_SUMMARY_BASE_WORDS + tuple(extra_words)) + '.'
+)
+
 @st.composite
 def russian_text_strategy(draw):
-    russian_words = [
-        'документ', 'система', 'данные', 'информация', 'процесс',
-        'результат', 'анализ', 'метод', 'функция', 'объект',
-        'пользователь', 'файл', 'текст', 'программа', 'модуль',
-        'описывает', 'содержит', 'включает', 'определяет', 'использует',
-        'основные', 'важные', 'ключевые', 'главные', 'новые',
-        'работает', 'выполняет', 'обрабатывает', 'создаёт', 'проверяет',
-    ]
-
-    num_sentences = draw(st.integers(min_value=5, max_value=15))
-    sentences = []
-
-    for _ in range(num_sentences):
-        num_words = draw(st.integers(min_value=5, max_value=15))
-        words = [draw(st.sampled_from(russian_words)) for _ in range(num_words)]
-        sentence = ' '.join(words).capitalize() + '.'
-        sentences.append(sentence)
-
-    return ' '.join(sentences)
+    return ' '.join(draw(st.lists(_RUSSIAN_SENTENCE_STRATEGY, min_size=5, max_size=15)))
 
 @st.composite
 def english_text_strategy(draw):
-    english_words = [
-        'document', 'system', 'data', 'information', 'process',
-        'result', 'analysis', 'method', 'function', 'object',
-        'user', 'file', 'text', 'program', 'module',
-        'describes', 'contains', 'includes', 'defines', 'uses',
-        'main', 'important', 'key', 'primary', 'new',
-        'works', 'executes', 'processes', 'creates', 'validates',
-        'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be',
-        'have', 'has', 'had', 'do', 'does', 'did', 'will',
-    ]
-
-    num_sentences = draw(st.integers(min_value=5, max_value=15))
-    sentences = []
-
-    for _ in range(num_sentences):
-        num_words = draw(st.integers(min_value=5, max_value=15))
-        words = [draw(st.sampled_from(english_words)) for _ in range(num_words)]
-        sentence = ' '.join(words).capitalize() + '.'
-        sentences.append(sentence)
-
-    return ' '.join(sentences)
+    return ' '.join(draw(st.lists(_ENGLISH_SENTENCE_STRATEGY, min_size=5, max_size=15)))
 
 @st.composite
 def summary_with_sentences_strategy(draw, min_sentences=3, max_sentences=7):
-    num_sentences = draw(st.integers(min_value=min_sentences, max_value=max_sentences))
-    sentences = []
-
-    for _ in range(num_sentences):
-        words = ['This', 'is', 'a', 'test', 'sentence', 'about', 'the', 'document']
-        num_extra = draw(st.integers(min_value=0, max_value=5))
-        extra_words = ['important', 'key', 'main', 'primary', 'significant']
-        for _ in range(num_extra):
-            words.append(draw(st.sampled_from(extra_words)))
-        sentence = ' '.join(words) + '.'
-        sentences.append(sentence)
-
-    return ' '.join(sentences)
-
-def create_mock_openai_response(summary_text: str, tokens: int = 100):
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message.content = summary_text
-    mock_response.usage = Mock()
-    mock_response.usage.total_tokens = tokens
-    return mock_response
-
-@settings(max_examples=100)
+    return ' '.join(draw(st.lists(
+        _SUMMARY_SENTENCE_STRATEGY, min_size=min_sentences, max_size=max_sentences
+    )))
+
+_RUSSIAN_TEXT_STRATEGY = russian_text_strategy()
+
+_ENGLISH_TEXT_STRATEGY = english_text_strategy()
+
+@settings(phases=_NO_SHRINK_PHASES)
 @given(
-    input_text=english_text_strategy(),
+    input_text=_ENGLISH_TEXT_STRATEGY,
     summary_sentences=st.integers(min_value=3, max_value=7)
 )
 def test_summary_sentence_count_bounds(input_text: str, summary_sentences: int):
@@ -92,7 +96,7 @@ def test_summary_sentence_count_bounds(input_text: str, summary_sentences: int):
         summary_parts.append(f"This is sentence number {i + 1} of the summary.")
     mock_summary = ' '.join(summary_parts)
 
-    summarizer = OpenAISummarizer(api_key="test-key")
+    summarizer = _SUMMARIZER
 
     with patch.object(summarizer, '_call_api_with_tokens', return_value=(mock_summary, 100)):
         result = summarizer.summarize(input_text, "en")
@@ -102,9 +106,9 @@ def test_summary_sentence_count_bounds(input_text: str, summary_sentences: int):
             f"Sentence count should be between 3 and 7, got {result.sentence_count}"
         )
 
-@settings(max_examples=50)
+@settings(max_examples=50, phases=_NO_SHRINK_PHASES)
 @given(
-    input_text=russian_text_strategy(),
+    input_text=_RUSSIAN_TEXT_STRATEGY,
     summary_sentences=st.integers(min_value=3, max_value=7)
 )
 def test_summary_sentence_count_bounds_russian(input_text: str, summary_sentences: int):
@@ -113,7 +117,7 @@ def test_summary_sentence_count_bounds_russian(input_text: str, summary_sentence
         summary_parts.append(f"Это предложение номер {i + 1} в резюме.")
     mock_summary = ' '.join(summary_parts)
 
-    summarizer = OpenAISummarizer(api_key="test-key")
+    summarizer = _SUMMARIZER
 
     with patch.object(summarizer, '_call_api_with_tokens', return_value=(mock_summary, 100)):
         result = summarizer.summarize(input_text, "ru")
@@ -123,53 +127,90 @@ def test_summary_sentence_count_bounds_russian(input_text: str, summary_sentence
             f"Sentence count should be between 3 and 7, got {result.sentence_count}"
         )
 
-@settings(max_examples=100)
-@given(input_text=russian_text_strategy())
-def test_summary_language_preservation_russian(input_text: str):
-    detector = LanguageDetector()
-    detected_lang = detector.detect(input_text)
+@settings(max_examples=30)
+@given(
+    input_texts=st.lists(_ENGLISH_TEXT_STRATEGY, min_size=0, max_size=6),
+)
+def test_summarize_many_preserves_order_and_count(input_texts: list[str]):
+    tagged_texts = [f"Marker {index}. {text}" for index, text in enumerate(input_texts)]
+    summarizer = _CONCURRENT_SUMMARIZER
+
+    def fake_call(prompt: str):
+        index = re.search(r'Marker (\d+)\.', prompt).group(1)
+        return f"Summary {index} first. Summary {index} second. Summary {index} third.", 10
+
+    with patch.object(summarizer, '_call_api_with_tokens', side_effect=fake_call):
+        results = summarizer.summarize_many(tagged_texts, "en")
 
-    assume(detected_lang == "ru")
+    assert len(results) == len(input_texts), (
+        f"Should return {len(input_texts)} results, got {len(results)}"
+    )
+    for index, result in enumerate(results):
+        assert result.success, f"Summarization should succeed: {result.error_message}"
+        assert result.summary.startswith(f"Summary {index} "), (
+            f"Result {index} is out of order: {result.summary!r}"
+        )
 
+@settings(max_examples=30)
+@given(input_texts=st.lists(_ENGLISH_TEXT_STRATEGY, min_size=0, max_size=6))
+def test_summarize_many_async_preserves_order_and_count(input_texts: list[str]):
+    tagged_texts = [f"Marker {index}. {text}" for index, text in enumerate(input_texts)]
+    summarizer = _CONCURRENT_SUMMARIZER
+
+    async def fake_call(prompt: str):
+        index = re.search(r'Marker (\d+)\.', prompt).group(1)
+        await asyncio.sleep(0)
+        return f"Summary {index} first. Summary {index} second. Summary {index} third.", 10
+
+    with patch.object(summarizer, '_call_api_with_tokens_async', side_effect=fake_call):
+        results = asyncio.run(summarizer.summarize_many_async(tagged_texts, "en"))
+
+    assert len(results) == len(input_texts), (
+        f"Should return {len(input_texts)} results, got {len(results)}"
+    )
+    for index, result in enumerate(results):
+        assert result.success, f"Summarization should succeed: {result.error_message}"
+        assert result.summary.startswith(f"Summary {index} "), (
+            f"Result {index} is out of order: {result.summary!r}"
+        )
+
+@settings(phases=_NO_SHRINK_PHASES)
+@given(input_text=_RUSSIAN_TEXT_STRATEGY)
+def test_summary_language_preservation_russian(input_text: str):
     mock_summary = "Документ описывает основные принципы работы системы. Рассматриваются ключевые компоненты. Приводятся примеры использования."
 
-    summarizer = OpenAISummarizer(api_key="test-key")
+    summarizer = _SUMMARIZER
 
     with patch.object(summarizer, '_call_api_with_tokens', return_value=(mock_summary, 100)):
-        result = summarizer.summarize(input_text, detected_lang)
+        result = summarizer.summarize(input_text, "ru")
 
         assert result.success, f"Summarization should succeed: {result.error_message}"
         assert result.language == "ru", f"Summary language should be 'ru', got '{result.language}'"
 
-        summary_lang = detector.detect(result.summary)
+        summary_lang = _detect_cached(result.summary)
         assert summary_lang == "ru", (
             f"Summary should be in Russian, detected as '{summary_lang}'"
         )
 
-@settings(max_examples=100)
-@given(input_text=english_text_strategy())
+@settings(phases=_NO_SHRINK_PHASES)
+@given(input_text=_ENGLISH_TEXT_STRATEGY)
 def test_summary_language_preservation_english(input_text: str):
-    detector = LanguageDetector()
-    detected_lang = detector.detect(input_text)
-
-    assume(detected_lang == "en")
-
     mock_summary = "The document describes the main principles of the system. Key components are discussed. Usage examples are provided."
 
-    summarizer = OpenAISummarizer(api_key="test-key")
+    summarizer = _SUMMARIZER
 
     with patch.object(summarizer, '_call_api_with_tokens', return_value=(mock_summary, 100)):
-        result = summarizer.summarize(input_text, detected_lang)
+        result = summarizer.summarize(input_text, "en")
 
         assert result.success, f"Summarization should succeed: {result.error_message}"
         assert result.language == "en", f"Summary language should be 'en', got '{result.language}'"
 
-        summary_lang = detector.detect(result.summary)
+        summary_lang = _detect_cached(result.summary)
         assert summary_lang == "en", (
             f"Summary should be in English, detected as '{summary_lang}'"
         )
 
-@settings(max_examples=50)
+@settings(max_examples=50, derandomize=True, phases=_NO_SHRINK_PHASES)
 @given(
     num_failures=st.integers(min_value=1, max_value=3),
     max_retries=st.integers(min_value=1, max_value=5)
@@ -192,42 +233,44 @@ def test_retry_logic_for_api_failures(num_failures: int, max_retries: int):
             raise Exception("API Error")
         return "success"
 
-    if num_failures <= max_retries:
-        result = handler.execute_with_retry(failing_then_succeeding)
-        assert result == "success"
-        assert call_count == num_failures + 1, (
-            f"Should have called {num_failures + 1} times, called {call_count}"
-        )
-    else:
-        try:
-            handler.execute_with_retry(failing_then_succeeding)
-            assert False, "Should have raised exception"
-        except Exception as e:
-            assert "API Error" in str(e)
-            assert call_count == max_retries + 1, (
-                f"Should have called {max_retries + 1} times, called {call_count}"
+    with patch("src.utils.retry_handler.time.sleep") as sleep:
+        if num_failures <= max_retries:
+            result = handler.execute_with_retry(failing_then_succeeding)
+            assert result == "success"
+            assert call_count == num_failures + 1, (
+                f"Should have called {num_failures + 1} times, called {call_count}"
             )
+        else:
+            try:
+                handler.execute_with_retry(failing_then_succeeding)
+                assert False, "Should have raised exception"
+            except Exception as e:
+                assert "API Error" in str(e)
+                assert call_count == max_retries + 1, (
+                    f"Should have called {max_retries + 1} times, called {call_count}"
+                )
+
+    assert sleep.call_count == call_count - 1, (
+        f"Should have slept {call_count - 1} times, slept {sleep.call_count}"
+    )
 
-@settings(max_examples=50)
-@given(error_scenario=st.sampled_from(list(ErrorScenario)))
+@settings(max_examples=50, derandomize=True)
+@given(error_scenario=st.sampled_from(_ERROR_SCENARIOS))
 def test_retry_logic_retryable_scenarios(error_scenario: ErrorScenario):
-    retryable_scenarios = {
-        ErrorScenario.API_RATE_LIMIT,
-        ErrorScenario.API_TIMEOUT,
-        ErrorScenario.API_ERROR,
-        ErrorScenario.SHEETS_AUTH_ERROR,
-        ErrorScenario.SHEETS_WRITE_ERROR,
-    }
-
     is_retryable = RetryHandler.is_retryable(error_scenario)
-    expected = error_scenario in retryable_scenarios
+    expected = error_scenario in _RETRYABLE_SCENARIOS
 
     assert is_retryable == expected, (
         f"Error scenario {error_scenario} should be "
         f"{'retryable' if expected else 'not retryable'}"
     )
 
-@settings(max_examples=30)
+@settings(
+    max_examples=500,
+    derandomize=True,
+    deadline=None,
+    phases=(Phase.explicit, Phase.generate, Phase.shrink),
+)
 @given(
     base_delay=st.floats(min_value=0.1, max_value=2.0),
     max_delay=st.floats(min_value=5.0, max_value=60.0),
@@ -251,3 +294,47 @@ def test_retry_exponential_backoff(base_delay: float, max_delay: float, attempt:
     assert delay <= max_delay, (
         f"Delay {delay} should not exceed max_delay {max_delay}"
     )
+
+def _http_error(status_code=None, retry_after=None):
+    headers = {} if retry_after is None else {"Retry-After": retry_after}
+    error = Exception("HTTP error")
+    error.response = SimpleNamespace(status_code=status_code, headers=headers)
+    return error
+
+@given(seconds=st.floats(min_value=0.0, max_value=1e6, allow_nan=False))
+def test_retry_after_parses_delay_seconds(seconds: float):
+    assert RetryHandler._retry_after(_http_error(429, repr(seconds))) == seconds
+
+def test_retry_after_parses_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    delay = RetryHandler._retry_after(_http_error(429, format_datetime(retry_at, usegmt=True)))
+
+    assert 28.0 <= delay <= 30.0, f"Expected about 30 seconds, got {delay}"
+
+def test_retry_after_ignores_missing_and_invalid_values():
+    assert RetryHandler._retry_after(Exception("no response")) is None
+    assert RetryHandler._retry_after(_http_error(429)) is None
+    assert RetryHandler._retry_after(_http_error(429, "soon")) is None
+    assert RetryHandler._retry_after(_http_error(429, "-5")) == 0.0
+
+@given(retry_after=st.sampled_from(("120", "86400", "inf", "1e308")))
+def test_retry_after_is_clamped_to_max_delay(retry_after: str):
+    handler = RetryHandler(RetryConfig(base_delay=0.1, max_delay=10.0, jitter=False))
+
+    delay = handler._next_delay(0, 0.0, _http_error(429, retry_after))
+
+    assert delay == handler.config.max_delay, (
+        f"Retry-After {retry_after} should be clamped to max_delay, got {delay}"
+    )
+
+@given(status_code=st.integers(min_value=100, max_value=599))
+def test_should_retry_only_retryable_client_errors(status_code: int):
+    expected = not 400 <= status_code < 500 or status_code in (408, 429)
+
+    assert RetryHandler._should_retry(_http_error(status_code)) == expected, (
+        f"Status {status_code} should {'' if expected else 'not '}be retried"
+    )
+
+def test_should_retry_errors_without_status():
+    assert RetryHandler._should_retry(Exception("connection reset"))
@@ -0,0 +1,62 @@
+from collections import namedtuple
+from unittest.mock import patch
+
+from hypothesis import given, strategies as st
+
+from src.utils.temp_files import (
+    SHARED_MEMORY_TEMP_DIR,
+    resolve_temp_dir,
+    temp_dir_for_size,
+)
+
+_DiskUsage = namedtuple("_DiskUsage", "total used free")
+
+_SIZE = st.integers(min_value=0, max_value=10 * 1024 ** 3)
+
+@given(size=_SIZE, free_bytes=_SIZE)
+def test_temp_dir_for_size_falls_back_when_too_small(size: int, free_bytes: int):
+    usage = _DiskUsage(free_bytes, 0, free_bytes)
+    with patch("src.utils.temp_files.shutil.disk_usage", return_value=usage):
+        chosen = temp_dir_for_size(SHARED_MEMORY_TEMP_DIR, size)
+
+    expected = SHARED_MEMORY_TEMP_DIR if size < free_bytes else None
+    assert chosen == expected, (
+        f"size={size}, free={free_bytes}: expected {expected!r}, got {chosen!r}"
+    )
+
+def test_temp_dir_for_size_falls_back_when_dir_is_unreadable():
+    with patch("src.utils.temp_files.shutil.disk_usage", side_effect=OSError):
+        assert temp_dir_for_size(SHARED_MEMORY_TEMP_DIR, 1) is None
+
+def test_temp_dir_for_size_uses_disk_for_unknown_inputs():
+    assert temp_dir_for_size(None, 1) is None
+    assert temp_dir_for_size(SHARED_MEMORY_TEMP_DIR, None) is None
+
+def test_resolve_temp_dir_prefers_configured_dir(tmp_path):
+    configured = str(tmp_path / "configured")
+
+    assert resolve_temp_dir(configured) == configured
+
+def test_resolve_temp_dir_uses_shared_memory_when_writable():
+    with patch("src.utils.temp_files.sys.platform", "linux"), \
+            patch("src.utils.temp_files.os.path.isdir", return_value=True), \
+            patch("src.utils.temp_files.os.access", return_value=True), \
+            patch("src.utils.temp_files.os.makedirs") as makedirs:
+        assert resolve_temp_dir() == SHARED_MEMORY_TEMP_DIR
+
+    makedirs.assert_called_once_with(SHARED_MEMORY_TEMP_DIR, exist_ok=True)
+
+def test_resolve_temp_dir_falls_back_when_shared_memory_is_not_writable():
+    with patch("src.utils.temp_files.sys.platform", "linux"), \
+            patch("src.utils.temp_files.os.path.isdir", return_value=True), \
+            patch("src.utils.temp_files.os.access", return_value=False):
+        assert resolve_temp_dir() is None
+
+def test_resolve_temp_dir_falls_back_when_shared_memory_is_missing():
+    with patch("src.utils.temp_files.sys.platform", "linux"), \
+            patch("src.utils.temp_files.os.path.isdir", return_value=False):
+        assert resolve_temp_dir() is None
+
+def test_resolve_temp_dir_falls_back_off_linux():
+    with patch("src.utils.temp_files.sys.platform", "darwin"):
+        assert resolve_temp_dir() is None